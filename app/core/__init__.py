@@ -1,4 +1,28 @@
 from .config import settings
-from .database import get_db, engine, Base
+from .database import get_db, get_async_db, engine, async_engine, Base, pool_status
+from .pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor, next_cursor, after_cursor
+from .dates import localize, parse_display_date
+from .metrics import MetricsMiddleware
+from .query_stats import QueryBudgetExceeded, QueryStatsMiddleware, current_query_stats, track_queries
 
-__all__ = ["settings", "get_db", "engine", "Base"]
+__all__ = [
+    "settings",
+    "get_db",
+    "get_async_db",
+    "engine",
+    "async_engine",
+    "Base",
+    "pool_status",
+    "NEXT_CURSOR_HEADER",
+    "encode_cursor",
+    "decode_cursor",
+    "next_cursor",
+    "after_cursor",
+    "localize",
+    "parse_display_date",
+    "MetricsMiddleware",
+    "QueryBudgetExceeded",
+    "QueryStatsMiddleware",
+    "current_query_stats",
+    "track_queries",
+]
@@ -1,22 +1,135 @@
+import threading
+import time
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from .config import settings
+from .query_stats import instrument_engine
+
+
+def _database_url(url: str) -> str:
+    # Plain postgresql:// URLs select psycopg2; this project ships psycopg 3, which serves sync and async
+    if url.startswith("postgresql://"):
+        return "postgresql+psycopg://" + url[len("postgresql://"):]
+    return url
+
+
+class PoolStats:
+    """Checkout counters for one connection pool, used to spot pool starvation."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.waiting = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool):
+        with self._lock:
+            self.waiting -= 1
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.wait_seconds_total += seconds
+                self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def start_wait(self):
+        with self._lock:
+            self.waiting += 1
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            return {
+                "size": pool.size(),
+                "in_use": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "waiting": self.waiting,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+class _TimedCheckoutMixin:
+    stats: PoolStats
+
+    def _do_get(self):
+        self.stats.start_wait()
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            self.stats.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record_wait(time.perf_counter() - start, timed_out=False)
+        return connection
+
+
+# Stats live on the class so they survive pool.recreate() on engine.dispose()
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    stats = PoolStats()
 
-# Create database engine
+
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    stats = PoolStats()
+
+
+def _engine_options() -> dict:
+    options = {
+        "echo": settings.SQL_ECHO,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        options["connect_args"] = {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+    return options
+
+
+# Create database engine (scripts, migrations and startup tasks)
 engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True
+    _database_url(settings.DATABASE_URL),
+    poolclass=InstrumentedQueuePool,
+    future=True,
+    **_engine_options()
+)
+
+# Create async database engine (request handlers)
+async_engine = create_async_engine(
+    _database_url(settings.DATABASE_URL),
+    poolclass=InstrumentedAsyncQueuePool,
+    **_engine_options()
 )
 
-# Create session factory
+# Count statements and time per request (see query_stats)
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 # Create base class for models
 Base = declarative_base()
 
 
+def pool_status() -> dict:
+    """Current size, usage and checkout wait statistics for both connection pools."""
+    return {
+        "async": InstrumentedAsyncQueuePool.stats.snapshot(async_engine.pool),
+        "sync": InstrumentedQueuePool.stats.snapshot(engine.pool),
+    }
+
+
 # Dependency to get database session
 def get_db():
     db = SessionLocal()
@@ -24,3 +137,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Dependency to get an async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
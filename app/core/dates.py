@@ -0,0 +1,85 @@
+"""
+Parsing of the display date strings stored in ``conversations.date``.
+
+The app sends dates like ``"Jan 16 • 2:30 PM"``: local time in
+``DISPLAY_TIMEZONE``, usually without a year. Those are turned into real
+timestamps so conversations and people can be ordered and range-filtered by
+when meetings happened.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from .config import settings
+
+_DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%b %d %Y", "%B %d %Y", "%Y-%m-%d", "%m/%d/%Y")
+_YEARLESS_FORMATS = ("%b %d", "%B %d")
+_TIME_FORMATS = ("%I:%M %p", "%I:%M%p", "%I %p", "%I%p", "%H:%M")
+_RELATIVE_DAYS = {"today": 0, "yesterday": 1}
+
+# A year-less date further than this past the reference is taken to be from the year before
+_FUTURE_SLACK = timedelta(days=1)
+
+
+def _parse_day(text: str, reference: datetime) -> Optional[date]:
+    lowered = text.lower()
+    if lowered in _RELATIVE_DAYS:
+        return reference.date() - timedelta(days=_RELATIVE_DAYS[lowered])
+
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            pass
+
+    # Pick the latest year that does not put the date in the future (Feb 29 may skip a few)
+    for fmt in _YEARLESS_FORMATS:
+        for year in range(reference.year, reference.year - 8, -1):
+            try:
+                day = datetime.strptime(f"{text} {year}", f"{fmt} %Y").date()
+            except ValueError:
+                continue
+            if day <= (reference + _FUTURE_SLACK).date():
+                return day
+    return None
+
+
+def _parse_time(text: str) -> Optional[time]:
+    for fmt in _TIME_FORMATS:
+        try:
+            return datetime.strptime(text.upper(), fmt).time()
+        except ValueError:
+            pass
+    return None
+
+
+def localize(value: datetime) -> datetime:
+    """Treat a naive datetime as local time in DISPLAY_TIMEZONE."""
+    return value if value.tzinfo else value.replace(tzinfo=ZoneInfo(settings.DISPLAY_TIMEZONE))
+
+
+def parse_display_date(text: Optional[str], reference: Optional[datetime] = None) -> Optional[datetime]:
+    """Parse a display date such as ``"Jan 16 • 2:30 PM"`` into an aware datetime.
+
+    ISO 8601 strings are accepted as well. Dates without a year are placed in
+    the most recent year that is not after ``reference`` (the time the string
+    was written; default now). Returns None if the string cannot be parsed.
+    """
+    if not text or not text.strip():
+        return None
+    zone = ZoneInfo(settings.DISPLAY_TIMEZONE)
+    reference = (reference or datetime.now(timezone.utc)).astimezone(zone)
+    text = text.strip()
+
+    try:
+        return localize(datetime.fromisoformat(text))
+    except ValueError:
+        pass
+
+    date_part, _, time_part = (part.strip() for part in text.partition("•"))
+    day = _parse_day(date_part, reference)
+    clock = _parse_time(time_part) if time_part else time()
+    if day is None or clock is None:
+        return None
+    return datetime.combine(day, clock, zone)
@@ -0,0 +1,151 @@
+"""
+Prometheus metrics for HTTP routes, the connection pools and face matching.
+
+``MetricsMiddleware`` records per-route latency, request and response sizes,
+SQL statements per request and in-flight requests; routes are labelled by
+endpoint name so label cardinality stays bounded. Pool gauges are read from
+``pool_status()`` when ``/metrics`` is scraped rather than on every request.
+
+Each worker process keeps its own counters, so with several uvicorn workers
+scrape each one (or run a single worker per container).
+"""
+
+import time
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from .database import pool_status
+from .query_stats import current_query_stats
+
+_SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+_QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50)
+_SCAN_BUCKETS = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+_MATCH_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests handled", ["method", "handler", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Time from request start to the last response byte", ["method", "handler"]
+)
+HTTP_REQUEST_SIZE = Histogram(
+    "http_request_size_bytes", "Request body size", ["handler"], buckets=_SIZE_BUCKETS
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "Response body size", ["handler"], buckets=_SIZE_BUCKETS
+)
+HTTP_REQUEST_QUERIES = Histogram(
+    "http_request_db_queries", "SQL statements issued per request", ["handler"], buckets=_QUERY_BUCKETS
+)
+HTTP_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "Requests being handled", ["method"]
+)
+
+FACE_MATCH_DURATION = Histogram(
+    "face_match_duration_seconds", "Time to score face queries against the index", ["endpoint"],
+    buckets=_MATCH_BUCKETS
+)
+FACE_MATCH_SCANNED = Histogram(
+    "face_match_candidates_scanned", "Stored faces scored per query", buckets=_SCAN_BUCKETS
+)
+FACE_MATCH_RESULTS = Counter(
+    "face_match_results_total", "Face queries by requested threshold and outcome", ["threshold", "result"]
+)
+FACE_STREAM_FACES = Counter(
+    "face_stream_faces_total", "Faces received on match-face streams, by how they were scored", ["scoring"]
+)
+FACE_STREAMS_OPEN = Gauge(
+    "face_streams_open", "Open match-face streams"
+)
+
+
+def threshold_label(threshold: float) -> str:
+    """Round a match threshold to 0.05 (clamped to 0-1) so arbitrary client values share labels."""
+    return f"{round(min(max(threshold, 0.0), 1.0) * 20) / 20:.2f}"
+
+
+def record_face_match(threshold: float, matched: bool):
+    FACE_MATCH_RESULTS.labels(threshold_label(threshold), "hit" if matched else "miss").inc()
+
+
+class PoolCollector:
+    """Connection pool gauges and counters, read at scrape time."""
+
+    _GAUGES = {
+        "size": "Connections the pool keeps open",
+        "in_use": "Connections checked out",
+        "idle": "Connections checked in",
+        "overflow": "Connections open beyond the pool size",
+        "waiting": "Requests waiting for a connection",
+    }
+    _COUNTERS = {
+        "checkouts": "Successful connection checkouts",
+        "timeouts": "Checkouts that timed out",
+        "wait_seconds": "Time spent waiting for a connection",
+    }
+
+    def collect(self):
+        pools = pool_status()
+        for key, doc in self._GAUGES.items():
+            family = GaugeMetricFamily(f"db_pool_{key}", doc, labels=["pool"])
+            for name, stats in pools.items():
+                family.add_metric([name], stats[key])
+            yield family
+        for key, doc in self._COUNTERS.items():
+            family = CounterMetricFamily(f"db_pool_{key}", doc, labels=["pool"])
+            for name, stats in pools.items():
+                family.add_metric([name], stats["wait_seconds_total" if key == "wait_seconds" else key])
+            yield family
+
+
+REGISTRY.register(PoolCollector())
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording the HTTP metrics above for every request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        start = time.perf_counter()
+        status_code = 500
+        request_bytes = 0
+        response_bytes = 0
+
+        async def receive_counted():
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                request_bytes += len(message.get("body", b""))
+            return message
+
+        async def send_counted(message):
+            nonlocal status_code, response_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = HTTP_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive_counted, send_counted)
+        finally:
+            in_progress.dec()
+            route = scope.get("route")
+            handler = route.name if route is not None else "unmatched"
+            HTTP_REQUESTS.labels(method, handler, str(status_code)).inc()
+            HTTP_REQUEST_DURATION.labels(method, handler).observe(time.perf_counter() - start)
+            HTTP_REQUEST_SIZE.labels(handler).observe(request_bytes)
+            HTTP_RESPONSE_SIZE.labels(handler).observe(response_bytes)
+            stats = current_query_stats()
+            if stats is not None:
+                HTTP_REQUEST_QUERIES.labels(handler).observe(stats.count)
@@ -0,0 +1,60 @@
+"""
+Opaque keyset pagination cursors.
+
+A cursor encodes the sort key of the last row on a page, so the next page can
+start with an indexed range condition instead of an OFFSET scan.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, tuple_
+
+# Response header carrying the cursor for the following page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode a row's sort key as an opaque URL-safe cursor."""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> List[Any]:
+    """Decode a cursor produced by encode_cursor, converting each value to the given type.
+
+    Raises a 400 error if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError("wrong number of cursor values")
+        return [
+            datetime.fromisoformat(value) if kind is datetime else kind(value)
+            for kind, value in zip(types, payload)
+        ]
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def next_cursor(rows: list, limit: int, *key_fields: str) -> Optional[str]:
+    """Return the cursor after the last row, or None if this was the last page."""
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(*(getattr(last, field) for field in key_fields))
+
+
+def after_cursor(columns: Sequence, values: Sequence, descending: bool = False) -> ColumnElement[bool]:
+    """Row-value condition selecting the rows that sort after a cursor's key."""
+    if descending:
+        return tuple_(*columns) < tuple_(*values)
+    return tuple_(*columns) > tuple_(*values)
@@ -0,0 +1,162 @@
+"""
+Per-request SQL statement counting.
+
+Engine event listeners add every statement's count and duration to the
+``QueryStats`` of the request (or ``track_queries`` block) it runs in, which is
+carried in a context variable so it follows the request through async sessions
+and threadpool handlers. The middleware reports the totals in a
+``Server-Timing`` header in debug mode, logs statements slower than
+SLOW_QUERY_MS with their route, and enforces QUERY_BUDGET: over budget a
+request is logged, or fails outright when QUERY_BUDGET_STRICT is set, so an
+N+1 regression breaks tests instead of reaching production.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_STATEMENT_LOG_CHARS = 500
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised in strict mode when a request issues more statements than its budget."""
+
+
+class QueryStats:
+    """SQL statements issued within one request or ``track_queries`` block."""
+
+    def __init__(
+        self,
+        route: Optional[str] = None,
+        budget: Optional[int] = None,
+        strict: bool = False,
+        scope: Optional[dict] = None
+    ):
+        self._route = route
+        self._scope = scope
+        self.budget = budget
+        self.strict = strict
+        self.count = 0
+        self.seconds = 0.0
+
+    @property
+    def route(self) -> Optional[str]:
+        """The name given, plus the matched endpoint once routing has run."""
+        route = self._scope and self._scope.get("route")
+        if route is not None:
+            return f"{self._route} [{route.name}]"
+        return self._route
+
+    @property
+    def over_budget(self) -> bool:
+        return bool(self.budget) and self.count > self.budget
+
+    def server_timing(self, total_seconds: float) -> str:
+        return (
+            f'db;dur={self.seconds * 1000:.1f};desc="{self.count} queries", '
+            f"total;dur={total_seconds * 1000:.1f}"
+        )
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Stats of the request being handled, or None outside one."""
+    return _current.get()
+
+
+@contextmanager
+def track_queries(
+    route: Optional[str] = None,
+    budget: Optional[int] = None,
+    strict: bool = False,
+    scope: Optional[dict] = None
+):
+    """Count the statements run inside the block; yields the ``QueryStats``.
+
+    With ``strict`` the statement that goes over ``budget`` raises
+    ``QueryBudgetExceeded``, e.g. ``with track_queries(budget=2, strict=True):``
+    around a call under test.
+    """
+    stats = QueryStats(route, budget, strict, scope)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is not None and stats.strict and stats.budget and stats.count >= stats.budget:
+        raise QueryBudgetExceeded(
+            f"{stats.route or 'block'} exceeded its budget of {stats.budget} queries: {statement[:_STATEMENT_LOG_CHARS]}"
+        )
+    conn.info["query_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info.pop("query_started", time.perf_counter())
+    stats = _current.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+
+    if settings.SLOW_QUERY_MS and elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query (%.1f ms) in %s: %s",
+            elapsed * 1000,
+            (stats and stats.route) or "no request",
+            statement[:_STATEMENT_LOG_CHARS]
+        )
+
+
+def instrument_engine(engine):
+    """Attach the statement counters to a sync engine (``async_engine.sync_engine`` for async)."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware that tracks each HTTP request's statements.
+
+    The ``Server-Timing`` header reflects the statements run before the
+    response starts, so streamed bodies (exports) are only partly counted.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        with track_queries(
+            f"{scope['method']} {scope['path']}", settings.QUERY_BUDGET or None, settings.QUERY_BUDGET_STRICT, scope
+        ) as stats:
+            async def send_with_stats(message):
+                if message["type"] == "http.response.start" and settings.DEBUG:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", stats.server_timing(time.perf_counter() - start).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                if stats.over_budget:
+                    logger.warning(
+                        "%s issued %d queries (budget %d, %.1f ms in the database)",
+                        stats.route, stats.count, stats.budget, stats.seconds * 1000
+                    )
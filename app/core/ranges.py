@@ -0,0 +1,52 @@
+"""
+Single-range HTTP Range requests.
+
+Supports the standard ``bytes`` unit and any custom unit an endpoint counts in
+(for example transcript ``segments``), in the forms ``unit=first-last``,
+``unit=first-`` and ``unit=-suffix``. Multi-range requests are answered with
+the full representation, which RFC 9110 allows.
+"""
+
+import re
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+
+_RANGE = re.compile(r"^\s*([a-z]+)\s*=\s*(\d*)\s*-\s*(\d*)\s*$")
+
+RangeSpec = Tuple[str, Optional[int], Optional[int]]
+
+
+def requested_range(header: Optional[str], units: Tuple[str, ...]) -> Optional[RangeSpec]:
+    """Parse a Range header into (unit, first, last); None to serve the full representation."""
+    if not header:
+        return None
+    match = _RANGE.match(header)
+    if not match or match.group(1) not in units or not (match.group(2) or match.group(3)):
+        return None
+    first = int(match.group(2)) if match.group(2) else None
+    last = int(match.group(3)) if match.group(3) else None
+    if first is not None and last is not None and last < first:
+        return None
+    return match.group(1), first, last
+
+
+def resolve_range(spec: RangeSpec, total: int) -> Tuple[int, int]:
+    """Resolve a parsed range against the representation length to inclusive (first, last).
+
+    Raises 416 when no part of the range lies within the representation.
+    """
+    unit, first, last = spec
+    if first is None:
+        # Suffix range: the last N units
+        first, last = max(total - last, 0), total - 1
+    else:
+        last = total - 1 if last is None else min(last, total - 1)
+
+    if total == 0 or first >= total or last < first:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"{unit} */{total}"}
+        )
+    return first, last
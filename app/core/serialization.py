@@ -0,0 +1,54 @@
+"""
+Fast JSON responses for list endpoints.
+
+A route that returns plain data has it validated against its
+``response_model`` and serialized by Pydantic; for list endpoints that build
+their rows from database values (already of the declared types) this is pure
+overhead. Such routes keep ``response_model`` for the OpenAPI schema, but map
+each row to a dict with a ``row_mapper`` built once at import time and return a
+``FastJSONResponse``, which FastAPI sends as is.
+
+orjson with ``OPT_UTC_Z`` writes datetimes exactly as Pydantic does
+(``2026-01-16T14:30:00Z``), so the JSON is byte-for-byte the same.
+"""
+
+from operator import attrgetter
+from typing import Any, Callable, Dict, Type
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by orjson, without validation; content must be plain dicts and lists."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+def row_mapper(model: Type[BaseModel], **defaults: Any) -> Callable[[Any], Dict[str, Any]]:
+    """Return a function turning an ORM object or result row into a dict of ``model``'s fields.
+
+    Attributes are read by name, in the model's field order. A None value is
+    replaced by the field's default when it has a non-None one, or by the
+    value given in ``defaults`` (for example ``participants=[]``).
+    """
+    fields = tuple(model.model_fields)
+    fallbacks = {
+        name: field.get_default(call_default_factory=True)
+        for name, field in model.model_fields.items()
+        if not field.is_required()
+    }
+    fallbacks.update(defaults)
+    fallbacks = tuple((name, value) for name, value in fallbacks.items() if value is not None)
+    get = attrgetter(*fields)
+
+    def to_dict(row) -> Dict[str, Any]:
+        item = dict(zip(fields, get(row)))
+        for name, value in fallbacks:
+            if item[name] is None:
+                item[name] = value
+        return item
+
+    return to_dict
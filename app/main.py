@@ -1,12 +1,45 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import FastAPI, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from sqlalchemy import text
 
 from .core.config import settings
-from .core.database import engine, Base
-from .routers import people_router, conversations_router
+from .core.pagination import NEXT_CURSOR_HEADER
+from .core.database import async_engine, pool_status
+from .core.metrics import MetricsMiddleware
+from .core.query_stats import QueryStatsMiddleware
+from .routers import people_router, conversations_router, bulk_router, export_router
+from .services import ensure_face_index, face_index_loaded, save_face_index
+
+logger = logging.getLogger(__name__)
+
+# The schema is managed by `python -m app.migrations`; importing the app never touches the database
+
+
+async def warm_face_index():
+    """Load the face index in the background; match requests retry if this fails."""
+    try:
+        await run_in_threadpool(ensure_face_index)
+    except Exception:
+        logger.warning("Face index not loaded at startup; the first match request will retry", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start loading the face index without delaying startup, and snapshot it on shutdown."""
+    warm_up = asyncio.create_task(warm_face_index())
+    yield
+    warm_up.cancel()
+    with suppress(asyncio.CancelledError):
+        await warm_up
+    await run_in_threadpool(save_face_index)
+    await async_engine.dispose()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 # Create FastAPI app
 app = FastAPI(
@@ -14,7 +47,8 @@ app = FastAPI(
     version=settings.VERSION,
     description="Backend API for Conversa - A conversation and relationship management app",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -24,11 +58,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Server-Timing"],
 )
 
+# Route latency, sizes and in-flight requests for /metrics; added first so it runs inside
+# QueryStatsMiddleware and can read each request's statement count
+app.add_middleware(MetricsMiddleware)
+
+# Count SQL statements per request: Server-Timing header in debug, slow-query log, query budget
+app.add_middleware(QueryStatsMiddleware)
+
 # Include routers
 app.include_router(people_router, prefix=settings.API_V1_PREFIX)
 app.include_router(conversations_router, prefix=settings.API_V1_PREFIX)
+app.include_router(bulk_router, prefix=settings.API_V1_PREFIX)
+app.include_router(export_router, prefix=settings.API_V1_PREFIX)
 
 
 @app.get("/")
@@ -45,3 +89,31 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/health/db-pool")
+async def db_pool_health():
+    """Connection pool usage and checkout wait times, for spotting pool starvation."""
+    return pool_status()
+
+
+@app.get("/ready")
+async def readiness_check(response: Response):
+    """Readiness probe: 503 until the database answers a query.
+
+    The face index is reported but not required; match requests load it on demand.
+    """
+    try:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception as exc:
+        logger.warning("Readiness check failed: %s", exc)
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "unavailable", "database": "unreachable", "face_index_loaded": face_index_loaded()}
+    return {"status": "ready", "database": "ok", "face_index_loaded": face_index_loaded()}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics in the text exposition format."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
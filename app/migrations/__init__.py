@@ -0,0 +1,3 @@
+from .runner import Migration, discover, status, upgrade
+
+__all__ = ["Migration", "discover", "status", "upgrade"]
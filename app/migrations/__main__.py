@@ -0,0 +1,41 @@
+"""
+Apply or inspect schema migrations.
+
+Usage:
+    python -m app.migrations              # apply every pending migration
+    python -m app.migrations upgrade --to 3
+    python -m app.migrations status
+"""
+
+import argparse
+import sys
+
+from .runner import status, upgrade
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", nargs="?", choices=["upgrade", "status"], default="upgrade")
+    parser.add_argument("--to", type=int, help="Stop after this migration version")
+    args = parser.parse_args()
+
+    if args.command == "status":
+        for migration, applied_at in status():
+            state = f"applied {applied_at:%Y-%m-%d %H:%M}" if applied_at else "pending"
+            print(f"{migration.version:04d} {migration.name:<40} {state}")
+        return
+
+    try:
+        applied = upgrade(args.to)
+    except Exception as exc:
+        print(f"✗ Migration failed: {exc}")
+        sys.exit(1)
+
+    for migration in applied:
+        print(f"✓ Applied {migration.version:04d} {migration.name}")
+    if not applied:
+        print("✓ Schema is up to date")
+
+
+if __name__ == "__main__":
+    main()
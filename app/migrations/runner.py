@@ -0,0 +1,108 @@
+"""
+Versioned schema migrations.
+
+Each migration is a plain SQL file, ``versions/NNNN_description.sql``, applied
+in version order inside its own transaction and recorded in
+``schema_migrations``. A Postgres advisory lock serializes concurrent runs, so
+every deploy can run ``python -m app.migrations`` before starting workers.
+Migrations are written to be idempotent, which lets them adopt databases
+created earlier by ``init_database.sql`` or ``create_all``.
+"""
+
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from ..core.database import engine as default_engine
+
+VERSIONS_DIR = Path(__file__).parent / "versions"
+
+# Arbitrary application-wide key for pg_advisory_lock
+_LOCK_KEY = 7_160_411
+
+_FILENAME = re.compile(r"^(\d{4})_(\w+)\.sql$")
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    path: Path
+
+    def sql(self) -> str:
+        return self.path.read_text()
+
+
+def discover() -> List[Migration]:
+    """Return every migration file, in version order."""
+    migrations = []
+    for path in VERSIONS_DIR.iterdir():
+        match = _FILENAME.match(path.name)
+        if match:
+            migrations.append(Migration(int(match.group(1)), match.group(2), path))
+    migrations.sort()
+
+    versions = [migration.version for migration in migrations]
+    if len(set(versions)) != len(versions):
+        raise RuntimeError(f"Duplicate migration versions in {VERSIONS_DIR}")
+    return migrations
+
+
+def _ensure_table(conn: Connection):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        "version INTEGER PRIMARY KEY, "
+        "name VARCHAR(255) NOT NULL, "
+        "applied_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP)"
+    ))
+
+
+def _applied(conn: Connection) -> Dict[int, datetime]:
+    return dict(conn.execute(text("SELECT version, applied_at FROM schema_migrations")).all())
+
+
+def status(engine: Engine = default_engine) -> List[tuple]:
+    """Return (migration, applied_at) for every migration; applied_at is None if pending."""
+    with engine.begin() as conn:
+        _ensure_table(conn)
+        applied = _applied(conn)
+    return [(migration, applied.get(migration.version)) for migration in discover()]
+
+
+def upgrade(target: Optional[int] = None, engine: Engine = default_engine) -> List[Migration]:
+    """Apply pending migrations up to ``target`` (default: all) and return the ones applied."""
+    migrations = [m for m in discover() if target is None or m.version <= target]
+
+    applied_now = []
+    with engine.connect() as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _LOCK_KEY})
+        try:
+            # Schema changes may rewrite large tables; the API's statement timeout does not apply
+            conn.execute(text("SET statement_timeout = 0"))
+            _ensure_table(conn)
+            applied = _applied(conn)
+            conn.commit()
+
+            for migration in migrations:
+                if migration.version in applied:
+                    continue
+                try:
+                    conn.exec_driver_sql(migration.sql())
+                    conn.execute(
+                        text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                        {"version": migration.version, "name": migration.name}
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                applied_now.append(migration)
+        finally:
+            conn.execute(text("RESET statement_timeout"))
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _LOCK_KEY})
+            conn.commit()
+
+    return applied_now
@@ -0,0 +1,116 @@
+-- Initial schema: people, conversations, action_items, timestamp triggers and views.
+-- Guarded so it also applies cleanly to databases created by init_database.sql or create_all.
+
+CREATE OR REPLACE FUNCTION update_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+CREATE TABLE IF NOT EXISTS people (
+    id VARCHAR(20) PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    role VARCHAR(255) NOT NULL,
+    avatar_color VARCHAR(50) NOT NULL DEFAULT 'bg-indigo-200',
+    context TEXT NOT NULL,
+    interests TEXT[] DEFAULT '{}',
+    open_follow_ups TEXT[] DEFAULT '{}',
+    last_met VARCHAR(50),
+    met_count INTEGER DEFAULT 0,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT people_name_check CHECK (length(name) > 0),
+    CONSTRAINT people_role_check CHECK (length(role) > 0),
+    CONSTRAINT people_met_count_check CHECK (met_count >= 0)
+);
+
+-- Face columns the models have always had but the original init_database.sql lacked
+ALTER TABLE people ADD COLUMN IF NOT EXISTS face_embedding TEXT[];
+ALTER TABLE people ADD COLUMN IF NOT EXISTS face_thumbnail BYTEA;
+ALTER TABLE people ADD COLUMN IF NOT EXISTS physical_description TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_people_name ON people(name);
+CREATE INDEX IF NOT EXISTS idx_people_last_met ON people(last_met);
+CREATE INDEX IF NOT EXISTS idx_people_met_count ON people(met_count DESC);
+
+DROP TRIGGER IF EXISTS update_people_updated_at ON people;
+CREATE TRIGGER update_people_updated_at
+    BEFORE UPDATE ON people
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+CREATE TABLE IF NOT EXISTS conversations (
+    id VARCHAR(20) PRIMARY KEY,
+    person_id VARCHAR(20) NOT NULL REFERENCES people(id) ON DELETE CASCADE,
+    participants TEXT[] DEFAULT '{}',
+    title VARCHAR(500) NOT NULL,
+    date VARCHAR(50) NOT NULL,
+    location VARCHAR(255) NOT NULL,
+    summary TEXT NOT NULL,
+    key_points TEXT[] DEFAULT '{}',
+    full_transcript TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT conversations_title_check CHECK (length(title) > 0),
+    CONSTRAINT conversations_location_check CHECK (length(location) > 0)
+);
+
+CREATE INDEX IF NOT EXISTS idx_conversations_person_id ON conversations(person_id);
+CREATE INDEX IF NOT EXISTS idx_conversations_date ON conversations(date);
+CREATE INDEX IF NOT EXISTS idx_conversations_title ON conversations(title);
+CREATE INDEX IF NOT EXISTS idx_conversations_created_at ON conversations(created_at DESC);
+
+DROP TRIGGER IF EXISTS update_conversations_updated_at ON conversations;
+CREATE TRIGGER update_conversations_updated_at
+    BEFORE UPDATE ON conversations
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+CREATE TABLE IF NOT EXISTS action_items (
+    id VARCHAR(20) PRIMARY KEY,
+    conversation_id VARCHAR(20) NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
+    text VARCHAR(500) NOT NULL,
+    completed BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT action_items_text_check CHECK (length(text) > 0)
+);
+
+CREATE INDEX IF NOT EXISTS idx_action_items_conversation_id ON action_items(conversation_id);
+CREATE INDEX IF NOT EXISTS idx_action_items_completed ON action_items(completed);
+
+DROP TRIGGER IF EXISTS update_action_items_updated_at ON action_items;
+CREATE TRIGGER update_action_items_updated_at
+    BEFORE UPDATE ON action_items
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- Current init_database.sql defines this view over the counter columns (see 0006), which
+-- cannot be replaced in place by this aggregating version; 0006 restores it
+DROP VIEW IF EXISTS people_summary;
+CREATE VIEW people_summary AS
+SELECT
+    p.*,
+    COUNT(c.id) as total_conversations,
+    COUNT(CASE WHEN ai.completed = false THEN 1 END) as pending_actions
+FROM people p
+LEFT JOIN conversations c ON p.id = c.person_id
+LEFT JOIN action_items ai ON c.id = ai.conversation_id
+GROUP BY p.id;
+
+CREATE OR REPLACE VIEW recent_conversations AS
+SELECT
+    c.*,
+    p.name as person_name,
+    COUNT(ai.id) as total_action_items,
+    COUNT(CASE WHEN ai.completed = false THEN 1 END) as pending_action_items
+FROM conversations c
+JOIN people p ON c.person_id = p.id
+LEFT JOIN action_items ai ON c.id = ai.conversation_id
+GROUP BY c.id, p.name
+ORDER BY c.created_at DESC;
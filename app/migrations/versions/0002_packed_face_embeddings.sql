@@ -0,0 +1,13 @@
+-- Packed float32 face embeddings; migrate_face_embeddings.py converts legacy rows.
+
+ALTER TABLE people ADD COLUMN IF NOT EXISTS face_embedding_packed BYTEA;
+ALTER TABLE people ADD COLUMN IF NOT EXISTS face_embedding_dim INTEGER;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'people_face_embedding_packed_check') THEN
+        ALTER TABLE people ADD CONSTRAINT people_face_embedding_packed_check CHECK (
+            face_embedding_packed IS NULL OR octet_length(face_embedding_packed) = 4 * face_embedding_dim
+        );
+    END IF;
+END $$;
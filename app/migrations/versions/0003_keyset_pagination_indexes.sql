@@ -0,0 +1,5 @@
+-- Indexes behind cursor pagination of the people and conversation lists.
+
+CREATE INDEX IF NOT EXISTS idx_people_created_at_id ON people(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_conversations_created_at_id ON conversations(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_conversations_person_created_at_id ON conversations(person_id, created_at, id);
@@ -0,0 +1,18 @@
+-- Stored, weighted full-text document for conversation search, replacing the expression index.
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'conversations' AND column_name = 'search_vector'
+    ) THEN
+        DROP INDEX IF EXISTS idx_conversations_search;
+        ALTER TABLE conversations ADD COLUMN search_vector TSVECTOR GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(full_transcript, '')), 'C')
+        ) STORED;
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_conversations_search ON conversations USING gin(search_vector);
@@ -0,0 +1,9 @@
+-- Per-collection change counters behind list ETags.
+
+CREATE TABLE IF NOT EXISTS collection_versions (
+    name VARCHAR(50) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO collection_versions (name, version) VALUES ('people', 0), ('conversations', 0) ON CONFLICT DO NOTHING;
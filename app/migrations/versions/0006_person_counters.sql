@@ -0,0 +1,43 @@
+-- Denormalized per-person counters, replacing the aggregation in people_summary.
+
+ALTER TABLE people ADD COLUMN IF NOT EXISTS conversation_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE people ADD COLUMN IF NOT EXISTS pending_action_count INTEGER NOT NULL DEFAULT 0;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'people_conversation_count_check') THEN
+        ALTER TABLE people ADD CONSTRAINT people_conversation_count_check CHECK (conversation_count >= 0);
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'people_pending_action_count_check') THEN
+        ALTER TABLE people ADD CONSTRAINT people_pending_action_count_check CHECK (pending_action_count >= 0);
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_people_conversation_count_id ON people(conversation_count, id);
+CREATE INDEX IF NOT EXISTS idx_people_pending_action_count_id ON people(pending_action_count, id);
+
+-- Backfill people who have conversations; everyone else is already at 0
+UPDATE people p
+SET conversation_count = counts.conversations, pending_action_count = counts.pending
+FROM (
+    SELECT c.person_id, count(*) AS conversations, coalesce(sum(ai.pending), 0) AS pending
+    FROM conversations c
+    LEFT JOIN (
+        SELECT conversation_id, count(*) AS pending
+        FROM action_items
+        WHERE completed IS NOT TRUE
+        GROUP BY conversation_id
+    ) ai ON ai.conversation_id = c.id
+    GROUP BY c.person_id
+) counts
+WHERE p.id = counts.person_id
+  AND (p.conversation_count, p.pending_action_count) IS DISTINCT FROM (counts.conversations, counts.pending);
+
+-- p.* was expanded when the view was created, so it has to be rebuilt to pick up new columns
+DROP VIEW IF EXISTS people_summary;
+CREATE VIEW people_summary AS
+SELECT
+    p.*,
+    p.conversation_count AS total_conversations,
+    p.pending_action_count AS pending_actions
+FROM people p;
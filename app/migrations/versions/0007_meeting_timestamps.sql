@@ -0,0 +1,8 @@
+-- Real timestamps behind the display date strings; backfill_timestamps.py fills existing rows.
+
+ALTER TABLE conversations ADD COLUMN IF NOT EXISTS occurred_at TIMESTAMP WITH TIME ZONE;
+ALTER TABLE people ADD COLUMN IF NOT EXISTS last_met_at TIMESTAMP WITH TIME ZONE;
+
+CREATE INDEX IF NOT EXISTS idx_conversations_occurred_at_id ON conversations(occurred_at, id);
+CREATE INDEX IF NOT EXISTS idx_conversations_person_occurred_at_id ON conversations(person_id, occurred_at, id);
+CREATE INDEX IF NOT EXISTS idx_people_last_met_at_id ON people(last_met_at, id);
@@ -0,0 +1,12 @@
+-- Speaker turns of transcripts still being recorded, appended one request at a time.
+
+CREATE TABLE IF NOT EXISTS transcript_segments (
+    conversation_id VARCHAR(20) NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    speaker VARCHAR(255),
+    text TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (conversation_id, seq),
+    CONSTRAINT transcript_segments_seq_check CHECK (seq >= 0)
+);
@@ -1,4 +1,5 @@
 from .person import Person
-from .conversation import Conversation, ActionItem
+from .conversation import Conversation, ActionItem, TranscriptSegment
+from .collection_version import CollectionVersion
 
-__all__ = ["Person", "Conversation", "ActionItem"]
+__all__ = ["Person", "Conversation", "ActionItem", "TranscriptSegment", "CollectionVersion"]
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+
+from ..core.database import Base
+
+
+class CollectionVersion(Base):
+    """Counter advanced by every write to a collection, used for list ETags."""
+    __tablename__ = "collection_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
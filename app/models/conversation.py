@@ -1,6 +1,7 @@
-from sqlalchemy import Column, String, DateTime, ARRAY, Text, ForeignKey, Boolean
+from sqlalchemy import Column, String, DateTime, ARRAY, Text, ForeignKey, Boolean, Index, Computed, Integer
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 import uuid
 
 from ..core.database import Base
@@ -8,30 +9,57 @@ from ..core.database import Base
 
 class Conversation(Base):
     __tablename__ = "conversations"
+    __table_args__ = (
+        Index("idx_conversations_created_at_id", "created_at", "id"),
+        Index("idx_conversations_person_created_at_id", "person_id", "created_at", "id"),
+        Index("idx_conversations_occurred_at_id", "occurred_at", "id"),
+        Index("idx_conversations_person_occurred_at_id", "person_id", "occurred_at", "id"),
+        Index("idx_conversations_search", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: f"c{uuid.uuid4().hex[:8]}")
-    person_id = Column(String, ForeignKey("people.id"), nullable=False, index=True)
+    person_id = Column(String, ForeignKey("people.id", ondelete="CASCADE"), nullable=False, index=True)
     participants = Column(ARRAY(String), default=list)
     title = Column(String, nullable=False, index=True)
-    date = Column(String, nullable=False)
+    date = Column(String, nullable=False)  # Display string, e.g. "Jan 16 • 2:30 PM"
+    # When the conversation happened, parsed from date unless given; null if unparseable
+    occurred_at = Column(DateTime(timezone=True), nullable=True)
     location = Column(String, nullable=False)
     summary = Column(Text, nullable=False)
     key_points = Column(ARRAY(String), default=list)
-    full_transcript = Column(Text, nullable=True)
+    # Transcripts can run to hundreds of KB; load them only when a query asks for them
+    full_transcript = deferred(Column(Text, nullable=True))
+
+    # Full-text search document maintained by Postgres; never loaded unless asked for
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(full_transcript, '')), 'C')",
+            persisted=True
+        )
+    ))
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
     # Relationships
     primary_person = relationship("Person", back_populates="conversations")
-    action_items = relationship("ActionItem", back_populates="conversation", cascade="all, delete-orphan")
+    action_items = relationship(
+        "ActionItem",
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
 
 
 class ActionItem(Base):
     __tablename__ = "action_items"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(String, primary_key=True, default=lambda: f"a{uuid.uuid4().hex[:8]}")
-    conversation_id = Column(String, ForeignKey("conversations.id"), nullable=False, index=True)
+    conversation_id = Column(String, ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False, index=True)
     text = Column(String, nullable=False)
     completed = Column(Boolean, default=False)
 
@@ -40,3 +68,21 @@ class ActionItem(Base):
 
     # Relationships
     conversation = relationship("Conversation", back_populates="action_items")
+
+
+class TranscriptSegment(Base):
+    """One speaker turn of a transcript still being recorded.
+
+    Live clients append turns here instead of rewriting full_transcript, so each
+    write costs the same however long the meeting runs. Finalizing joins them
+    into full_transcript and deletes them. Deleting the conversation removes
+    them by cascade in the database, so there is no ORM relationship.
+    """
+    __tablename__ = "transcript_segments"
+
+    conversation_id = Column(String, ForeignKey("conversations.id", ondelete="CASCADE"), primary_key=True)
+    seq = Column(Integer, primary_key=True)  # Client-assigned order; re-sending a seq is a no-op
+    speaker = Column(String, nullable=True)
+    text = Column(Text, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, Integer, DateTime, ARRAY, Text, LargeBinary
+from sqlalchemy import Column, String, Integer, DateTime, ARRAY, Text, LargeBinary, Index
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 import uuid
 
 from ..core.database import Base
@@ -8,6 +8,14 @@ from ..core.database import Base
 
 class Person(Base):
     __tablename__ = "people"
+    __table_args__ = (
+        Index("idx_people_created_at_id", "created_at", "id"),
+        Index("idx_people_conversation_count_id", "conversation_count", "id"),
+        Index("idx_people_pending_action_count_id", "pending_action_count", "id"),
+        Index("idx_people_last_met_at_id", "last_met_at", "id"),
+    )
+    # Fetch server-generated timestamps with RETURNING so async sessions never lazy-load them
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(String, primary_key=True, default=lambda: f"p{uuid.uuid4().hex[:8]}")
     name = Column(String, nullable=False, index=True)
@@ -17,15 +25,26 @@ class Person(Base):
     interests = Column(ARRAY(String), default=list)
     open_follow_ups = Column(ARRAY(String), default=list)
     last_met = Column(String, nullable=True)
+    last_met_at = Column(DateTime(timezone=True), nullable=True)  # Latest conversation occurred_at
     met_count = Column(Integer, default=0)
+    # Kept exact by the conversation and action item write paths; repair_counters.py recomputes them
+    conversation_count = Column(Integer, nullable=False, default=0, server_default="0")
+    pending_action_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Face recognition fields
-    face_embedding = Column(ARRAY(Text), nullable=True)  # Store as array of float strings
-    face_thumbnail = Column(LargeBinary, nullable=True)  # Small JPEG image
+    face_embedding = Column(ARRAY(Text), nullable=True)  # Legacy: array of float strings
+    face_embedding_packed = Column(LargeBinary, nullable=True)  # Little-endian float32 bytes
+    face_embedding_dim = Column(Integer, nullable=True)
+    # Small JPEG image, served on its own by GET /people/{id}/thumbnail
+    face_thumbnail = deferred(Column(LargeBinary, nullable=True))
     physical_description = Column(Text, nullable=True)  # AI-generated description
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
     # Relationships
-    conversations = relationship("Conversation", back_populates="primary_person")
+    conversations = relationship("Conversation", back_populates="primary_person", passive_deletes=True)
+
+    @property
+    def has_face_data(self) -> bool:
+        return self.face_embedding_dim is not None or bool(self.face_embedding)
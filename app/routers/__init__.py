@@ -1,4 +1,6 @@
 from .people import router as people_router
 from .conversations import router as conversations_router
+from .bulk import router as bulk_router
+from .export import router as export_router
 
-__all__ = ["people_router", "conversations_router"]
+__all__ = ["people_router", "conversations_router", "bulk_router", "export_router"]
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.database import get_async_db
+from ..schemas import ImportResult
+from ..services.bulk_import import import_conversations, import_people, iter_ndjson
+
+router = APIRouter(prefix="/import", tags=["import"])
+
+# The body is read as a stream, so describe it for the OpenAPI docs by hand
+NDJSON_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/x-ndjson": {"schema": {"type": "string", "format": "binary"}}}
+    }
+}
+
+
+@router.post("/people", response_model=ImportResult, openapi_extra=NDJSON_BODY)
+async def import_people_ndjson(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Import people from NDJSON: one PersonCreate object (with optional id) per line."""
+    return await import_people(db, iter_ndjson(request.stream()))
+
+
+@router.post("/conversations", response_model=ImportResult, openapi_extra=NDJSON_BODY)
+async def import_conversations_ndjson(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Import conversations from NDJSON: one ConversationCreate object (with optional id) per line."""
+    return await import_conversations(db, iter_ndjson(request.stream()))
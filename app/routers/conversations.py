@@ -1,170 +1,623 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import ARRAY, REAL, Text, cast, delete, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, undefer
 from typing import List, Optional
+from datetime import datetime
 
-from ..core.database import get_db
-from ..models import Conversation, ActionItem, Person
+from ..core.database import get_async_db
+from ..core.dates import localize, parse_display_date
+from ..core.pagination import NEXT_CURSOR_HEADER, after_cursor, decode_cursor, next_cursor
+from ..core.ranges import requested_range, resolve_range
+from ..core.serialization import FastJSONResponse, row_mapper
+from ..models import Conversation, ActionItem, TranscriptSegment
 from ..schemas import (
     ConversationCreate,
     ConversationUpdate,
     ConversationResponse,
     ConversationListResponse,
-    ActionItemUpdate
+    ConversationSearchResult,
+    ActionItemUpdate,
+    TranscriptAppend,
+    TranscriptAppendResult,
+    TranscriptSegmentResponse
+)
+from ..services.counters import adjust_counts, lock_people, pending_items, record_conversation, refresh_last_met_at
+from ..services.etags import (
+    CONVERSATIONS,
+    PEOPLE,
+    collection_version,
+    commit_and_bump,
+    etag_matches,
+    item_etag,
+    list_etag,
+    not_modified
 )
 
 router = APIRouter(prefix="/conversations", tags=["conversations"])
 
+SEARCH_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+# Transcript segments are speaker turns, separated by a blank line
+TRANSCRIPT_SEGMENT_SEPARATOR = "\n\n"
+TRANSCRIPT_RANGE_UNITS = ("bytes", "segments")
+
+
+def include_transcript_query(default: bool):
+    return Query(default, description="Include full_transcript; GET /conversations/{id}/transcript fetches it on its own")
+
+
+async def get_conversation_or_404(
+    db: AsyncSession,
+    conversation_id: str,
+    include_transcript: bool = False,
+    for_update: bool = False
+) -> Conversation:
+    """Load a conversation with its action items (async sessions cannot lazy-load them).
+
+    ``for_update`` locks the conversation row until commit, serializing writes
+    that adjust its person's counters.
+    """
+    options = [selectinload(Conversation.action_items)]
+    if include_transcript:
+        options.append(undefer(Conversation.full_transcript))
+
+    query = select(Conversation).options(*options).where(Conversation.id == conversation_id)
+    if for_update:
+        query = query.with_for_update(of=Conversation)
+    conversation = await db.scalar(query.execution_options(populate_existing=True))
+    if not conversation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Conversation with id {conversation_id} not found"
+        )
+    return conversation
+
+
+def conversation_response(conversation: Conversation, include_transcript: bool) -> ConversationResponse:
+    """Serialize a conversation, leaving full_transcript null unless it was asked for."""
+    fields = {
+        name: getattr(conversation, name)
+        for name in ConversationResponse.model_fields
+        if name != "full_transcript"
+    }
+    if include_transcript:
+        fields["full_transcript"] = conversation.full_transcript
+    return ConversationResponse.model_validate(fields, from_attributes=True)
+
+
+def list_query():
+    """Select the ConversationListResponse columns (never the transcript)."""
+    # Count pending action items in the same statement instead of lazy-loading them per row
+    active_count = (
+        select(func.count(ActionItem.id))
+        .where(ActionItem.conversation_id == Conversation.id, ActionItem.completed.isnot(True))
+        .correlate(Conversation)
+        .scalar_subquery()
+    )
+    return select(
+        Conversation.id,
+        Conversation.person_id,
+        Conversation.participants,
+        Conversation.title,
+        Conversation.date,
+        Conversation.occurred_at,
+        Conversation.location,
+        Conversation.summary,
+        Conversation.created_at,
+        active_count.label("active_action_items_count")
+    )
+
+
+# List rows are sent without re-validation; the columns already have the response types
+list_item = row_mapper(ConversationListResponse, participants=[])
+
 
 @router.get("/", response_model=List[ConversationListResponse])
-def get_conversations(
+async def get_conversations(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
     person_id: Optional[str] = Query(None, description="Filter by person ID"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all conversations with optional filtering by person."""
-    query = db.query(Conversation)
+    # An unchanged collection is answered from its version row alone
+    etag = list_etag(await collection_version(db, CONVERSATIONS), request)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    headers = {"ETag": etag}
 
+    query = list_query()
     if person_id:
-        query = query.filter(Conversation.person_id == person_id)
+        query = query.where(Conversation.person_id == person_id)
+
+    # Keyset pagination on (created_at, id), served by idx_conversations_created_at_id
+    if cursor:
+        created_at, conversation_id = decode_cursor(cursor, datetime, str)
+        query = query.where(
+            after_cursor((Conversation.created_at, Conversation.id), (created_at, conversation_id), descending=True)
+        )
 
     # Order by created_at descending (newest first)
-    conversations = query.order_by(Conversation.created_at.desc()).offset(skip).limit(limit).all()
-
-    # Transform to list response with action item count
-    result = []
-    for conv in conversations:
-        active_count = sum(1 for item in conv.action_items if not item.completed)
-        result.append(
-            ConversationListResponse(
-                id=conv.id,
-                person_id=conv.person_id,
-                participants=conv.participants or [],
-                title=conv.title,
-                date=conv.date,
-                location=conv.location,
-                summary=conv.summary,
-                active_action_items_count=active_count
-            )
+    rows = (await db.execute(
+        query.order_by(Conversation.created_at.desc(), Conversation.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )).all()
+
+    page_cursor = next_cursor(rows, limit, "created_at", "id")
+    if page_cursor:
+        headers[NEXT_CURSOR_HEADER] = page_cursor
+
+    return FastJSONResponse([list_item(row) for row in rows], headers=headers)
+
+
+@router.get("/timeline", response_model=List[ConversationListResponse])
+async def get_timeline(
+    request: Request,
+    start: Optional[datetime] = Query(None, description="Earliest occurred_at, inclusive (ISO 8601; DISPLAY_TIMEZONE if no offset)"),
+    end: Optional[datetime] = Query(None, description="Latest occurred_at, exclusive (ISO 8601; DISPLAY_TIMEZONE if no offset)"),
+    person_id: Optional[str] = Query(None, description="Filter by person ID"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Conversations that happened between two times, most recent first.
+
+    Conversations whose date could not be parsed have no occurred_at and are left out.
+    """
+    etag = list_etag(await collection_version(db, CONVERSATIONS), request)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    headers = {"ETag": etag}
+
+    # A range scan on idx_conversations_occurred_at_id (or the per-person variant)
+    query = list_query().where(Conversation.occurred_at.isnot(None))
+    if start:
+        query = query.where(Conversation.occurred_at >= localize(start))
+    if end:
+        query = query.where(Conversation.occurred_at < localize(end))
+    if person_id:
+        query = query.where(Conversation.person_id == person_id)
+    if cursor:
+        occurred_at, conversation_id = decode_cursor(cursor, datetime, str)
+        query = query.where(
+            after_cursor((Conversation.occurred_at, Conversation.id), (occurred_at, conversation_id), descending=True)
+        )
+
+    rows = (await db.execute(
+        query.order_by(Conversation.occurred_at.desc(), Conversation.id.desc()).limit(limit)
+    )).all()
+
+    page_cursor = next_cursor(rows, limit, "occurred_at", "id")
+    if page_cursor:
+        headers[NEXT_CURSOR_HEADER] = page_cursor
+
+    return FastJSONResponse([list_item(row) for row in rows], headers=headers)
+
+
+@router.get("/search", response_model=List[ConversationSearchResult])
+async def search_conversations(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, description="Search terms (web search syntax: quotes, OR, -exclude)"),
+    person_id: Optional[str] = Query(None, description="Filter by person ID"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Search conversation titles, summaries and transcripts, best matches first."""
+    etag = list_etag(await collection_version(db, CONVERSATIONS), request)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    ts_query = func.websearch_to_tsquery("english", q)
+    rank = func.ts_rank(Conversation.search_vector, ts_query)
+
+    # Rank and page using the GIN index on the stored search_vector
+    matches = select(Conversation.id, rank.label("rank")).where(Conversation.search_vector.op("@@")(ts_query))
+    if person_id:
+        matches = matches.where(Conversation.person_id == person_id)
+    if cursor:
+        last_rank, last_id = decode_cursor(cursor, float, str)
+        matches = matches.where(
+            after_cursor((rank, Conversation.id), (cast(literal(last_rank), REAL), last_id), descending=True)
+        )
+    matches = matches.order_by(rank.desc(), Conversation.id.desc()).limit(limit).subquery()
+
+    # Build snippets only for the rows on this page
+    snippet = func.ts_headline(
+        "english",
+        Conversation.summary + " " + func.coalesce(Conversation.full_transcript, ""),
+        ts_query,
+        SEARCH_HEADLINE_OPTIONS
+    )
+    rows = (await db.execute(
+        select(
+            Conversation.id,
+            Conversation.person_id,
+            Conversation.title,
+            Conversation.date,
+            Conversation.location,
+            Conversation.summary,
+            matches.c.rank,
+            snippet.label("snippet")
         )
+        .join(matches, matches.c.id == Conversation.id)
+        .order_by(matches.c.rank.desc(), Conversation.id.desc())
+    )).all()
+
+    page_cursor = next_cursor(rows, limit, "rank", "id")
+    if page_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page_cursor
 
-    return result
+    return [ConversationSearchResult.model_validate(dict(row._mapping)) for row in rows]
 
 
 @router.get("/{conversation_id}", response_model=ConversationResponse)
-def get_conversation(
+async def get_conversation(
     conversation_id: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    include_transcript: bool = include_transcript_query(True),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific conversation by ID."""
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
-    if not conversation:
+    variant = "" if include_transcript else "brief"
+
+    # Check the client's copy against updated_at before loading the transcript and action items
+    updated_at = await db.scalar(select(Conversation.updated_at).where(Conversation.id == conversation_id))
+    if updated_at is not None and etag_matches(request, item_etag(updated_at, variant)):
+        return not_modified(item_etag(updated_at, variant))
+
+    conversation = await get_conversation_or_404(db, conversation_id, include_transcript)
+    response.headers["ETag"] = item_etag(conversation.updated_at, variant)
+    return conversation_response(conversation, include_transcript)
+
+
+@router.get(
+    "/{conversation_id}/transcript",
+    response_class=Response,
+    responses={200: {"content": {"text/plain": {}}}, 206: {"description": "Partial transcript"}}
+)
+async def get_transcript(
+    conversation_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a conversation's transcript as plain text.
+
+    Honours ``Range: bytes=first-last`` (UTF-8 byte offsets) and
+    ``Range: segments=first-last`` (0-based speaker turns) with 206 responses.
+    """
+    turns = func.string_to_array(Conversation.full_transcript, TRANSCRIPT_SEGMENT_SEPARATOR, type_=ARRAY(Text))
+    spec = requested_range(request.headers.get("range"), TRANSCRIPT_RANGE_UNITS)
+
+    # octet_length reads only the TOAST header; counting segments has to split the text
+    total = func.octet_length(Conversation.full_transcript) if not spec or spec[0] == "bytes" else func.cardinality(turns)
+    row = (await db.execute(
+        select(Conversation.updated_at, Conversation.full_transcript.isnot(None).label("present"), total.label("total"))
+        .where(Conversation.id == conversation_id)
+    )).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Conversation with id {conversation_id} not found"
         )
-    return conversation
+    if not row.present:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Conversation with id {conversation_id} has no transcript"
+        )
+
+    etag = item_etag(row.updated_at, "transcript")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    headers = {"ETag": etag, "Accept-Ranges": ", ".join(TRANSCRIPT_RANGE_UNITS)}
+    media_type = "text/plain; charset=utf-8"
+
+    # A range is only applied if the client's copy (If-Range) is still current
+    if_range = request.headers.get("if-range")
+    if spec is None or (if_range and if_range != etag):
+        transcript = await db.scalar(select(Conversation.full_transcript).where(Conversation.id == conversation_id))
+        return Response(content=transcript, media_type=media_type, headers=headers)
+
+    unit = spec[0]
+    first, last = resolve_range(spec, row.total or 0)
+    if unit == "bytes":
+        part = func.substring(func.convert_to(Conversation.full_transcript, "UTF8"), first + 1, last - first + 1)
+    else:
+        part = func.array_to_string(turns[first + 1:last + 1], TRANSCRIPT_SEGMENT_SEPARATOR)
+    content = await db.scalar(select(part).where(Conversation.id == conversation_id))
+
+    headers["Content-Range"] = f"{unit} {first}-{last}/{row.total}"
+    return Response(
+        content=content,
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers
+    )
+
+
+async def lock_live_transcript(db: AsyncSession, conversation_id: str, exclusive: bool = False):
+    """Lock a conversation whose transcript is still being recorded.
+
+    Appends take a shared key lock so they run concurrently; finalizing takes an
+    exclusive one, so it waits for in-flight appends and later appends see the
+    finalized transcript. 404 if the conversation is missing, 409 if it already
+    has a full transcript.
+    """
+    query = select(Conversation.full_transcript.isnot(None)).where(Conversation.id == conversation_id)
+    finalized = await db.scalar(
+        query.with_for_update(of=Conversation) if exclusive
+        else query.with_for_update(read=True, key_share=True, of=Conversation)
+    )
+    if finalized is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Conversation with id {conversation_id} not found"
+        )
+    if finalized:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Conversation with id {conversation_id} already has a full transcript"
+        )
+
+
+@router.post("/{conversation_id}/transcript/segments", response_model=TranscriptAppendResult)
+async def append_transcript_segments(
+    conversation_id: str,
+    append: TranscriptAppend,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Append speaker turns to a transcript being recorded.
+
+    Each request inserts only the new rows, so its cost does not grow with the
+    transcript. Segments whose seq is already stored are skipped, making retries
+    safe. The conversation itself is untouched until the transcript is finalized.
+    """
+    await lock_live_transcript(db, conversation_id)
+
+    inserted = (await db.scalars(
+        pg_insert(TranscriptSegment)
+        .values([{"conversation_id": conversation_id, **segment.model_dump()} for segment in append.segments])
+        .on_conflict_do_nothing(index_elements=["conversation_id", "seq"])
+        .returning(TranscriptSegment.seq)
+    )).all()
+    last_seq = await db.scalar(
+        select(func.max(TranscriptSegment.seq)).where(TranscriptSegment.conversation_id == conversation_id)
+    )
+    await db.commit()
+
+    return TranscriptAppendResult(appended=len(inserted), last_seq=last_seq)
+
+
+@router.get("/{conversation_id}/transcript/segments", response_model=List[TranscriptSegmentResponse])
+async def get_transcript_segments(
+    conversation_id: str,
+    after_seq: int = Query(-1, ge=-1, description="Return segments with a higher seq; -1 starts from the beginning"),
+    limit: int = Query(500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Read a transcript being recorded, in seq order from an offset.
+
+    Returns an empty list once the transcript is finalized; read it from
+    GET /conversations/{id}/transcript instead.
+    """
+    segments = (await db.scalars(
+        select(TranscriptSegment)
+        .where(TranscriptSegment.conversation_id == conversation_id, TranscriptSegment.seq > after_seq)
+        .order_by(TranscriptSegment.seq)
+        .limit(limit)
+    )).all()
+    if not segments and not await db.scalar(select(Conversation.id).where(Conversation.id == conversation_id)):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Conversation with id {conversation_id} not found"
+        )
+    return segments
+
+
+@router.post("/{conversation_id}/transcript/finalize", response_model=ConversationResponse)
+async def finalize_transcript(
+    conversation_id: str,
+    include_transcript: bool = include_transcript_query(False),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Join the appended segments into full_transcript and delete them.
+
+    Turns are written as "Speaker: text" separated by blank lines, the layout
+    the transcript endpoint's segment ranges expect. The transcript is written
+    once here rather than on every append.
+    """
+    await lock_live_transcript(db, conversation_id, exclusive=True)
+
+    turns = (
+        select(func.string_agg(
+            func.concat_ws(": ", TranscriptSegment.speaker, TranscriptSegment.text),
+            aggregate_order_by(literal(TRANSCRIPT_SEGMENT_SEPARATOR), TranscriptSegment.seq)
+        ))
+        .where(TranscriptSegment.conversation_id == conversation_id)
+        .scalar_subquery()
+    )
+    transcript_written = await db.scalar(
+        update(Conversation)
+        .where(Conversation.id == conversation_id)
+        .values(full_transcript=turns, updated_at=func.now())
+        .returning(Conversation.full_transcript.isnot(None))
+    )
+    if not transcript_written:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Conversation with id {conversation_id} has no transcript segments to finalize"
+        )
+
+    await db.execute(delete(TranscriptSegment).where(TranscriptSegment.conversation_id == conversation_id))
+    await commit_and_bump(db, CONVERSATIONS)
+
+    return conversation_response(
+        await get_conversation_or_404(db, conversation_id, include_transcript),
+        include_transcript
+    )
 
 
 @router.post("/", response_model=ConversationResponse, status_code=status.HTTP_201_CREATED)
-def create_conversation(
+async def create_conversation(
     conversation: ConversationCreate,
-    db: Session = Depends(get_db)
+    include_transcript: bool = include_transcript_query(True),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new conversation."""
-    # Verify person exists
-    person = db.query(Person).filter(Person.id == conversation.person_id).first()
-    if not person:
+    if conversation.occurred_at:
+        occurred_at = localize(conversation.occurred_at)
+    else:
+        occurred_at = parse_display_date(conversation.date)
+
+    # Check the person exists and update its met count, last met date and counters in one statement
+    recorded = await record_conversation(
+        db,
+        conversation.person_id,
+        last_met=conversation.date.split('•')[0].strip(),
+        occurred_at=occurred_at,
+        pending=sum(1 for item in conversation.action_items if not item.completed)
+    )
+    if not recorded:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Person with id {conversation.person_id} not found"
         )
 
-    # Create conversation
     db_conversation = Conversation(
         person_id=conversation.person_id,
         participants=conversation.participants,
         title=conversation.title,
         date=conversation.date,
+        occurred_at=occurred_at,
         location=conversation.location,
         summary=conversation.summary,
         key_points=conversation.key_points,
         full_transcript=conversation.full_transcript
     )
     db.add(db_conversation)
-    db.flush()
-
-    # Create action items
-    for action_item_data in conversation.action_items:
-        db_action_item = ActionItem(
-            conversation_id=db_conversation.id,
-            text=action_item_data.text,
-            completed=action_item_data.completed
-        )
-        db.add(db_action_item)
+    await db.flush()
 
-    # Update person's met count and last met date
-    person.met_count += 1
-    person.last_met = conversation.date.split('•')[0].strip()
+    # All action items in one multi-row INSERT
+    if conversation.action_items:
+        await db.execute(insert(ActionItem).values([
+            {"conversation_id": db_conversation.id, "text": item.text, "completed": item.completed}
+            for item in conversation.action_items
+        ]))
 
-    db.commit()
-    db.refresh(db_conversation)
-    return db_conversation
+    await commit_and_bump(db, CONVERSATIONS, PEOPLE)
+    return conversation_response(
+        await get_conversation_or_404(db, db_conversation.id, include_transcript),
+        include_transcript
+    )
 
 
 @router.put("/{conversation_id}", response_model=ConversationResponse)
-def update_conversation(
+async def update_conversation(
     conversation_id: str,
     conversation_update: ConversationUpdate,
-    db: Session = Depends(get_db)
+    include_transcript: bool = include_transcript_query(True),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a conversation's information."""
-    db_conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
-    if not db_conversation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Conversation with id {conversation_id} not found"
-        )
+    db_conversation = await get_conversation_or_404(db, conversation_id, for_update=True)
 
     update_data = conversation_update.model_dump(exclude_unset=True)
+    collections = [CONVERSATIONS]
+    refresh_people = set()
+
+    # A new display date re-derives occurred_at, relative to when the conversation was recorded
+    if update_data.get("occurred_at"):
+        update_data["occurred_at"] = localize(update_data["occurred_at"])
+    elif "date" in update_data:
+        update_data["occurred_at"] = parse_display_date(update_data["date"], db_conversation.created_at)
+    if "occurred_at" in update_data and update_data["occurred_at"] != db_conversation.occurred_at:
+        refresh_people.add(db_conversation.person_id)
+
+    # Moving a conversation to another person moves its counts with it
+    new_person_id = update_data.get("person_id")
+    if new_person_id and new_person_id != db_conversation.person_id:
+        # Both counters change; lock the two people in id order so opposite moves cannot deadlock
+        if new_person_id not in await lock_people(db, db_conversation.person_id, new_person_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Person with id {new_person_id} not found"
+            )
+        pending = sum(1 for item in db_conversation.action_items if item.completed is not True)
+        await adjust_counts(db, db_conversation.person_id, conversations=-1, pending=-pending)
+        await adjust_counts(db, new_person_id, conversations=1, pending=pending)
+        refresh_people.update((db_conversation.person_id, new_person_id))
+
     for field, value in update_data.items():
         setattr(db_conversation, field, value)
 
-    db.commit()
-    db.refresh(db_conversation)
-    return db_conversation
+    if refresh_people:
+        # The recount reads conversations, so write this one's changes first
+        await db.flush()
+        await refresh_last_met_at(db, *refresh_people)
+        collections.append(PEOPLE)
+
+    await commit_and_bump(db, *collections)
+    return conversation_response(
+        await get_conversation_or_404(db, conversation_id, include_transcript),
+        include_transcript
+    )
 
 
 @router.delete("/{conversation_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_conversation(
+async def delete_conversation(
     conversation_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Delete a conversation."""
-    db_conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
-    if not db_conversation:
+    """Delete a conversation and, through ON DELETE CASCADE, its action items."""
+    # Lock the row so its pending count cannot change before the delete
+    row = (await db.execute(
+        select(Conversation.person_id, pending_items(Conversation.id).label("pending"))
+        .where(Conversation.id == conversation_id)
+        .with_for_update(of=Conversation)
+    )).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Conversation with id {conversation_id} not found"
         )
 
-    db.delete(db_conversation)
-    db.commit()
+    await db.execute(delete(Conversation).where(Conversation.id == conversation_id))
+    await adjust_counts(db, row.person_id, conversations=-1, pending=-row.pending)
+    await refresh_last_met_at(db, row.person_id)
+
+    await commit_and_bump(db, CONVERSATIONS, PEOPLE)
     return None
 
 
 @router.patch("/{conversation_id}/action-items/{item_id}", response_model=ConversationResponse)
-def toggle_action_item(
+async def toggle_action_item(
     conversation_id: str,
     item_id: str,
     action_item_update: ActionItemUpdate,
-    db: Session = Depends(get_db)
+    include_transcript: bool = include_transcript_query(False),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an action item (typically to toggle completion status)."""
-    db_action_item = db.query(ActionItem).filter(
+    # Action items are part of the conversation's representation, so move its ETag too.
+    # Touching the conversation first also locks it, in the same order as update and delete.
+    person_id = await db.scalar(
+        update(Conversation)
+        .where(Conversation.id == conversation_id)
+        .values(updated_at=func.now())
+        .returning(Conversation.person_id)
+    )
+    db_action_item = person_id and await db.scalar(select(ActionItem).where(
         ActionItem.id == item_id,
         ActionItem.conversation_id == conversation_id
-    ).first()
+    ))
 
     if not db_action_item:
         raise HTTPException(
@@ -172,12 +625,21 @@ def toggle_action_item(
             detail=f"Action item with id {item_id} not found"
         )
 
+    was_pending = db_action_item.completed is not True
     update_data = action_item_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_action_item, field, value)
 
-    db.commit()
+    collections = [CONVERSATIONS]
+    pending_delta = int(db_action_item.completed is not True) - int(was_pending)
+    if pending_delta:
+        await adjust_counts(db, person_id, pending=pending_delta)
+        collections.append(PEOPLE)
 
-    # Return the full conversation
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
-    return conversation
+    await commit_and_bump(db, *collections)
+
+    # Return the conversation; the transcript is unchanged, so it is left out unless asked for
+    return conversation_response(
+        await get_conversation_or_404(db, conversation_id, include_transcript),
+        include_transcript
+    )
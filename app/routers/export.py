@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from typing import Optional
+
+from ..services.export import (
+    MEDIA_TYPES,
+    action_items_query,
+    conversations_query,
+    people_query,
+    stream_export
+)
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+FORMAT_QUERY = Query("ndjson", pattern="^(ndjson|csv)$", description="'ndjson' (one JSON object per line) or 'csv'")
+
+
+def export_response(query: Select, name: str, format: str) -> StreamingResponse:
+    return StreamingResponse(
+        stream_export(query, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{format}"'}
+    )
+
+
+@router.get("/people")
+async def export_people(
+    format: str = FORMAT_QUERY,
+    include_face_data: bool = Query(False, description="Include face embeddings and thumbnails (base64)")
+):
+    """Stream every person, oldest first."""
+    return export_response(people_query(include_face_data), "people", format)
+
+
+@router.get("/conversations")
+async def export_conversations(
+    format: str = FORMAT_QUERY,
+    include_transcripts: bool = Query(False, description="Include full transcripts"),
+    person_id: Optional[str] = Query(None, description="Filter by person ID")
+):
+    """Stream every conversation, oldest first. Action items are exported separately."""
+    return export_response(conversations_query(include_transcripts, person_id), "conversations", format)
+
+
+@router.get("/action-items")
+async def export_action_items(
+    format: str = FORMAT_QUERY,
+    person_id: Optional[str] = Query(None, description="Filter by the conversation's person ID")
+):
+    """Stream every action item, grouped by conversation."""
+    return export_response(action_items_query(person_id), "action_items", format)
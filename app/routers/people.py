@@ -1,111 +1,502 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import ValidationError
+from typing import List, Optional, Sequence
+from datetime import datetime
 import base64
-import math
-
-from ..core.database import get_db
-from ..models import Person
-from ..schemas import PersonCreate, PersonUpdate, PersonResponse, PersonListResponse, FaceMatchRequest, FaceMatchResponse
+import time
+
+from ..core.config import settings
+from ..core.database import get_async_db
+from ..core.dates import localize
+from ..core.metrics import FACE_MATCH_DURATION, FACE_STREAM_FACES, FACE_STREAMS_OPEN, record_face_match
+from ..core.pagination import NEXT_CURSOR_HEADER, after_cursor, decode_cursor, next_cursor
+from ..core.serialization import FastJSONResponse, row_mapper
+from ..models import Conversation, Person
+from ..schemas import (
+    PersonCreate,
+    PersonUpdate,
+    PersonResponse,
+    PersonListResponse,
+    FaceMatchRequest,
+    FaceMatchResponse,
+    FaceBatchMatchRequest,
+    FaceBatchMatchResult,
+    FaceBatchMatchResponse,
+    FaceMatchCandidate,
+    FaceStreamFrame,
+    FaceStreamResult,
+    FaceStreamResponse,
+    FaceEmbeddingResponse
+)
+from ..services import FaceIndex, FaceTracker, ensure_face_index, face_index, face_index_loaded
+from ..services.embeddings import (
+    encode_embedding_b64,
+    pack_embedding,
+    resolve_embedding,
+    stored_embedding
+)
+from ..services.etags import (
+    CONVERSATIONS,
+    PEOPLE,
+    collection_version,
+    commit_and_bump,
+    etag_matches,
+    item_etag,
+    list_etag,
+    not_modified
+)
 
 router = APIRouter(prefix="/people", tags=["people"])
 
+# Accepted thumbnail formats, identified by their leading bytes
+THUMBNAIL_SIGNATURES = {
+    "image/jpeg": (b"\xff\xd8\xff",),
+    "image/png": (b"\x89PNG\r\n\x1a\n",),
+    "image/webp": (b"RIFF",),
+}
+
+
+def thumbnail_media_type(data: bytes) -> Optional[str]:
+    for media_type, signatures in THUMBNAIL_SIGNATURES.items():
+        if data.startswith(signatures) and (media_type != "image/webp" or data[8:12] == b"WEBP"):
+            return media_type
+    return None
+
+
+def thumbnail_headers(digest: str) -> dict:
+    return {"ETag": f'"{digest}"', "Cache-Control": settings.THUMBNAIL_CACHE_CONTROL}
+
+
+async def get_person_or_404(db: AsyncSession, person_id: str) -> Person:
+    person = await db.get(Person, person_id)
+    if not person:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Person with id {person_id} not found"
+        )
+    return person
+
+
+def set_face_embedding(person: Person, embedding: Optional[Sequence]):
+    """Store an embedding in packed float32 form, clearing any legacy value."""
+    person.face_embedding = None
+    if embedding is None or len(embedding) == 0:
+        person.face_embedding_packed = None
+        person.face_embedding_dim = None
+    else:
+        person.face_embedding_packed, person.face_embedding_dim = pack_embedding(embedding)
+
+
+async def get_face_index() -> FaceIndex:
+    """The shared face index, loaded now if startup could not reach the database."""
+    if face_index_loaded():
+        return face_index
+    try:
+        return await run_in_threadpool(ensure_face_index)
+    except OperationalError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Face index is unavailable until the database can be reached"
+        )
 
-def cosine_similarity(embedding1: List[str], embedding2: List[str]) -> float:
-    """Calculate cosine similarity between two embeddings."""
-    if not embedding1 or not embedding2 or len(embedding1) != len(embedding2):
-        return 0.0
 
-    vec1 = [float(x) for x in embedding1]
-    vec2 = [float(x) for x in embedding2]
+# List orders: sort column, its cursor type, and whether it runs descending
+PEOPLE_SORTS = {
+    "created_at": (Person.created_at, datetime, False),
+    "conversation_count": (Person.conversation_count, int, True),
+    "pending_action_count": (Person.pending_action_count, int, True),
+}
 
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-    magnitude1 = math.sqrt(sum(a * a for a in vec1))
-    magnitude2 = math.sqrt(sum(b * b for b in vec2))
+# List rows are sent without re-validation; the columns already have the response types
+person_list_item = row_mapper(PersonListResponse)
 
-    if magnitude1 == 0 or magnitude2 == 0:
-        return 0.0
 
-    return dot_product / (magnitude1 * magnitude2)
+def person_list_query():
+    """Select the PersonListResponse columns plus created_at (never embeddings or thumbnails)."""
+    has_face_data = or_(
+        Person.face_embedding_dim.isnot(None),
+        func.coalesce(func.cardinality(Person.face_embedding), 0) > 0
+    )
+    return select(
+        Person.id,
+        Person.name,
+        Person.role,
+        Person.avatar_color,
+        Person.last_met,
+        Person.last_met_at,
+        # The column is nullable but the response declares an int; rows are not re-validated
+        func.coalesce(Person.met_count, 0).label("met_count"),
+        Person.conversation_count,
+        Person.pending_action_count,
+        Person.context,
+        Person.created_at,
+        has_face_data.label("has_face_data")
+    )
 
 
 @router.get("/", response_model=List[PersonListResponse])
-def get_people(
+async def get_people(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    sort: str = Query(
+        "created_at",
+        pattern="^(created_at|conversation_count|pending_action_count)$",
+        description="'created_at' (oldest first), or 'conversation_count' / 'pending_action_count' (highest first)"
+    ),
+    cursor: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all people."""
-    people = db.query(Person).offset(skip).limit(limit).all()
-    # Add has_face_data field
-    result = []
-    for p in people:
-        person_dict = {
-            "id": p.id,
-            "name": p.name,
-            "role": p.role,
-            "avatar_color": p.avatar_color,
-            "last_met": p.last_met,
-            "met_count": p.met_count,
-            "context": p.context,
-            "has_face_data": p.face_embedding is not None and len(p.face_embedding) > 0
-        }
-        result.append(person_dict)
-    return result
+    """Get all people, oldest first or by their conversation and pending action counts."""
+    # An unchanged collection is answered from its version row alone
+    etag = list_etag(await collection_version(db, PEOPLE), request)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    headers = {"ETag": etag}
+
+    column, cursor_type, descending = PEOPLE_SORTS[sort]
+    query = person_list_query()
+
+    # Keyset pagination on (sort column, id), served by the matching idx_people_*_id index
+    if cursor:
+        value, person_id = decode_cursor(cursor, cursor_type, str)
+        query = query.where(after_cursor((column, Person.id), (value, person_id), descending))
+
+    order = (column.desc(), Person.id.desc()) if descending else (column, Person.id)
+    people = (await db.execute(query.order_by(*order).offset(skip).limit(limit))).all()
+
+    page_cursor = next_cursor(people, limit, sort, "id")
+    if page_cursor:
+        headers[NEXT_CURSOR_HEADER] = page_cursor
+
+    return FastJSONResponse([person_list_item(person) for person in people], headers=headers)
+
+
+@router.get("/recent", response_model=List[PersonListResponse])
+async def get_recent_people(
+    request: Request,
+    since: Optional[datetime] = Query(None, description="Only people met at or after this time (DISPLAY_TIMEZONE if no offset)"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """People ordered by their most recent conversation, latest first.
+
+    People without a dated conversation are left out.
+    """
+    etag = list_etag(await collection_version(db, PEOPLE), request)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    headers = {"ETag": etag}
+
+    # A backward range scan on idx_people_last_met_at_id
+    query = person_list_query().where(Person.last_met_at.isnot(None))
+    if since:
+        query = query.where(Person.last_met_at >= localize(since))
+    if cursor:
+        last_met_at, person_id = decode_cursor(cursor, datetime, str)
+        query = query.where(after_cursor((Person.last_met_at, Person.id), (last_met_at, person_id), descending=True))
+
+    people = (await db.execute(query.order_by(Person.last_met_at.desc(), Person.id.desc()).limit(limit))).all()
+
+    page_cursor = next_cursor(people, limit, "last_met_at", "id")
+    if page_cursor:
+        headers[NEXT_CURSOR_HEADER] = page_cursor
+    return FastJSONResponse([person_list_item(person) for person in people], headers=headers)
 
 
 @router.get("/{person_id}", response_model=PersonResponse)
-def get_person(
+async def get_person(
     person_id: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific person by ID."""
-    person = db.query(Person).filter(Person.id == person_id).first()
-    if not person:
+    # Check the client's copy against updated_at before loading the full row
+    updated_at = await db.scalar(select(Person.updated_at).where(Person.id == person_id))
+    if updated_at is not None and etag_matches(request, item_etag(updated_at)):
+        return not_modified(item_etag(updated_at))
+
+    person = await get_person_or_404(db, person_id)
+    response.headers["ETag"] = item_etag(person.updated_at)
+    return PersonResponse.model_validate(person)
+
+
+@router.get("/{person_id}/face-embedding", response_model=FaceEmbeddingResponse)
+async def get_face_embedding(
+    person_id: str,
+    format: str = Query("list", pattern="^(list|base64)$", description="Return as 'list' of float strings or packed 'base64'"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a person's stored face embedding."""
+    row = (await db.execute(
+        select(Person.face_embedding_packed, Person.face_embedding).where(Person.id == person_id)
+    )).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Person with id {person_id} not found"
         )
-    # Add has_face_data field
-    result = PersonResponse.model_validate(person)
-    result.has_face_data = person.face_embedding is not None and len(person.face_embedding) > 0
-    return result
 
+    embedding = stored_embedding(row.face_embedding_packed, row.face_embedding)
+    if embedding is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Person with id {person_id} has no face embedding"
+        )
 
-@router.post("/match-face", response_model=FaceMatchResponse)
-def match_face(
-    request: FaceMatchRequest,
-    db: Session = Depends(get_db)
+    if format == "base64":
+        packed = row.face_embedding_packed or pack_embedding(embedding)[0]
+        return FaceEmbeddingResponse(
+            person_id=person_id,
+            dim=len(embedding),
+            format="base64",
+            face_embedding_b64=encode_embedding_b64(packed)
+        )
+
+    return FaceEmbeddingResponse(
+        person_id=person_id,
+        dim=len(embedding),
+        format="list",
+        face_embedding=row.face_embedding or [str(x) for x in embedding]
+    )
+
+
+@router.get(
+    "/{person_id}/thumbnail",
+    response_class=Response,
+    responses={200: {"content": {"image/jpeg": {}, "image/png": {}, "image/webp": {}}}}
+)
+async def get_thumbnail(
+    person_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Match a face embedding against known people."""
-    # Get all people with face embeddings
-    people_with_faces = db.query(Person).filter(Person.face_embedding.isnot(None)).all()
+    """Get a person's face thumbnail as raw image bytes."""
+    digest = func.md5(Person.face_thumbnail).label("digest")
+
+    # A revalidation only needs the digest; the image itself is read when it is sent
+    if "if-none-match" in request.headers:
+        row = (await db.execute(select(digest).where(Person.id == person_id))).first()
+        if row and row.digest and etag_matches(request, thumbnail_headers(row.digest)["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=thumbnail_headers(row.digest))
+
+    row = (await db.execute(select(digest, Person.face_thumbnail).where(Person.id == person_id))).first()
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Person with id {person_id} not found"
+        )
+    if not row.face_thumbnail:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Person with id {person_id} has no thumbnail"
+        )
+
+    return Response(
+        content=row.face_thumbnail,
+        media_type=thumbnail_media_type(row.face_thumbnail) or "application/octet-stream",
+        headers=thumbnail_headers(row.digest)
+    )
+
+
+@router.put(
+    "/{person_id}/thumbnail",
+    status_code=status.HTTP_204_NO_CONTENT,
+    openapi_extra={"requestBody": {"required": True, "content": {
+        media_type: {"schema": {"type": "string", "format": "binary"}} for media_type in THUMBNAIL_SIGNATURES
+    }}}
+)
+async def put_thumbnail(
+    person_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Replace a person's face thumbnail with the raw JPEG, PNG or WebP request body."""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type not in THUMBNAIL_SIGNATURES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Thumbnail must be one of: {', '.join(THUMBNAIL_SIGNATURES)}"
+        )
+
+    data = bytearray()
+    async for chunk in request.stream():
+        data += chunk
+        if len(data) > settings.THUMBNAIL_MAX_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=f"Thumbnail must be at most {settings.THUMBNAIL_MAX_BYTES} bytes"
+            )
+    if thumbnail_media_type(data) != content_type:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"Request body is not a valid {content_type} image"
+        )
+
+    digest = await db.scalar(
+        update(Person)
+        .where(Person.id == person_id)
+        .values(face_thumbnail=bytes(data))
+        .returning(func.md5(Person.face_thumbnail))
+    )
+    if digest is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Person with id {person_id} not found"
+        )
+
+    await db.commit()
+    return Response(status_code=status.HTTP_204_NO_CONTENT, headers=thumbnail_headers(digest))
 
-    best_match = None
-    best_similarity = 0.0
 
-    for person in people_with_faces:
-        if person.face_embedding:
-            similarity = cosine_similarity(request.face_embedding, person.face_embedding)
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = person
+@router.delete("/{person_id}/thumbnail", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_thumbnail(
+    person_id: str,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Remove a person's face thumbnail."""
+    result = await db.execute(update(Person).where(Person.id == person_id).values(face_thumbnail=None))
+    if result.rowcount == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Person with id {person_id} not found"
+        )
 
-    if best_match and best_similarity >= request.threshold:
+    await db.commit()
+    return None
+
+
+@router.post("/match-face", response_model=FaceMatchResponse)
+async def match_face(request: FaceMatchRequest, index: FaceIndex = Depends(get_face_index)):
+    """Match a face embedding against known people."""
+    embedding = resolve_embedding(request.face_embedding, request.face_embedding_b64)
+    # Scoring is CPU work (NumPy releases the GIL), so keep it off the event loop
+    with FACE_MATCH_DURATION.labels("match-face").time():
+        person_id, person_name, best_similarity = await run_in_threadpool(index.match, embedding)
+
+    matched = bool(person_id) and best_similarity >= request.threshold
+    record_face_match(request.threshold, matched)
+    if matched:
         return FaceMatchResponse(
             matched=True,
-            person_id=best_match.id,
-            person_name=best_match.name,
+            person_id=person_id,
+            person_name=person_name,
             confidence=best_similarity
         )
 
     return FaceMatchResponse(matched=False, confidence=best_similarity)
 
 
+@router.post("/match-faces", response_model=FaceBatchMatchResponse)
+async def match_faces(request: FaceBatchMatchRequest, index: FaceIndex = Depends(get_face_index)):
+    """Match every face from one photo or frame, returning the top-k candidates for each."""
+    embeddings = [resolve_embedding(face.face_embedding, face.face_embedding_b64) for face in request.faces]
+
+    with FACE_MATCH_DURATION.labels("match-faces").time():
+        searched = await run_in_threadpool(index.search, embeddings, request.top_k)
+
+    results = []
+    for candidates in searched:
+        best_similarity = candidates[0][2] if candidates else 0.0
+        above_threshold = [
+            FaceMatchCandidate(person_id=person_id, person_name=person_name, confidence=similarity)
+            for person_id, person_name, similarity in candidates
+            if similarity >= request.threshold
+        ]
+        record_face_match(request.threshold, bool(above_threshold))
+        if above_threshold:
+            best = above_threshold[0]
+            results.append(FaceBatchMatchResult(
+                matched=True,
+                person_id=best.person_id,
+                person_name=best.person_name,
+                confidence=best.confidence,
+                candidates=above_threshold
+            ))
+        else:
+            results.append(FaceBatchMatchResult(matched=False, confidence=best_similarity))
+
+    return FaceBatchMatchResponse(results=results)
+
+
+# Tracks one stream may hold; the least recently seen is dropped beyond this
+STREAM_MAX_TRACKS = 256
+
+
+@router.websocket("/match-face/stream")
+async def match_face_stream(
+    websocket: WebSocket,
+    threshold: float = Query(0.6, description="Similarity threshold (0-1)")
+):
+    """Match faces from a live camera feed over one WebSocket.
+
+    Each text message is a ``FaceStreamFrame``; the reply is a
+    ``FaceStreamResponse`` with one smoothed result per face. Invalid messages
+    get ``{"error": ...}`` and the stream stays open.
+    """
+    await websocket.accept()
+    if face_index_loaded():
+        index = face_index
+    else:
+        try:
+            index = await run_in_threadpool(ensure_face_index)
+        except OperationalError:
+            await websocket.close(
+                code=status.WS_1013_TRY_AGAIN_LATER,
+                reason="Face index is unavailable until the database can be reached"
+            )
+            return
+
+    tracker = FaceTracker(
+        index,
+        threshold,
+        settings.FACE_STREAM_SMOOTHING,
+        settings.FACE_STREAM_CONFIRM_FRAMES,
+        settings.FACE_STREAM_RESCORE_FRAMES,
+        settings.FACE_STREAM_TRACK_TTL,
+        STREAM_MAX_TRACKS
+    )
+    FACE_STREAMS_OPEN.inc()
+    try:
+        while True:
+            message = await websocket.receive_text()
+            try:
+                frame = FaceStreamFrame.model_validate_json(message)
+                faces = [
+                    (face.track_id, resolve_embedding(face.face_embedding, face.face_embedding_b64))
+                    for face in frame.faces
+                ]
+            except (ValidationError, ValueError) as exc:
+                await websocket.send_json({"error": str(exc)})
+                continue
+
+            # Per-frame tracking is a few dot products, but a full search is CPU work for the threadpool
+            with FACE_MATCH_DURATION.labels("stream").time():
+                results = await run_in_threadpool(tracker.process, faces, time.monotonic())
+
+            for result in results:
+                FACE_STREAM_FACES.labels("search" if result.rescored else "tracked").inc()
+                record_face_match(threshold, result.matched)
+            await websocket.send_text(FaceStreamResponse(
+                frame=frame.frame,
+                results=[FaceStreamResult(**result._asdict()) for result in results]
+            ).model_dump_json())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        FACE_STREAMS_OPEN.dec()
+
+
 @router.post("/", response_model=PersonResponse, status_code=status.HTTP_201_CREATED)
-def create_person(
+async def create_person(
     person: PersonCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new person."""
     # Handle face thumbnail if provided
@@ -120,32 +511,26 @@ def create_person(
         context=person.context,
         interests=person.interests,
         open_follow_ups=person.open_follow_ups,
-        face_embedding=person.face_embedding,
         face_thumbnail=face_thumbnail,
         physical_description=person.physical_description
     )
+    embedding = resolve_embedding(person.face_embedding, person.face_embedding_b64)
+    set_face_embedding(db_person, embedding)
     db.add(db_person)
-    db.commit()
-    db.refresh(db_person)
+    await commit_and_bump(db, PEOPLE)
+    face_index.upsert(db_person.id, db_person.name, embedding)
 
-    result = PersonResponse.model_validate(db_person)
-    result.has_face_data = db_person.face_embedding is not None and len(db_person.face_embedding) > 0
-    return result
+    return PersonResponse.model_validate(db_person)
 
 
 @router.put("/{person_id}", response_model=PersonResponse)
-def update_person(
+async def update_person(
     person_id: str,
     person_update: PersonUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a person's information."""
-    db_person = db.query(Person).filter(Person.id == person_id).first()
-    if not db_person:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Person with id {person_id} not found"
-        )
+    db_person = await get_person_or_404(db, person_id)
 
     update_data = person_update.model_dump(exclude_unset=True)
 
@@ -155,30 +540,41 @@ def update_person(
         if thumbnail_b64:
             db_person.face_thumbnail = base64.b64decode(thumbnail_b64)
 
+    # Embeddings are always stored packed, whichever encoding they arrived in
+    if "face_embedding" in update_data or "face_embedding_b64" in update_data:
+        set_face_embedding(
+            db_person,
+            resolve_embedding(update_data.pop("face_embedding", None), update_data.pop("face_embedding_b64", None))
+        )
+
     for field, value in update_data.items():
         setattr(db_person, field, value)
 
-    db.commit()
-    db.refresh(db_person)
+    await commit_and_bump(db, PEOPLE)
+    face_index.upsert(
+        db_person.id,
+        db_person.name,
+        stored_embedding(db_person.face_embedding_packed, db_person.face_embedding)
+    )
 
-    result = PersonResponse.model_validate(db_person)
-    result.has_face_data = db_person.face_embedding is not None and len(db_person.face_embedding) > 0
-    return result
+    return PersonResponse.model_validate(db_person)
 
 
 @router.delete("/{person_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_person(
+async def delete_person(
     person_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Delete a person."""
-    db_person = db.query(Person).filter(Person.id == person_id).first()
-    if not db_person:
+    """Delete a person and, through ON DELETE CASCADE, their conversations."""
+    # Lock the conversations before the person row, the order every conversation write uses
+    await db.execute(select(Conversation.id).where(Conversation.person_id == person_id).with_for_update())
+    result = await db.execute(delete(Person).where(Person.id == person_id))
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Person with id {person_id} not found"
         )
 
-    db.delete(db_person)
-    db.commit()
+    await commit_and_bump(db, PEOPLE, CONVERSATIONS)
+    face_index.remove(person_id)
     return None
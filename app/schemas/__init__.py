@@ -4,8 +4,18 @@ from .person import (
     PersonUpdate,
     PersonResponse,
     PersonListResponse,
+    FaceEmbeddingInput,
     FaceMatchRequest,
-    FaceMatchResponse
+    FaceMatchResponse,
+    FaceBatchMatchRequest,
+    FaceMatchCandidate,
+    FaceBatchMatchResult,
+    FaceBatchMatchResponse,
+    FaceStreamFace,
+    FaceStreamFrame,
+    FaceStreamResult,
+    FaceStreamResponse,
+    FaceEmbeddingResponse
 )
 from .conversation import (
     ActionItemBase,
@@ -16,7 +26,18 @@ from .conversation import (
     ConversationCreate,
     ConversationUpdate,
     ConversationResponse,
-    ConversationListResponse
+    ConversationListResponse,
+    ConversationSearchResult,
+    TranscriptSegmentCreate,
+    TranscriptSegmentResponse,
+    TranscriptAppend,
+    TranscriptAppendResult
+)
+from .bulk import (
+    PersonImport,
+    ConversationImport,
+    ImportRowError,
+    ImportResult
 )
 
 __all__ = [
@@ -25,8 +46,18 @@ __all__ = [
     "PersonUpdate",
     "PersonResponse",
     "PersonListResponse",
+    "FaceEmbeddingInput",
     "FaceMatchRequest",
     "FaceMatchResponse",
+    "FaceBatchMatchRequest",
+    "FaceMatchCandidate",
+    "FaceBatchMatchResult",
+    "FaceBatchMatchResponse",
+    "FaceStreamFace",
+    "FaceStreamFrame",
+    "FaceStreamResult",
+    "FaceStreamResponse",
+    "FaceEmbeddingResponse",
     "ActionItemBase",
     "ActionItemCreate",
     "ActionItemUpdate",
@@ -36,4 +67,13 @@ __all__ = [
     "ConversationUpdate",
     "ConversationResponse",
     "ConversationListResponse",
+    "ConversationSearchResult",
+    "TranscriptSegmentCreate",
+    "TranscriptSegmentResponse",
+    "TranscriptAppend",
+    "TranscriptAppendResult",
+    "PersonImport",
+    "ConversationImport",
+    "ImportRowError",
+    "ImportResult",
 ]
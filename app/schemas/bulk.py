@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from .person import PersonCreate
+from .conversation import ConversationCreate
+
+
+class PersonImport(PersonCreate):
+    id: Optional[str] = Field(default=None, description="Keep an existing ID; generated when omitted")
+
+
+class ConversationImport(ConversationCreate):
+    id: Optional[str] = Field(default=None, description="Keep an existing ID; generated when omitted")
+
+
+class ImportRowError(BaseModel):
+    line: int = Field(..., description="1-based line number in the NDJSON input")
+    id: Optional[str] = None
+    error: str
+
+
+class ImportResult(BaseModel):
+    total: int = Field(0, description="Non-blank lines read")
+    inserted: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = Field(default_factory=list, description="Per-row errors, capped at the first 1000")
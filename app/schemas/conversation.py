@@ -27,6 +27,10 @@ class ActionItemResponse(ActionItemBase):
 class ConversationBase(BaseModel):
     title: str
     date: str = Field(..., description="Formatted date string (e.g., 'Jan 16 • 2:30 PM')")
+    occurred_at: Optional[datetime] = Field(
+        default=None,
+        description="When the conversation happened (DISPLAY_TIMEZONE if no offset); parsed from date when omitted"
+    )
     location: str
     summary: str
     key_points: List[str] = Field(default_factory=list)
@@ -42,6 +46,7 @@ class ConversationCreate(ConversationBase):
 class ConversationUpdate(BaseModel):
     title: Optional[str] = None
     date: Optional[str] = None
+    occurred_at: Optional[datetime] = None
     location: Optional[str] = None
     summary: Optional[str] = None
     key_points: Optional[List[str]] = None
@@ -68,9 +73,45 @@ class ConversationListResponse(BaseModel):
     participants: List[str]
     title: str
     date: str
+    occurred_at: Optional[datetime] = None
     location: str
     summary: str
     active_action_items_count: int
 
     class Config:
         from_attributes = True
+
+
+class ConversationSearchResult(BaseModel):
+    id: str
+    person_id: str
+    title: str
+    date: str
+    location: str
+    summary: str
+    rank: float = Field(..., description="Relevance score; results are ordered by it, highest first")
+    snippet: str = Field(..., description="Matching excerpt with terms wrapped in <mark></mark>")
+
+
+class TranscriptSegmentBase(BaseModel):
+    seq: int = Field(..., ge=0, description="Position in the transcript; re-sending a seq already stored is ignored")
+    speaker: Optional[str] = Field(default=None, max_length=255)
+    text: str = Field(..., min_length=1)
+
+
+class TranscriptSegmentCreate(TranscriptSegmentBase):
+    pass
+
+
+class TranscriptSegmentResponse(TranscriptSegmentBase):
+    class Config:
+        from_attributes = True
+
+
+class TranscriptAppend(BaseModel):
+    segments: List[TranscriptSegmentCreate] = Field(..., min_length=1, max_length=500)
+
+
+class TranscriptAppendResult(BaseModel):
+    appended: int = Field(..., description="Segments stored by this request (retried seqs are not counted)")
+    last_seq: int = Field(..., description="Highest seq stored so far; resume sending after it")
@@ -1,7 +1,36 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import AfterValidator, BaseModel, Field, model_validator
+from typing import Annotated, List, Literal, Optional
 from datetime import datetime
 
+import numpy as np
+
+from ..services.embeddings import EMBEDDING_DTYPE, decode_embedding_b64
+
+FACE_EMBEDDING_B64_DESCRIPTION = "Face embedding as base64 of packed little-endian float32 values"
+FACE_THUMBNAIL_B64_DESCRIPTION = "Deprecated: upload raw image bytes with PUT /people/{id}/thumbnail instead"
+
+
+def _validate_embedding_b64(value: str) -> str:
+    decode_embedding_b64(value)
+    return value
+
+
+# Base64 string of packed float32 values, rejected at validation time if malformed
+EmbeddingB64 = Annotated[str, AfterValidator(_validate_embedding_b64)]
+
+
+def _validate_embedding_values(values: List[str]) -> List[str]:
+    # The same conversion the embedding is stored with, so anything accepted here can be packed
+    try:
+        np.asarray(values, dtype=EMBEDDING_DTYPE)
+    except ValueError:
+        raise ValueError("face_embedding must contain only numbers") from None
+    return values
+
+
+# Float strings, rejected at validation time if any is not a number
+EmbeddingValues = Annotated[List[str], AfterValidator(_validate_embedding_values)]
+
 
 class PersonBase(BaseModel):
     name: str
@@ -13,8 +42,9 @@ class PersonBase(BaseModel):
 
 
 class PersonCreate(PersonBase):
-    face_embedding: Optional[List[str]] = None
-    face_thumbnail_base64: Optional[str] = None
+    face_embedding: Optional[EmbeddingValues] = None
+    face_embedding_b64: Optional[EmbeddingB64] = Field(default=None, description=FACE_EMBEDDING_B64_DESCRIPTION)
+    face_thumbnail_base64: Optional[str] = Field(default=None, description=FACE_THUMBNAIL_B64_DESCRIPTION)
     physical_description: Optional[str] = None
 
 
@@ -25,15 +55,19 @@ class PersonUpdate(BaseModel):
     context: Optional[str] = None
     interests: Optional[List[str]] = None
     open_follow_ups: Optional[List[str]] = None
-    face_embedding: Optional[List[str]] = None
-    face_thumbnail_base64: Optional[str] = None
+    face_embedding: Optional[EmbeddingValues] = None
+    face_embedding_b64: Optional[EmbeddingB64] = Field(default=None, description=FACE_EMBEDDING_B64_DESCRIPTION)
+    face_thumbnail_base64: Optional[str] = Field(default=None, description=FACE_THUMBNAIL_B64_DESCRIPTION)
     physical_description: Optional[str] = None
 
 
 class PersonResponse(PersonBase):
     id: str
     last_met: Optional[str] = None
+    last_met_at: Optional[datetime] = None
     met_count: int = 0
+    conversation_count: int = 0
+    pending_action_count: int = 0
     physical_description: Optional[str] = None
     has_face_data: bool = False
     created_at: datetime
@@ -49,7 +83,10 @@ class PersonListResponse(BaseModel):
     role: str
     avatar_color: str
     last_met: Optional[str] = None
+    last_met_at: Optional[datetime] = None
     met_count: int
+    conversation_count: int = 0
+    pending_action_count: int = 0
     context: str
     has_face_data: bool = False
 
@@ -57,9 +94,20 @@ class PersonListResponse(BaseModel):
         from_attributes = True
 
 
-class FaceMatchRequest(BaseModel):
+class FaceEmbeddingInput(BaseModel):
+    """A face embedding sent either as float strings or packed base64."""
+    face_embedding: Optional[EmbeddingValues] = Field(default=None, description="Face embedding as list of float strings")
+    face_embedding_b64: Optional[EmbeddingB64] = Field(default=None, description=FACE_EMBEDDING_B64_DESCRIPTION)
+
+    @model_validator(mode="after")
+    def require_embedding(self):
+        if not self.face_embedding and not self.face_embedding_b64:
+            raise ValueError("Either face_embedding or face_embedding_b64 is required")
+        return self
+
+
+class FaceMatchRequest(FaceEmbeddingInput):
     """Request to match a face embedding against known people."""
-    face_embedding: List[str] = Field(..., description="Face embedding as list of float strings")
     threshold: float = Field(default=0.6, description="Similarity threshold (0-1)")
 
 
@@ -69,3 +117,60 @@ class FaceMatchResponse(BaseModel):
     person_id: Optional[str] = None
     person_name: Optional[str] = None
     confidence: float = 0.0
+
+
+class FaceBatchMatchRequest(BaseModel):
+    """Request to match every face found in one photo or frame."""
+    faces: List[FaceEmbeddingInput] = Field(..., min_length=1, max_length=64)
+    threshold: float = Field(default=0.6, description="Similarity threshold (0-1)")
+    top_k: int = Field(default=3, ge=1, le=20, description="Maximum candidates returned per face")
+
+
+class FaceMatchCandidate(BaseModel):
+    """A person whose face scored at or above the threshold."""
+    person_id: str
+    person_name: str
+    confidence: float
+
+
+class FaceBatchMatchResult(FaceMatchResponse):
+    """Best match for one face plus its top-k candidates."""
+    candidates: List[FaceMatchCandidate] = Field(default_factory=list)
+
+
+class FaceBatchMatchResponse(BaseModel):
+    """Results in the same order as the request's faces."""
+    results: List[FaceBatchMatchResult]
+
+
+class FaceStreamFace(FaceEmbeddingInput):
+    """One face in a streamed frame; faces with the same track_id are smoothed across frames."""
+    track_id: Optional[str] = Field(default=None, max_length=64, description="Client-assigned id of a tracked face")
+
+
+class FaceStreamFrame(BaseModel):
+    """One message on the match-face stream: the faces detected in a frame."""
+    frame: Optional[int] = Field(default=None, description="Echoed back so replies can be paired with frames")
+    faces: List[FaceStreamFace] = Field(default_factory=list, max_length=64)
+
+
+class FaceStreamResult(FaceMatchResponse):
+    """Smoothed match for one streamed face."""
+    track_id: Optional[str] = None
+    stable: bool = Field(default=False, description="The track's identity has held for several frames")
+    rescored: bool = Field(default=True, description="False when only the identified person's face was compared")
+
+
+class FaceStreamResponse(BaseModel):
+    """Results in the same order as the frame's faces."""
+    frame: Optional[int] = None
+    results: List[FaceStreamResult]
+
+
+class FaceEmbeddingResponse(BaseModel):
+    """A stored face embedding in the requested encoding."""
+    person_id: str
+    dim: int
+    format: Literal["list", "base64"]
+    face_embedding: Optional[List[str]] = None
+    face_embedding_b64: Optional[str] = None
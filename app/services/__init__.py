@@ -0,0 +1,18 @@
+from .face_index import FaceIndex
+from .ivf_index import IVFFaceIndex
+from .shared_index import SharedFaceIndex
+from .face_tracks import FaceTracker, TrackResult
+from .face_registry import face_index, face_index_loaded, ensure_face_index, load_face_index, save_face_index
+
+__all__ = [
+    "FaceIndex",
+    "IVFFaceIndex",
+    "SharedFaceIndex",
+    "FaceTracker",
+    "TrackResult",
+    "face_index",
+    "face_index_loaded",
+    "ensure_face_index",
+    "load_face_index",
+    "save_face_index",
+]
@@ -0,0 +1,254 @@
+"""
+Bulk NDJSON import of people and conversations.
+
+Each line is validated with the same schemas as the single-record endpoints
+(plus an optional ``id``), then written in batches: one multi-row INSERT per
+table per batch, one UPDATE for the affected people's ``met_count``,
+``last_met`` and conversation counters, and one commit. Rows whose id already exists are skipped. When a
+batch insert fails, its rows are retried one by one inside savepoints so a
+single bad row is reported without losing the rest of the batch.
+"""
+
+import base64
+import uuid
+from collections import Counter
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import DateTime, Integer, String, column, func, insert, select, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.dates import localize, parse_display_date
+from ..models import ActionItem, Conversation, Person
+from ..schemas import ConversationImport, ImportResult, ImportRowError, PersonImport
+from .embeddings import pack_embedding, resolve_embedding, unpack_embedding
+from .etags import CONVERSATIONS, PEOPLE, commit_and_bump
+from .face_registry import face_index
+
+BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+
+Row = Tuple[int, dict]
+
+
+def _new_id(prefix: str) -> str:
+    # Same format as the model defaults
+    return f"{prefix}{uuid.uuid4().hex[:8]}"
+
+
+async def iter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[Tuple[int, bytes]]:
+    """Split a byte stream into (line_number, line) pairs, skipping blank lines."""
+    buffer = b""
+    line_no = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield line_no, line
+    if buffer.strip():
+        yield line_no + 1, buffer
+
+
+def _add_error(result: ImportResult, line: int, record_id: Optional[str], error: str):
+    result.failed += 1
+    if len(result.errors) < MAX_REPORTED_ERRORS:
+        result.errors.append(ImportRowError(line=line, id=record_id, error=error))
+
+
+def _error_message(exc: Exception) -> str:
+    if isinstance(exc, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'record'}: {error['msg']}"
+            for error in exc.errors()
+        )
+    if isinstance(exc, DBAPIError):
+        return str(exc.orig).splitlines()[0]
+    return str(exc)
+
+
+async def _run_import(
+    db: AsyncSession,
+    lines: AsyncIterable[Tuple[int, bytes]],
+    parse: Callable[[bytes], dict],
+    write_batch: Callable
+) -> ImportResult:
+    result = ImportResult()
+    batch: List[Row] = []
+    seen_ids = set()
+
+    async for line_no, line in lines:
+        result.total += 1
+        try:
+            row = parse(line)
+        except ValueError as exc:
+            _add_error(result, line_no, None, _error_message(exc))
+            continue
+        if row["id"] in seen_ids:
+            _add_error(result, line_no, row["id"], "Duplicate id in this batch")
+            continue
+
+        seen_ids.add(row["id"])
+        batch.append((line_no, row))
+        if len(batch) >= BATCH_SIZE:
+            await write_batch(db, batch, result)
+            batch, seen_ids = [], set()
+
+    if batch:
+        await write_batch(db, batch, result)
+    return result
+
+
+async def _insert_rows(db: AsyncSession, table, rows: List[Row], result: ImportResult) -> List[Row]:
+    """Insert rows, skipping existing ids, and return the rows that were inserted."""
+    if not rows:
+        return []
+    stmt = pg_insert(table).on_conflict_do_nothing(index_elements=["id"]).returning(table.c.id)
+
+    failed = set()
+    try:
+        async with db.begin_nested():
+            inserted = set((await db.execute(stmt, [row for _, row in rows])).scalars())
+    except DBAPIError:
+        # Isolate the offending rows so the rest of the batch still loads
+        inserted = set()
+        for line_no, row in rows:
+            try:
+                async with db.begin_nested():
+                    inserted.update((await db.execute(stmt, [row])).scalars())
+            except DBAPIError as exc:
+                failed.add(line_no)
+                _add_error(result, line_no, row["id"], _error_message(exc))
+
+    written = []
+    for line_no, row in rows:
+        if row["id"] in inserted:
+            written.append((line_no, row))
+        elif line_no not in failed:
+            _add_error(result, line_no, row["id"], f"Record with id {row['id']} already exists")
+    result.inserted += len(written)
+    return written
+
+
+def _parse_person(line: bytes) -> dict:
+    record = PersonImport.model_validate_json(line)
+    embedding = resolve_embedding(record.face_embedding, record.face_embedding_b64)
+    packed, dim = pack_embedding(embedding) if embedding is not None and len(embedding) else (None, None)
+    return {
+        "id": record.id or _new_id("p"),
+        "name": record.name,
+        "role": record.role,
+        "avatar_color": record.avatar_color,
+        "context": record.context,
+        "interests": record.interests,
+        "open_follow_ups": record.open_follow_ups,
+        "met_count": 0,
+        "face_embedding_packed": packed,
+        "face_embedding_dim": dim,
+        "face_thumbnail": base64.b64decode(record.face_thumbnail_base64) if record.face_thumbnail_base64 else None,
+        "physical_description": record.physical_description,
+    }
+
+
+async def _write_people(db: AsyncSession, batch: List[Row], result: ImportResult):
+    written = await _insert_rows(db, Person.__table__, batch, result)
+    if written:
+        await commit_and_bump(db, PEOPLE)
+    else:
+        await db.commit()
+
+    for _, row in written:
+        if row["face_embedding_packed"]:
+            face_index.upsert(row["id"], row["name"], unpack_embedding(row["face_embedding_packed"]))
+
+
+def _parse_conversation(line: bytes) -> dict:
+    record = ConversationImport.model_validate_json(line)
+    return {
+        "id": record.id or _new_id("c"),
+        "person_id": record.person_id,
+        "participants": record.participants,
+        "title": record.title,
+        "date": record.date,
+        "occurred_at": localize(record.occurred_at) if record.occurred_at else parse_display_date(record.date),
+        "location": record.location,
+        "summary": record.summary,
+        "key_points": record.key_points,
+        "full_transcript": record.full_transcript,
+        "_action_items": record.action_items,
+    }
+
+
+async def _write_conversations(db: AsyncSession, batch: List[Row], result: ImportResult):
+    # One lookup for every person referenced by the batch
+    person_ids = {row["person_id"] for _, row in batch}
+    existing = set((await db.scalars(select(Person.id).where(Person.id.in_(person_ids)))).all())
+
+    rows = []
+    action_items: Dict[str, list] = {}
+    for line_no, row in batch:
+        if row["person_id"] not in existing:
+            _add_error(result, line_no, row["id"], f"Person with id {row['person_id']} not found")
+            continue
+        action_items[row["id"]] = row.pop("_action_items")
+        rows.append((line_no, row))
+
+    written = await _insert_rows(db, Conversation.__table__, rows, result)
+    if not written:
+        await db.commit()
+        return
+
+    item_rows = [
+        {"id": _new_id("a"), "conversation_id": row["id"], "text": item.text, "completed": item.completed}
+        for _, row in written
+        for item in action_items[row["id"]]
+    ]
+    if item_rows:
+        await db.execute(insert(ActionItem), item_rows)
+
+    # Apply every met_count/last_met/counter change in one statement; the last row per person wins last_met
+    met_counts = Counter()
+    pending_counts = Counter()
+    last_met = {}
+    last_met_at = {}
+    for _, row in written:
+        person_id = row["person_id"]
+        met_counts[person_id] += 1
+        pending_counts[person_id] += sum(1 for item in action_items[row["id"]] if not item.completed)
+        last_met[person_id] = row["date"].split('•')[0].strip()
+        if row["occurred_at"] and (last_met_at.get(person_id) is None or row["occurred_at"] > last_met_at[person_id]):
+            last_met_at[person_id] = row["occurred_at"]
+    met = values(
+        column("person_id", String), column("count", Integer), column("pending", Integer),
+        column("last_met", String), column("last_met_at", DateTime(timezone=True)),
+        name="met"
+    ).data([
+        (person_id, count, pending_counts[person_id], last_met[person_id], last_met_at.get(person_id))
+        for person_id, count in met_counts.items()
+    ])
+    await db.execute(
+        update(Person)
+        .where(Person.id == met.c.person_id)
+        .values(
+            met_count=func.coalesce(Person.met_count, 0) + met.c.count,
+            last_met=met.c.last_met,
+            last_met_at=func.greatest(Person.last_met_at, met.c.last_met_at),
+            conversation_count=Person.conversation_count + met.c.count,
+            pending_action_count=Person.pending_action_count + met.c.pending
+        )
+    )
+
+    await commit_and_bump(db, CONVERSATIONS, PEOPLE)
+
+
+async def import_people(db: AsyncSession, lines: AsyncIterable[Tuple[int, bytes]]) -> ImportResult:
+    """Import PersonCreate records (with optional id), one JSON object per line."""
+    return await _run_import(db, lines, _parse_person, _write_people)
+
+
+async def import_conversations(db: AsyncSession, lines: AsyncIterable[Tuple[int, bytes]]) -> ImportResult:
+    """Import ConversationCreate records (with optional id), one JSON object per line."""
+    return await _run_import(db, lines, _parse_conversation, _write_conversations)
@@ -0,0 +1,150 @@
+"""
+Denormalized per-person conversation aggregates.
+
+``people.conversation_count`` and ``people.pending_action_count`` replace the
+join-and-group of the ``people_summary`` view. Every write that changes them
+applies a delta with ``SET n = n + delta`` in the same transaction as the
+change, so concurrent writers never overwrite each other's counts.
+``repair_counters.py`` recomputes them from scratch.
+
+``people.last_met_at`` is the latest ``occurred_at`` of a person's
+conversations: advanced with ``GREATEST`` when one is added, recomputed when
+one is moved, re-dated or deleted.
+
+Creating a conversation applies all of these, plus ``met_count`` and
+``last_met``, in one ``UPDATE ... RETURNING`` that also serves as the check
+that the person exists.
+
+Writers lock rows in one order: conversations first, then people, several
+people in id order (``lock_people``). Transactions that touch the same rows
+then queue on each other instead of deadlocking.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Update, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import ActionItem, Conversation, Person
+
+
+def pending_items(conversation_id):
+    """Scalar subquery counting a conversation's incomplete action items."""
+    return (
+        select(func.count(ActionItem.id))
+        .where(ActionItem.conversation_id == conversation_id, ActionItem.completed.isnot(True))
+        .scalar_subquery()
+    )
+
+
+async def lock_people(db: AsyncSession, *person_ids: str) -> set:
+    """Lock people rows in id order until commit. Returns the ids that exist."""
+    result = await db.execute(
+        select(Person.id).where(Person.id.in_(person_ids)).order_by(Person.id).with_for_update()
+    )
+    return set(result.scalars())
+
+
+async def adjust_counts(db: AsyncSession, person_id: str, conversations: int = 0, pending: int = 0):
+    """Add deltas to a person's counters."""
+    if not conversations and not pending:
+        return
+    await db.execute(
+        update(Person)
+        .where(Person.id == person_id)
+        .values(
+            conversation_count=Person.conversation_count + conversations,
+            pending_action_count=Person.pending_action_count + pending
+        )
+    )
+
+
+async def record_conversation(
+    db: AsyncSession,
+    person_id: str,
+    last_met: str,
+    occurred_at: Optional[datetime],
+    pending: int
+) -> bool:
+    """Count a new conversation against its person. Returns False if the person does not exist.
+
+    The row lock taken here is held until commit, so concurrent creates for
+    one person queue on it instead of overwriting each other's counts.
+    """
+    result = await db.execute(
+        update(Person)
+        .where(Person.id == person_id)
+        .values(
+            met_count=func.coalesce(Person.met_count, 0) + 1,
+            last_met=last_met,
+            last_met_at=func.greatest(Person.last_met_at, occurred_at),
+            conversation_count=Person.conversation_count + 1,
+            pending_action_count=Person.pending_action_count + pending
+        )
+        .returning(Person.id)
+    )
+    return result.scalar_one_or_none() is not None
+
+
+def last_met_at_statement() -> Update:
+    """UPDATE setting last_met_at to each person's latest conversation, where it differs."""
+    latest = (
+        select(func.max(Conversation.occurred_at))
+        .where(Conversation.person_id == Person.id)
+        .scalar_subquery()
+    )
+    return (
+        update(Person)
+        .where(Person.last_met_at.is_distinct_from(latest))
+        .values(last_met_at=latest)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def refresh_last_met_at(db: AsyncSession, *person_ids: str):
+    """Recompute last_met_at from the people's remaining conversations."""
+    await db.execute(last_met_at_statement().where(Person.id.in_(person_ids)))
+
+
+def recount_statement() -> Update:
+    """UPDATE recomputing every person's counters, touching only rows that are wrong.
+
+    Returns the ids of the corrected people.
+    """
+    pending = (
+        select(ActionItem.conversation_id, func.count().label("pending"))
+        .where(ActionItem.completed.isnot(True))
+        .group_by(ActionItem.conversation_id)
+        .subquery()
+    )
+    per_person = (
+        select(
+            Conversation.person_id,
+            func.count().label("conversations"),
+            func.coalesce(func.sum(pending.c.pending), 0).label("pending")
+        )
+        .outerjoin(pending, pending.c.conversation_id == Conversation.id)
+        .group_by(Conversation.person_id)
+        .subquery()
+    )
+    actual = (
+        select(
+            Person.id,
+            func.coalesce(per_person.c.conversations, 0).label("conversations"),
+            func.coalesce(per_person.c.pending, 0).label("pending")
+        )
+        .outerjoin(per_person, per_person.c.person_id == Person.id)
+        .subquery()
+    )
+    return (
+        update(Person)
+        .where(
+            Person.id == actual.c.id,
+            tuple_(Person.conversation_count, Person.pending_action_count).is_distinct_from(
+                tuple_(actual.c.conversations, actual.c.pending)
+            )
+        )
+        .values(conversation_count=actual.c.conversations, pending_action_count=actual.c.pending)
+        .returning(Person.id)
+    )
@@ -0,0 +1,60 @@
+"""
+Packed float32 face embedding encoding.
+
+Embeddings are stored as little-endian float32 bytes alongside their dimension,
+and may be exchanged over the API as base64 strings of the same bytes. The
+legacy representation (a list of float strings) is still accepted everywhere.
+"""
+
+import base64
+import binascii
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+EMBEDDING_DTYPE = np.dtype("<f4")
+
+
+def pack_embedding(values: Sequence) -> Tuple[bytes, int]:
+    """Pack an embedding into little-endian float32 bytes, returning (bytes, dim)."""
+    vec = np.asarray(values, dtype=EMBEDDING_DTYPE)
+    return vec.tobytes(), int(vec.shape[0])
+
+
+def unpack_embedding(data: bytes) -> np.ndarray:
+    """Unpack little-endian float32 bytes into a read-only float32 vector."""
+    return np.frombuffer(data, dtype=EMBEDDING_DTYPE)
+
+
+def encode_embedding_b64(data: bytes) -> str:
+    """Encode packed embedding bytes as base64."""
+    return base64.b64encode(data).decode("ascii")
+
+
+def decode_embedding_b64(value: str) -> bytes:
+    """Decode a base64 packed embedding, validating that it holds whole float32 values."""
+    try:
+        data = base64.b64decode(value, validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError("face_embedding_b64 must be valid base64")
+    if not data or len(data) % EMBEDDING_DTYPE.itemsize != 0:
+        raise ValueError("face_embedding_b64 must contain a non-empty array of float32 values")
+    return data
+
+
+def resolve_embedding(face_embedding: Optional[Sequence], face_embedding_b64: Optional[str]) -> Optional[np.ndarray]:
+    """Return the embedding from whichever request field was supplied, as float32."""
+    if face_embedding_b64:
+        return unpack_embedding(decode_embedding_b64(face_embedding_b64))
+    if face_embedding:
+        return np.asarray(face_embedding, dtype=np.float32)
+    return None
+
+
+def stored_embedding(packed: Optional[bytes], legacy: Optional[Sequence]) -> Optional[np.ndarray]:
+    """Return a stored embedding, preferring the packed column over legacy float strings."""
+    if packed:
+        return unpack_embedding(packed)
+    if legacy:
+        return np.asarray(legacy, dtype=np.float32)
+    return None
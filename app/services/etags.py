@@ -0,0 +1,94 @@
+"""
+ETag helpers for conditional GETs.
+
+Single resources use a strong ETag derived from their ``updated_at`` column.
+Lists use the version of their collection, a counter in ``collection_versions``,
+combined with the query string so that different pages and filters get
+different tags.
+
+Writes advance the counters in a short transaction of their own right after
+they commit (``commit_and_bump``), so no writer holds a counter's row lock for
+the length of its transaction. The version can therefore lag by one commit: a
+list read between a write's commit and its bump returns the new rows under the
+previous version, and until the bump lands a revalidation with the previous
+ETag is still answered 304. Bumping before the data is visible would be worse,
+pairing a new version with old rows until the next write.
+"""
+
+import hashlib
+import logging
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import CollectionVersion
+
+logger = logging.getLogger(__name__)
+
+PEOPLE = "people"
+CONVERSATIONS = "conversations"
+
+
+def item_etag(updated_at: Optional[datetime], variant: str = "") -> str:
+    """Strong ETag for a single row, from its last-modified time in microseconds.
+
+    ``variant`` distinguishes different representations of the same row.
+    """
+    stamp = f"{int(updated_at.timestamp() * 1_000_000):x}" if updated_at is not None else "0"
+    return f'"{stamp}-{variant}"' if variant else f'"{stamp}"'
+
+
+def list_etag(version: int, request: Request) -> str:
+    """Strong ETag for a list response: collection version plus a digest of the query."""
+    query = "&".join(sorted(f"{key}={value}" for key, value in request.query_params.multi_items()))
+    digest = hashlib.sha1(query.encode()).hexdigest()[:12]
+    return f'"{version:x}-{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header names ``etag`` (or ``*``)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+async def collection_version(db: AsyncSession, name: str) -> int:
+    """Current version of a collection (a primary-key lookup)."""
+    version = await db.scalar(select(CollectionVersion.version).where(CollectionVersion.name == name))
+    return version or 0
+
+
+def bump_statement(*names: str):
+    """Upsert advancing the given collection versions, locking them in sorted order."""
+    rows = [{"name": name, "version": 1} for name in sorted(set(names))]
+    return insert(CollectionVersion).values(rows).on_conflict_do_update(
+        index_elements=[CollectionVersion.name],
+        set_={"version": CollectionVersion.version + 1, "updated_at": func.now()}
+    )
+
+
+async def commit_and_bump(db: AsyncSession, *names: str):
+    """Commit the caller's transaction, then advance collection versions in one of their own.
+
+    The bump holds its row locks only for its own statement. If it fails the
+    write still stands; the versions then lag until the next write.
+    """
+    await db.commit()
+    try:
+        await db.execute(bump_statement(*names))
+        await db.commit()
+    except SQLAlchemyError:
+        logger.exception("Could not advance collection versions %s", ", ".join(names))
+        await db.rollback()
@@ -0,0 +1,135 @@
+"""
+Streaming NDJSON/CSV export of people, conversations and action items.
+
+Rows are read through a server-side cursor (``yield_per``) and written out a
+batch at a time, so memory use does not depend on how much data is exported.
+Each export opens its own session because it keeps reading after the request
+handler has returned its ``StreamingResponse``.
+"""
+
+import base64
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import Select, select
+
+from ..core.database import AsyncSessionLocal
+from ..models import ActionItem, Conversation, Person
+
+EXPORT_BATCH_SIZE = 500
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def people_query(include_face_data: bool) -> Select:
+    columns = [
+        Person.id,
+        Person.name,
+        Person.role,
+        Person.avatar_color,
+        Person.context,
+        Person.interests,
+        Person.open_follow_ups,
+        Person.last_met,
+        Person.last_met_at,
+        Person.met_count,
+        Person.conversation_count,
+        Person.pending_action_count,
+        Person.physical_description,
+        Person.created_at,
+        Person.updated_at,
+    ]
+    if include_face_data:
+        columns += [
+            Person.face_embedding_packed.label("face_embedding_b64"),
+            Person.face_embedding_dim,
+            Person.face_embedding,
+            Person.face_thumbnail.label("face_thumbnail_base64"),
+        ]
+    return select(*columns).order_by(Person.created_at, Person.id)
+
+
+def conversations_query(include_transcripts: bool, person_id: Optional[str]) -> Select:
+    columns = [
+        Conversation.id,
+        Conversation.person_id,
+        Conversation.participants,
+        Conversation.title,
+        Conversation.date,
+        Conversation.occurred_at,
+        Conversation.location,
+        Conversation.summary,
+        Conversation.key_points,
+        Conversation.created_at,
+        Conversation.updated_at,
+    ]
+    if include_transcripts:
+        columns.append(Conversation.full_transcript)
+    query = select(*columns).order_by(Conversation.created_at, Conversation.id)
+    if person_id:
+        query = query.where(Conversation.person_id == person_id)
+    return query
+
+
+def action_items_query(person_id: Optional[str]) -> Select:
+    query = select(
+        ActionItem.id,
+        ActionItem.conversation_id,
+        ActionItem.text,
+        ActionItem.completed,
+        ActionItem.created_at,
+        ActionItem.updated_at,
+    ).order_by(ActionItem.conversation_id, ActionItem.id)
+    if person_id:
+        query = query.join(Conversation, Conversation.id == ActionItem.conversation_id).where(
+            Conversation.person_id == person_id
+        )
+    return query
+
+
+def _jsonable(value):
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _csv_cell(value):
+    value = _jsonable(value)
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return json.dumps(value)
+    return value
+
+
+async def stream_export(query: Select, format: str) -> AsyncIterator[str]:
+    """Yield the rows of ``query`` as NDJSON lines or CSV, one batch per chunk."""
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+        if format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(result.keys())
+            async for partition in result.partitions():
+                writer.writerows([_csv_cell(value) for value in row] for row in partition)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            # Header-only output for an empty export
+            if buffer.tell():
+                yield buffer.getvalue()
+        else:
+            keys = list(result.keys())
+            async for partition in result.partitions():
+                yield "".join(
+                    json.dumps({key: _jsonable(value) for key, value in zip(keys, row)}) + "\n"
+                    for row in partition
+                )
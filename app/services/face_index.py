@@ -0,0 +1,298 @@
+"""
+In-memory face embedding index.
+
+Keeps every known face embedding as a row of a pre-normalized float32 matrix so
+that matching a query is a single matrix-vector product instead of a per-person
+Python loop. The index is built once at startup and kept current by the people
+router after each committed write.
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.metrics import FACE_MATCH_SCANNED
+
+_INITIAL_CAPACITY = 1024
+
+
+def to_unit_vector(embedding: Sequence) -> Optional[np.ndarray]:
+    """Convert an embedding (floats or float strings) to a normalized float32 vector.
+
+    Returns None for empty embeddings. Zero-magnitude embeddings are kept as
+    all-zero vectors so that they score 0.0 against everything.
+    """
+    if embedding is None or len(embedding) == 0:
+        return None
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    if norm == 0.0:
+        return vec
+    return vec / norm
+
+
+class FaceIndex:
+    """Process-local matrix of normalized face embeddings keyed by person id.
+
+    This is the exact backend: every query is scored against every stored face.
+    Subclasses narrow the rows scored per query by overriding ``_score`` and
+    track row placement through the ``_assign_row``/``_release_row``/``_move_row``
+    hooks.
+    """
+
+    backend = "exact"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Database time up to which the index is known to be current
+        self.synced_at: Optional[datetime] = None
+        # Writes recorded while a load is in progress, replayed once it completes
+        self._journal: Optional[List[Tuple[str, Optional[str], Optional[np.ndarray]]]] = None
+        self._reset()
+
+    def _reset(self, dim: Optional[int] = None, capacity: int = _INITIAL_CAPACITY):
+        self.dim = dim
+        self._matrix = np.zeros((capacity, dim or 0), dtype=np.float32)
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._rows = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def person_ids(self) -> List[str]:
+        """Return the ids of every indexed person."""
+        with self._lock:
+            return list(self._ids)
+
+    def vector(self, person_id: str) -> Optional[np.ndarray]:
+        """Return a copy of a person's normalized embedding, or None if not indexed."""
+        with self._lock:
+            row = self._rows.get(person_id)
+            return None if row is None else self._matrix[row].copy()
+
+    def build(self, people: Iterable[Tuple[str, str, Sequence]]):
+        """Rebuild the index from (person_id, name, embedding) tuples."""
+        rows = []
+        for person_id, name, embedding in people:
+            vec = to_unit_vector(embedding)
+            if vec is not None:
+                rows.append((person_id, name, vec))
+
+        # The first embedding fixes the dimension; mismatched rows never matched before either
+        dim = rows[0][2].shape[0] if rows else None
+        rows = [row for row in rows if row[2].shape[0] == dim]
+
+        with self._lock:
+            self._reset(dim, max(_INITIAL_CAPACITY, len(rows)))
+            for person_id, name, vec in rows:
+                self._append(person_id, name, vec)
+            self._rebuilt()
+
+    def upsert(self, person_id: str, name: str, embedding: Optional[Sequence]):
+        """Insert or replace a person's embedding. An empty embedding removes the person."""
+        vec = to_unit_vector(embedding)
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append((person_id, name, vec))
+            self._upsert(person_id, name, vec)
+
+    def remove(self, person_id: str):
+        """Drop a person from the index if present."""
+        with self._lock:
+            if self._journal is not None:
+                self._journal.append((person_id, None, None))
+            self._remove(person_id)
+
+    def reconcile(self, upserts: Iterable[Tuple[str, str, Optional[Sequence]]], removals: Iterable[str]):
+        """Apply changes read from the database while loading, without journaling them.
+
+        The journal only holds writes made by other requests; replaying it
+        afterwards puts those on top of whatever the load read.
+        """
+        vecs = [(person_id, name, to_unit_vector(embedding)) for person_id, name, embedding in upserts]
+        with self._lock:
+            for person_id in removals:
+                self._remove(person_id)
+            for person_id, name, vec in vecs:
+                self._upsert(person_id, name, vec)
+
+    def start_journal(self):
+        """Record upserts and removals from now on, so a load can replay them afterwards.
+
+        Call before reading the rows to load; writes committed after that read
+        are then either in the journal or applied afterwards.
+        """
+        with self._lock:
+            self._journal = []
+
+    def replay_journal(self):
+        """Re-apply the writes recorded since ``start_journal`` and stop recording."""
+        with self._lock:
+            journal, self._journal = self._journal or [], None
+            for person_id, name, vec in journal:
+                self._upsert(person_id, name, vec)
+
+    def match(self, embedding: Sequence) -> Tuple[Optional[str], Optional[str], float]:
+        """Return (person_id, name, similarity) of the closest face.
+
+        The person is None when the index is empty, the query has a different
+        dimension, or no stored face has a positive similarity.
+        """
+        candidates = self.search([embedding], 1)[0]
+        if not candidates:
+            return None, None, 0.0
+        return candidates[0]
+
+    def search(self, embeddings: Sequence[Sequence], k: int) -> List[List[Tuple[str, str, float]]]:
+        """Return up to k (person_id, name, similarity) candidates per query, best first.
+
+        All queries are scored together. Only candidates with a positive
+        similarity are returned; unusable queries get an empty list.
+        """
+        queries = [to_unit_vector(embedding) for embedding in embeddings]
+        results: List[List[Tuple[str, str, float]]] = [[] for _ in queries]
+        scanned = []
+
+        with self._lock:
+            usable = [i for i, q in enumerate(queries) if q is not None and q.shape[0] == self.dim]
+            if not self._ids or not usable:
+                return results
+
+            scored = self._score(np.stack([queries[i] for i in usable]))
+            for i, (cols, scores) in zip(usable, scored):
+                scanned.append(scores.shape[0])
+                n = min(k, scores.shape[0])
+                if n == 0:
+                    continue
+                top = np.argpartition(-scores, n - 1)[:n] if n < scores.shape[0] else np.arange(n)
+                top = top[np.argsort(-scores[top], kind="stable")]
+                results[i] = [
+                    (self._ids[row], self._names[row], min(float(scores[j]), 1.0))
+                    for j, row in zip(top, top if cols is None else cols[top])
+                    if scores[j] > 0.0
+                ]
+
+        for count in scanned:
+            FACE_MATCH_SCANNED.observe(count)
+        return results
+
+    def save(self, path: str):
+        """Write a snapshot of the index to ``path`` atomically."""
+        with self._lock:
+            count = len(self._ids)
+            arrays = {
+                "backend": np.array(self.backend),
+                "matrix": self._matrix[:count].copy(),
+                "ids": np.array(self._ids, dtype=str),
+                "names": np.array(self._names, dtype=str),
+                "synced_at": np.array(self.synced_at.isoformat() if self.synced_at else ""),
+            }
+            arrays.update(self._snapshot_extra())
+
+        # Per process, so workers saving at once each rename a whole file into place
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> bool:
+        """Replace the index with a snapshot written by ``save``. Returns False if none exists."""
+        if not os.path.exists(path):
+            return False
+
+        with np.load(path, allow_pickle=False) as snapshot:
+            matrix = snapshot["matrix"]
+            ids = snapshot["ids"].tolist()
+            names = snapshot["names"].tolist()
+            synced_at = str(snapshot["synced_at"])
+            extra = {key: snapshot[key] for key in snapshot.files}
+
+        with self._lock:
+            count = len(ids)
+            self._reset(matrix.shape[1] if count else None, max(_INITIAL_CAPACITY, count))
+            self._matrix[:count] = matrix
+            self._ids = ids
+            self._names = names
+            self._rows = {person_id: row for row, person_id in enumerate(ids)}
+            self.synced_at = datetime.fromisoformat(synced_at) if synced_at else None
+            self._restore_extra(extra)
+        return True
+
+    def _score(self, queries: np.ndarray) -> List[Tuple[Optional[np.ndarray], np.ndarray]]:
+        """Score each query, returning (rows, scores) pairs; rows None means every row."""
+        scores = queries @ self._matrix[:len(self._ids)].T
+        return [(None, row_scores) for row_scores in scores]
+
+    def _assign_row(self, row: int):
+        """Hook called after a row's embedding is written."""
+
+    def _release_row(self, row: int):
+        """Hook called before a row is removed."""
+
+    def _move_row(self, src: int, dst: int):
+        """Hook called after row ``src`` is moved into slot ``dst``."""
+
+    def _rebuilt(self):
+        """Hook called after a full build, with the lock held."""
+
+    def _snapshot_extra(self) -> dict:
+        return {}
+
+    def _restore_extra(self, snapshot: dict):
+        pass
+
+    def _upsert(self, person_id: str, name: Optional[str], vec: Optional[np.ndarray]):
+        if vec is None:
+            self._remove(person_id)
+            return
+        if self.dim is None:
+            self._reset(vec.shape[0])
+        if vec.shape[0] != self.dim:
+            self._remove(person_id)
+            return
+
+        row = self._rows.get(person_id)
+        if row is None:
+            self._append(person_id, name, vec)
+        else:
+            self._matrix[row] = vec
+            self._names[row] = name
+            self._assign_row(row)
+
+    def _append(self, person_id: str, name: str, vec: np.ndarray):
+        count = len(self._ids)
+        if count == self._matrix.shape[0]:
+            self._grow(max(_INITIAL_CAPACITY, count * 2))
+
+        self._matrix[count] = vec
+        self._ids.append(person_id)
+        self._names.append(name)
+        self._rows[person_id] = count
+        self._assign_row(count)
+
+    def _grow(self, capacity: int):
+        count = len(self._ids)
+        grown = np.zeros((capacity, self.dim), dtype=np.float32)
+        grown[:count] = self._matrix[:count]
+        self._matrix = grown
+
+    def _remove(self, person_id: str):
+        row = self._rows.pop(person_id, None)
+        if row is None:
+            return
+        self._release_row(row)
+
+        # Move the last row into the freed slot to keep the matrix dense
+        last = len(self._ids) - 1
+        if row != last:
+            self._matrix[row] = self._matrix[last]
+            self._ids[row] = self._ids[last]
+            self._names[row] = self._names[last]
+            self._rows[self._ids[row]] = row
+            self._move_row(last, row)
+        self._ids.pop()
+        self._names.pop()
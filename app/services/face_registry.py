@@ -0,0 +1,146 @@
+"""
+The process-wide face index used by the people router.
+
+Chooses the backend from settings, loads it (from a snapshot when
+``FACE_INDEX_PATH`` is set, catching up on rows changed since the snapshot) and
+writes the snapshot back on shutdown. With the ``shared`` backend the index is
+one memory-mapped file shared by every worker process; a worker starting after
+another has filled it only catches up on rows changed since. Loading starts in the background at
+startup and is retried by the first match request if it failed, so the API can
+start while the database is still unreachable.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models import Person
+from .embeddings import stored_embedding
+from .face_index import FaceIndex
+from .ivf_index import IVFFaceIndex
+from .shared_index import SharedFaceIndex
+
+_RECONCILE_BATCH = 1000
+
+
+def create_face_index() -> FaceIndex:
+    """Create an empty index for the configured backend."""
+    if settings.FACE_INDEX_BACKEND == "exact":
+        return FaceIndex()
+    if settings.FACE_INDEX_BACKEND == "ivf":
+        return IVFFaceIndex(
+            nlist=settings.FACE_INDEX_IVF_LISTS,
+            nprobe=settings.FACE_INDEX_IVF_PROBES,
+            min_train_size=settings.FACE_INDEX_IVF_MIN_TRAIN
+        )
+    if settings.FACE_INDEX_BACKEND == "shared":
+        return SharedFaceIndex(settings.FACE_INDEX_SHARED_PATH or _default_shared_path())
+    raise ValueError(f"Unknown FACE_INDEX_BACKEND: {settings.FACE_INDEX_BACKEND}")
+
+
+def _default_shared_path() -> str:
+    # tmpfs where available, so the shared file never causes disk writes
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    # One file per database, so deployments sharing a host never read each other's faces
+    digest = hashlib.sha1(settings.DATABASE_URL.encode()).hexdigest()[:12]
+    return os.path.join(directory, f"conversa-face-index-{digest}")
+
+
+face_index = create_face_index()
+
+_load_lock = threading.Lock()
+_loaded = threading.Event()
+
+_has_face = or_(Person.face_embedding_packed.isnot(None), Person.face_embedding.isnot(None))
+
+
+def load_face_index(db: Session):
+    """Bring the shared index up to date with the database."""
+    if isinstance(face_index, SharedFaceIndex):
+        # Other workers' writes wait for the lock and land on top of the loaded rows
+        with face_index.exclusive():
+            _load(db)
+    else:
+        # Writes made while loading are journaled and replayed over the loaded rows
+        face_index.start_journal()
+        try:
+            _load(db)
+        finally:
+            face_index.replay_journal()
+    _loaded.set()
+
+
+def _load(db: Session):
+    synced_at = db.execute(select(func.now())).scalar()
+
+    # A shared index already filled by another worker (or an earlier run) only needs catching up
+    filled = face_index.synced_at is not None
+    if filled or (settings.FACE_INDEX_PATH and face_index.load(settings.FACE_INDEX_PATH)):
+        _catch_up(db, face_index)
+    else:
+        rows = (
+            db.query(Person.id, Person.name, Person.face_embedding_packed, Person.face_embedding)
+            .filter(_has_face)
+            .yield_per(_RECONCILE_BATCH)
+        )
+        face_index.build(
+            (person_id, name, stored_embedding(packed, legacy))
+            for person_id, name, packed, legacy in rows
+        )
+
+    face_index.synced_at = synced_at
+
+
+def face_index_loaded() -> bool:
+    """Whether the shared index has been loaded from the database."""
+    return _loaded.is_set()
+
+
+def ensure_face_index() -> FaceIndex:
+    """Return the shared index, loading it first if that has not happened yet.
+
+    Raises the database error if it cannot be loaded.
+    """
+    if not _loaded.is_set():
+        with _load_lock:
+            if not _loaded.is_set():
+                with SessionLocal() as db:
+                    load_face_index(db)
+    return face_index
+
+
+def save_face_index():
+    """Snapshot the shared index if persistence is configured and it was loaded."""
+    # An index that never loaded is empty; writing it would clobber a good snapshot
+    if settings.FACE_INDEX_PATH and _loaded.is_set():
+        face_index.save(settings.FACE_INDEX_PATH)
+
+
+def _catch_up(db: Session, index: FaceIndex):
+    """Apply changes made since a loaded snapshot, fetching only changed embeddings."""
+    present = set()
+    stale = []
+    for person_id, updated_at in db.query(Person.id, Person.updated_at).filter(_has_face).yield_per(10000):
+        present.add(person_id)
+        if index.synced_at is None or updated_at is None or updated_at >= index.synced_at:
+            stale.append(person_id)
+
+    removals = [person_id for person_id in index.person_ids() if person_id not in present]
+    index.reconcile([], removals)
+
+    for start in range(0, len(stale), _RECONCILE_BATCH):
+        batch = stale[start:start + _RECONCILE_BATCH]
+        rows = (
+            db.query(Person.id, Person.name, Person.face_embedding_packed, Person.face_embedding)
+            .filter(Person.id.in_(batch))
+        )
+        index.reconcile(
+            [(person_id, name, stored_embedding(packed, legacy)) for person_id, name, packed, legacy in rows],
+            []
+        )
@@ -0,0 +1,185 @@
+"""
+Temporal smoothing of face matches across streamed camera frames.
+
+A ``FaceTracker`` serves one stream. Each track (a face the client follows
+across frames, named by its track id) keeps an exponential moving average of
+its candidates' similarities, so a single noisy frame neither flips an identity
+nor drops it. Once a track has kept the same identity for ``confirm_frames``
+scored frames, later frames are compared with that person's stored face only
+(one dot product) instead of searching the whole index. The track is searched
+again every ``rescore_frames`` frames, or as soon as that similarity falls
+below the threshold.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .face_index import FaceIndex, to_unit_vector
+
+# Candidates remembered per track, and the smoothed score below which one is forgotten
+_TOP_K = 3
+_MIN_SCORE = 0.05
+
+
+class TrackResult(NamedTuple):
+    track_id: Optional[str]
+    person_id: Optional[str]
+    person_name: Optional[str]
+    confidence: float
+    matched: bool
+    stable: bool
+    rescored: bool
+
+
+class Track:
+    """Smoothed candidate scores and identity for one tracked face."""
+
+    def __init__(self):
+        self.scores: Dict[str, float] = {}
+        self.names: Dict[str, str] = {}
+        self.person_id: Optional[str] = None
+        self.streak = 0
+        # The identified person's stored unit vector, set once the identity is stable
+        self.vector: Optional[np.ndarray] = None
+        self.since_rescore = 0
+        self.last_seen = 0.0
+
+
+class FaceTracker:
+    """Per-stream track state; not thread-safe, so feed it one frame at a time."""
+
+    def __init__(
+        self,
+        index: FaceIndex,
+        threshold: float,
+        smoothing: float,
+        confirm_frames: int,
+        rescore_frames: int,
+        track_ttl: float,
+        max_tracks: int
+    ):
+        self.index = index
+        self.threshold = threshold
+        self.smoothing = smoothing
+        self.confirm_frames = confirm_frames
+        self.rescore_frames = rescore_frames
+        self.track_ttl = track_ttl
+        self.max_tracks = max_tracks
+        self.tracks: Dict[str, Track] = {}
+
+    def process(self, faces: Sequence[Tuple[Optional[str], Sequence]], now: float) -> List[TrackResult]:
+        """Match one frame's (track_id, embedding) pairs; ``now`` is a monotonic time in seconds."""
+        self._expire(now)
+        results: List[Optional[TrackResult]] = [None] * len(faces)
+        to_search = []
+
+        for i, (track_id, embedding) in enumerate(faces):
+            query = to_unit_vector(embedding)
+            track = self._track(track_id, now) if track_id is not None else None
+            if track is not None and query is not None and self._reuse(track, query):
+                results[i] = self._result(track_id, track, rescored=False)
+            else:
+                to_search.append((i, track_id, track, query))
+
+        if to_search:
+            searched = self.index.search([query for _, _, _, query in to_search], _TOP_K)
+            for (i, track_id, track, _), candidates in zip(to_search, searched):
+                if track is None:
+                    results[i] = self._untracked(candidates)
+                else:
+                    self._update(track, candidates)
+                    results[i] = self._result(track_id, track, rescored=True)
+
+        return results
+
+    def _track(self, track_id: str, now: float) -> Track:
+        track = self.tracks.get(track_id)
+        if track is None:
+            if len(self.tracks) >= self.max_tracks:
+                oldest = min(self.tracks, key=lambda key: self.tracks[key].last_seen)
+                del self.tracks[oldest]
+            track = self.tracks[track_id] = Track()
+        track.last_seen = now
+        return track
+
+    def _expire(self, now: float):
+        for track_id in [key for key, track in self.tracks.items() if now - track.last_seen > self.track_ttl]:
+            del self.tracks[track_id]
+
+    def _reuse(self, track: Track, query: np.ndarray) -> bool:
+        """Score against the identified person only, if the track is settled and still agrees."""
+        vector = track.vector
+        if vector is None or track.since_rescore >= self.rescore_frames or vector.shape != query.shape:
+            return False
+        similarity = float(query @ vector)
+        if similarity < self.threshold:
+            return False
+
+        self._smooth(track, track.person_id, similarity)
+        track.streak += 1
+        track.since_rescore += 1
+        return True
+
+    def _update(self, track: Track, candidates: List[Tuple[str, str, float]]):
+        """Fold a full search into the track's scores and re-pick its identity."""
+        seen = {person_id for person_id, _, _ in candidates}
+        for person_id in list(track.scores):
+            if person_id not in seen:
+                track.scores[person_id] *= 1.0 - self.smoothing
+                if track.scores[person_id] < _MIN_SCORE:
+                    del track.scores[person_id]
+                    track.names.pop(person_id, None)
+        for person_id, name, similarity in candidates:
+            track.names[person_id] = name
+            self._smooth(track, person_id, similarity)
+
+        best = max(track.scores, key=track.scores.get) if track.scores else None
+        if best is not None and best == track.person_id:
+            track.streak += 1
+        else:
+            track.person_id = best
+            track.streak = 1 if best is not None else 0
+            track.vector = None
+
+        track.since_rescore = 0
+        if track.vector is None and self._stable(track):
+            track.vector = self.index.vector(track.person_id)
+
+    def _smooth(self, track: Track, person_id: str, similarity: float):
+        previous = track.scores.get(person_id)
+        # A new candidate starts at its first score, so identity settles on the first good frame
+        track.scores[person_id] = similarity if previous is None else (
+            self.smoothing * similarity + (1.0 - self.smoothing) * previous
+        )
+
+    def _stable(self, track: Track) -> bool:
+        return (
+            track.person_id is not None
+            and track.streak >= self.confirm_frames
+            and track.scores[track.person_id] >= self.threshold
+        )
+
+    def _result(self, track_id: str, track: Track, rescored: bool) -> TrackResult:
+        if track.person_id is None:
+            return TrackResult(track_id, None, None, 0.0, False, False, rescored)
+        confidence = min(track.scores[track.person_id], 1.0)
+        matched = confidence >= self.threshold
+        return TrackResult(
+            track_id,
+            track.person_id if matched else None,
+            track.names.get(track.person_id) if matched else None,
+            confidence,
+            matched,
+            matched and self._stable(track),
+            rescored
+        )
+
+    def _untracked(self, candidates: List[Tuple[str, str, float]]) -> TrackResult:
+        if not candidates:
+            return TrackResult(None, None, None, 0.0, False, False, True)
+        person_id, name, similarity = candidates[0]
+        matched = similarity >= self.threshold
+        return TrackResult(
+            None, person_id if matched else None, name if matched else None, similarity, matched, False, True
+        )
@@ -0,0 +1,190 @@
+"""
+Inverted-file (IVF) approximate face index.
+
+Faces are clustered around ``nlist`` centroids with spherical k-means. A query
+is compared to the centroids first and then scored only against the faces in
+its ``nprobe`` closest clusters, so the work per query grows with
+N * nprobe / nlist instead of N. Raising ``nprobe`` trades latency for recall;
+``nprobe >= nlist`` is exact.
+"""
+
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .face_index import FaceIndex, _INITIAL_CAPACITY
+
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLE_PER_LIST = 64
+_ASSIGN_CHUNK = 65536
+
+
+class IVFFaceIndex(FaceIndex):
+    """Face index that probes a subset of k-means clusters per query.
+
+    Until ``min_train_size`` faces are indexed the clusters are not trained and
+    every query is scored exactly. Faces added after training join their
+    nearest existing cluster; call ``train`` (or rebuild) to re-cluster after
+    large growth.
+    """
+
+    backend = "ivf"
+
+    def __init__(self, nlist: int = 0, nprobe: int = 16, min_train_size: int = 10000, seed: int = 0):
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.min_train_size = min_train_size
+        self._rng = np.random.default_rng(seed)
+        self._building = False
+        super().__init__()
+
+    def build(self, people):
+        # Train once on the full set rather than when the threshold is crossed mid-build
+        self._building = True
+        try:
+            super().build(people)
+        finally:
+            self._building = False
+
+    def _reset(self, dim=None, capacity=_INITIAL_CAPACITY):
+        super()._reset(dim, capacity)
+        self._centroids: Optional[np.ndarray] = None
+        # Cluster of each row (-1 if unassigned) and its position in that cluster's member list
+        self._assign = np.full(capacity, -1, dtype=np.int32)
+        self._position = np.zeros(capacity, dtype=np.int64)
+        self._members: List[List[int]] = []
+        self._member_arrays: List[Optional[np.ndarray]] = []
+
+    def train(self):
+        """Re-cluster every indexed face. Called automatically once enough faces exist."""
+        with self._lock:
+            self._train()
+
+    def _rebuilt(self):
+        if len(self._ids) >= self.min_train_size:
+            self._train()
+
+    def _train(self):
+        count = len(self._ids)
+        if count == 0:
+            self._centroids = None
+            return
+
+        nlist = self.nlist or int(math.sqrt(count))
+        nlist = max(1, min(nlist, count))
+        data = self._matrix[:count]
+
+        sample_size = min(count, nlist * _KMEANS_SAMPLE_PER_LIST)
+        sample = data[self._rng.choice(count, sample_size, replace=False)]
+        centroids = sample[self._rng.choice(sample_size, nlist, replace=False)].copy()
+
+        for _ in range(_KMEANS_ITERATIONS):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+
+            # Re-seed empty clusters from random sample points
+            empty = norms[:, 0] == 0
+            if empty.any():
+                sums[empty] = sample[self._rng.choice(sample_size, int(empty.sum()))]
+                norms[empty] = np.linalg.norm(sums[empty], axis=1, keepdims=True)
+            centroids = sums / np.maximum(norms, 1e-12)
+
+        self._centroids = centroids.astype(np.float32)
+        self._members = [[] for _ in range(nlist)]
+        self._member_arrays = [None] * nlist
+        for start in range(0, count, _ASSIGN_CHUNK):
+            chunk = data[start:start + _ASSIGN_CHUNK]
+            self._assign[start:start + chunk.shape[0]] = np.argmax(chunk @ self._centroids.T, axis=1)
+        self._index_members()
+
+    def _index_members(self):
+        """Rebuild every cluster's member list from the row assignments."""
+        for row, cluster in enumerate(self._assign[:len(self._ids)].tolist()):
+            self._position[row] = len(self._members[cluster])
+            self._members[cluster].append(row)
+
+    def _assign_row(self, row: int):
+        if self._centroids is None:
+            if not self._building and len(self._ids) >= self.min_train_size:
+                self._train()
+            return
+
+        if self._assign[row] >= 0:
+            self._release_row(row)
+        cluster = int(np.argmax(self._centroids @ self._matrix[row]))
+        self._assign[row] = cluster
+        self._position[row] = len(self._members[cluster])
+        self._members[cluster].append(row)
+        self._member_arrays[cluster] = None
+
+    def _release_row(self, row: int):
+        cluster = int(self._assign[row])
+        if cluster < 0:
+            return
+        members = self._members[cluster]
+        last = members.pop()
+        if last != row:
+            members[self._position[row]] = last
+            self._position[last] = self._position[row]
+        self._assign[row] = -1
+        self._member_arrays[cluster] = None
+
+    def _move_row(self, src: int, dst: int):
+        cluster = int(self._assign[src])
+        if cluster < 0:
+            return
+        self._members[cluster][self._position[src]] = dst
+        self._position[dst] = self._position[src]
+        self._assign[dst] = cluster
+        self._assign[src] = -1
+        self._member_arrays[cluster] = None
+
+    def _grow(self, capacity: int):
+        super()._grow(capacity)
+        size = self._assign.shape[0]
+        assign = np.full(capacity, -1, dtype=np.int32)
+        assign[:size] = self._assign
+        position = np.zeros(capacity, dtype=np.int64)
+        position[:size] = self._position
+        self._assign, self._position = assign, position
+
+    def _cluster_rows(self, cluster: int) -> np.ndarray:
+        rows = self._member_arrays[cluster]
+        if rows is None:
+            rows = np.array(self._members[cluster], dtype=np.int64)
+            self._member_arrays[cluster] = rows
+        return rows
+
+    def _score(self, queries: np.ndarray) -> List[Tuple[Optional[np.ndarray], np.ndarray]]:
+        nlist = 0 if self._centroids is None else self._centroids.shape[0]
+        if nlist == 0 or self.nprobe >= nlist:
+            return super()._score(queries)
+
+        centroid_scores = queries @ self._centroids.T
+        probes = np.argpartition(-centroid_scores, self.nprobe - 1, axis=1)[:, :self.nprobe]
+
+        scored = []
+        for query, lists in zip(queries, probes):
+            rows = np.concatenate([self._cluster_rows(cluster) for cluster in lists])
+            scored.append((rows, self._matrix[rows] @ query))
+        return scored
+
+    def _snapshot_extra(self) -> dict:
+        if self._centroids is None:
+            return {}
+        return {"centroids": self._centroids, "assign": self._assign[:len(self._ids)].copy()}
+
+    def _restore_extra(self, snapshot: dict):
+        count = len(self._ids)
+        if "centroids" in snapshot and snapshot["assign"].shape[0] == count:
+            self._centroids = snapshot["centroids"]
+            nlist = self._centroids.shape[0]
+            self._members = [[] for _ in range(nlist)]
+            self._member_arrays = [None] * nlist
+            self._assign[:count] = snapshot["assign"]
+            self._index_members()
+        elif count >= self.min_train_size:
+            self._train()
@@ -0,0 +1,470 @@
+"""
+Face index shared by every worker process through a memory-mapped file.
+
+The normalized embedding matrix, person ids and names live in one file
+(normally on tmpfs, e.g. ``/dev/shm``) that every uvicorn worker maps, so the
+faces are held in memory once rather than once per worker, and searches score
+the mapped matrix directly without copying it.
+
+Writers serialize on an ``fcntl`` lock on a side file and bracket each change
+with a sequence counter (a seqlock): it is odd while a change is being written
+and advances by two per change, so ``version`` counts changes. Readers take no
+lock; they read the counter before and after scoring and retry if it moved.
+A write is therefore visible to every worker on its next search, and a search
+that overlaps a write retries rather than returning a half-written row.
+
+Changes that alter the layout (the first face fixing the dimension, growing
+past the capacity, a full rebuild) write a complete new file, rename it over
+the old one and mark the old one superseded; each process then maps the new
+file on its next access. POSIX only.
+"""
+
+import fcntl
+import logging
+import mmap
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.metrics import FACE_MATCH_SCANNED
+from .face_index import FaceIndex, _INITIAL_CAPACITY, to_unit_vector
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = 0x43465849  # "CFXI"
+# Header fields (int64 each); the header is padded to a page so the matrix is aligned
+_MAGIC_FIELD, _GENERATION, _SEQ, _COUNT, _DIM, _CAPACITY, _SYNCED_AT = range(7)
+_HEADER_FIELDS = 8
+_HEADER_BYTES = 4096
+_NO_SYNC = -1
+
+# Fixed-width UTF-8 slots per row; longer names are cut at a character boundary
+_ID_BYTES = 64
+_NAME_BYTES = 256
+
+# Lock-free read attempts before a search waits for the writer's lock instead
+_READ_RETRIES = 100
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class _Mapping:
+    """Numpy views over one generation of the shared file."""
+
+    def __init__(self, fd: int, dim: Optional[int] = None, capacity: int = 0):
+        if dim is not None:
+            # A new file: size it and write the layout before mapping the arrays
+            os.ftruncate(fd, _HEADER_BYTES + capacity * (dim * 4 + _ID_BYTES + _NAME_BYTES))
+        stat = os.fstat(fd)
+        self.inode = stat.st_ino
+        self.mm = mmap.mmap(fd, stat.st_size)
+        self.header = np.frombuffer(self.mm, np.int64, _HEADER_FIELDS)
+        if dim is not None:
+            self.header[_MAGIC_FIELD] = _MAGIC
+            self.header[_DIM] = dim
+            self.header[_CAPACITY] = capacity
+            self.header[_SYNCED_AT] = _NO_SYNC
+        elif self.header[_MAGIC_FIELD] != _MAGIC:
+            raise ValueError("not a shared face index file")
+
+        dim, capacity = int(self.header[_DIM]), int(self.header[_CAPACITY])
+        offset = _HEADER_BYTES
+        self.matrix = np.frombuffer(self.mm, np.float32, capacity * dim, offset).reshape(capacity, dim)
+        offset += capacity * dim * 4
+        self.ids = np.frombuffer(self.mm, f"S{_ID_BYTES}", capacity, offset)
+        offset += capacity * _ID_BYTES
+        self.names = np.frombuffer(self.mm, f"S{_NAME_BYTES}", capacity, offset)
+        self.generation = int(self.header[_GENERATION])
+
+    @property
+    def current(self) -> bool:
+        return int(self.header[_GENERATION]) == self.generation
+
+    @property
+    def seq(self) -> int:
+        return int(self.header[_SEQ])
+
+    @property
+    def count(self) -> int:
+        return int(self.header[_COUNT])
+
+    @property
+    def dim(self) -> int:
+        return int(self.header[_DIM])
+
+
+class _FileLock:
+    """Reentrant lock held across threads and processes: a thread lock plus ``flock``."""
+
+    def __init__(self, path: str, on_acquire):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._on_acquire = on_acquire
+        self._fd: Optional[int] = None
+        self._depth = 0
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                if self._fd is None:
+                    self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+        if self._depth == 1:
+            try:
+                self._on_acquire()
+            except BaseException:
+                self.__exit__(None, None, None)
+                raise
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if self._depth == 0:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._thread_lock.release()
+
+
+def _encode_name(name: Optional[str]) -> bytes:
+    return (name or "").encode("utf-8")[:_NAME_BYTES]
+
+
+def _decode(value: bytes) -> str:
+    # A name cut mid-character loses only the partial character
+    return value.decode("utf-8", "ignore")
+
+
+class SharedFaceIndex(FaceIndex):
+    """Exact face index whose rows live in a file mapped by every worker.
+
+    Searches are lock-free. Writes take a lock shared with the other workers;
+    ``exclusive()`` holds it across a whole load so that writes from other
+    workers wait and land after it.
+    """
+
+    backend = "shared"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = _FileLock(f"{path}.lock", self._attach)
+        self._journal = None
+        self._view: Optional[_Mapping] = None
+        # id -> row for writers, valid while the shared version is _rows_version
+        self._rows = {}
+        self._rows_version = -1
+        # (mapping, seq, encoded id -> row) for lock-free lookups
+        self._lookup: Tuple[Optional[_Mapping], int, dict] = (None, -1, {})
+
+    # -- Reading ---------------------------------------------------------------
+
+    def __len__(self) -> int:
+        view = self._current()
+        return view.count if view is not None else 0
+
+    @property
+    def dim(self) -> Optional[int]:
+        view = self._current()
+        return (view.dim or None) if view is not None else None
+
+    @property
+    def version(self) -> int:
+        """Number of changes written to the shared file (across every generation)."""
+        view = self._current()
+        return view.seq // 2 if view is not None else 0
+
+    @property
+    def synced_at(self) -> Optional[datetime]:
+        view = self._current()
+        if view is None or view.header[_SYNCED_AT] == _NO_SYNC:
+            return None
+        return _EPOCH + timedelta(microseconds=int(view.header[_SYNCED_AT]))
+
+    @synced_at.setter
+    def synced_at(self, value: Optional[datetime]):
+        with self._lock:
+            self._view.header[_SYNCED_AT] = (
+                _NO_SYNC if value is None else (value - _EPOCH) // timedelta(microseconds=1)
+            )
+
+    def person_ids(self) -> List[str]:
+        with self._lock:
+            view = self._view
+            return [_decode(value) for value in view.ids[:view.count]]
+
+    def vector(self, person_id: str) -> Optional[np.ndarray]:
+        key = person_id.encode("utf-8")
+        return self._read(lambda view: self._vector(view, key))
+
+    def search(self, embeddings: Sequence[Sequence], k: int) -> List[List[Tuple[str, str, float]]]:
+        queries = [to_unit_vector(embedding) for embedding in embeddings]
+        results, scanned = self._read(lambda view: self._search(view, queries, k))
+        for count in scanned:
+            FACE_MATCH_SCANNED.observe(count)
+        return results
+
+    def _vector(self, view: _Mapping, key: bytes) -> Optional[np.ndarray]:
+        # Rebuilt after any write; a map built while one overlapped is keyed to a seq that never recurs
+        cached, seq, rows = self._lookup
+        if cached is not view or seq != view.seq:
+            seq = view.seq
+            rows = {value: row for row, value in enumerate(view.ids[:view.count].tolist())}
+            self._lookup = (view, seq, rows)
+        row = rows.get(key)
+        return view.matrix[row].copy() if row is not None else None
+
+    def _search(self, view: _Mapping, queries, k: int):
+        results: List[List[Tuple[str, str, float]]] = [[] for _ in queries]
+        scanned = []
+        count = view.count
+        usable = [i for i, q in enumerate(queries) if q is not None and q.shape[0] == view.dim]
+        if not count or not usable:
+            return results, scanned
+
+        scores = np.stack([queries[i] for i in usable]) @ view.matrix[:count].T
+        for i, row_scores in zip(usable, scores):
+            scanned.append(count)
+            n = min(k, count)
+            top = np.argpartition(-row_scores, n - 1)[:n] if n < count else np.arange(n)
+            top = top[np.argsort(-row_scores[top], kind="stable")]
+            results[i] = [
+                (_decode(view.ids[row]), _decode(view.names[row]), min(float(row_scores[row]), 1.0))
+                for row in top
+                if row_scores[row] > 0.0
+            ]
+        return results, scanned
+
+    def _read(self, read):
+        """Run ``read(view)`` without locking, retrying if a write overlapped it."""
+        for _ in range(_READ_RETRIES):
+            view = self._current()
+            if view is None:
+                with self._lock:
+                    return read(self._view)
+            seq = view.seq
+            if seq % 2:
+                time.sleep(0)
+                continue
+            try:
+                result = read(view)
+            except (IndexError, ValueError):
+                # Rows read mid-write can be inconsistent; only a stable read's errors are real
+                if view.seq == seq:
+                    raise
+                continue
+            if view.seq == seq:
+                return result
+        with self._lock:
+            return read(self._view)
+
+    def _current(self) -> Optional[_Mapping]:
+        """The mapping of the live file, or None before any worker has created it."""
+        view = self._view
+        if view is not None and view.current:
+            return view
+        try:
+            fd = os.open(self.path, os.O_RDWR)
+        except FileNotFoundError:
+            return None
+        try:
+            self._view = _Mapping(fd)
+        finally:
+            os.close(fd)
+        return self._view
+
+    # -- Writing (with the lock held) ------------------------------------------
+
+    @contextmanager
+    def exclusive(self):
+        """Hold the writers' lock, in this process and every other one."""
+        with self._lock:
+            yield
+
+    def build(self, people: Iterable[Tuple[str, str, Sequence]]):
+        rows = []
+        for person_id, name, embedding in people:
+            vec = to_unit_vector(embedding)
+            if vec is not None:
+                rows.append((person_id, name, vec))
+
+        dim = rows[0][2].shape[0] if rows else None
+        rows = [row for row in rows if row[2].shape[0] == dim and self._storable(row[0])]
+
+        with self._lock:
+            if rows:
+                self._publish(
+                    dim,
+                    max(_INITIAL_CAPACITY, len(rows)),
+                    np.stack([vec for _, _, vec in rows]),
+                    np.array([person_id.encode("utf-8") for person_id, _, _ in rows], dtype=f"S{_ID_BYTES}"),
+                    np.array([_encode_name(name) for _, name, _ in rows], dtype=f"S{_NAME_BYTES}")
+                )
+            else:
+                self._publish(0, 0)
+            self._rows = {person_id: row for row, (person_id, _, _) in enumerate(rows)}
+            self._rows_version = self.version
+
+    def save(self, path: str):
+        with self._lock:
+            view = self._view
+            count = view.count
+            synced_at = self.synced_at
+            arrays = {
+                "backend": np.array(self.backend),
+                "matrix": view.matrix[:count].copy(),
+                "ids": np.array([_decode(value) for value in view.ids[:count]], dtype=str),
+                "names": np.array([_decode(value) for value in view.names[:count]], dtype=str),
+                "synced_at": np.array(synced_at.isoformat() if synced_at else ""),
+            }
+
+        # Per process, so workers saving at once each rename a whole file into place
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> bool:
+        if not os.path.exists(path):
+            return False
+
+        with np.load(path, allow_pickle=False) as snapshot:
+            matrix = snapshot["matrix"]
+            ids = snapshot["ids"].tolist()
+            names = snapshot["names"].tolist()
+            synced_at = str(snapshot["synced_at"])
+
+        with self._lock:
+            self.build(zip(ids, names, matrix))
+            self.synced_at = datetime.fromisoformat(synced_at) if synced_at else None
+        return True
+
+    def _attach(self):
+        """Map the live file once the lock is held, creating an empty one if there is none."""
+        view = self._current()
+        if view is None:
+            self._publish(0, 0)
+        elif os.stat(self.path).st_ino != view.inode:
+            # Replaced by a writer that died before marking this file superseded
+            self._view = None
+            self._current()
+
+    @contextmanager
+    def _change(self):
+        """Bracket one change so that lock-free readers retry around it."""
+        view = self._view
+        view.header[_SEQ] += 1
+        try:
+            yield view
+        finally:
+            view.header[_SEQ] += 1
+            self._rows_version = view.seq // 2
+
+    def _row_map(self) -> dict:
+        """id -> row, rebuilt when another process has written since this one last did."""
+        if self._rows_version != self.version:
+            view = self._view
+            self._rows = {_decode(value): row for row, value in enumerate(view.ids[:view.count])}
+            self._rows_version = self.version
+        return self._rows
+
+    def _storable(self, person_id: str) -> bool:
+        if len(person_id.encode("utf-8")) <= _ID_BYTES:
+            return True
+        logger.warning("Face of person %r not indexed: ids longer than %d bytes do not fit", person_id, _ID_BYTES)
+        return False
+
+    def _upsert(self, person_id: str, name: Optional[str], vec: Optional[np.ndarray]):
+        if vec is None or not self._storable(person_id):
+            self._remove(person_id)
+            return
+        if not self._view.dim:
+            self._publish(vec.shape[0], _INITIAL_CAPACITY)
+        if vec.shape[0] != self._view.dim:
+            self._remove(person_id)
+            return
+
+        rows = self._row_map()
+        row = rows.get(person_id)
+        if row is None:
+            row = self._view.count
+            if row == self._view.matrix.shape[0]:
+                old = self._view
+                self._publish(old.dim, max(_INITIAL_CAPACITY, row * 2), old.matrix[:row], old.ids[:row], old.names[:row])
+            with self._change() as view:
+                view.matrix[row] = vec
+                view.ids[row] = person_id.encode("utf-8")
+                view.names[row] = _encode_name(name)
+                view.header[_COUNT] = row + 1
+            rows[person_id] = row
+        else:
+            with self._change() as view:
+                view.matrix[row] = vec
+                view.names[row] = _encode_name(name)
+
+    def _remove(self, person_id: str):
+        rows = self._row_map()
+        row = rows.pop(person_id, None)
+        if row is None:
+            return
+
+        # Move the last row into the freed slot to keep the matrix dense
+        with self._change() as view:
+            last = view.count - 1
+            if row != last:
+                view.matrix[row] = view.matrix[last]
+                view.ids[row] = view.ids[last]
+                view.names[row] = view.names[last]
+                rows[_decode(view.ids[row])] = row
+            view.ids[last] = b""
+            view.header[_COUNT] = last
+
+    def _publish(
+        self,
+        dim: int,
+        capacity: int,
+        matrix: Optional[np.ndarray] = None,
+        ids: Optional[np.ndarray] = None,
+        names: Optional[np.ndarray] = None
+    ) -> _Mapping:
+        """Replace the live file with a new generation holding the given rows.
+
+        The rows are written before the file is renamed into place, so readers
+        never see it partly filled.
+        """
+        old = self._current()
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            view = _Mapping(fd, dim, capacity)
+        finally:
+            os.close(fd)
+
+        count = 0 if matrix is None else matrix.shape[0]
+        if count:
+            view.matrix[:count] = matrix
+            view.ids[:count] = ids
+            view.names[:count] = names
+
+        generation = seq = 0
+        if old is not None:
+            view.header[_SYNCED_AT] = old.header[_SYNCED_AT]
+            generation, seq = old.generation + 1, old.seq + 2
+        view.header[_COUNT] = count
+        view.header[_SEQ] = seq
+        view.header[_GENERATION] = view.generation = generation
+
+        os.replace(tmp_path, self.path)
+        if old is not None:
+            # Tells every process still mapping the old file to map the new one
+            old.header[_GENERATION] = generation
+        self._view = view
+        self._rows_version = -1
+        return view
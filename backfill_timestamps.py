@@ -0,0 +1,74 @@
+"""
+Fill conversations.occurred_at and people.last_met_at for existing rows.
+
+Parses each conversation's display date ("Jan 16 • 2:30 PM") in
+DISPLAY_TIMEZONE, placing year-less dates in the latest year not after the
+row's created_at. Rows that cannot be parsed keep a null occurred_at and are
+listed. Every person's last_met_at is then set to their latest conversation.
+Run after `python -m app.migrations`; safe to run repeatedly.
+"""
+
+from sqlalchemy import select, update
+
+from app.core.database import SessionLocal
+from app.core.dates import parse_display_date
+from app.models import Conversation
+from app.services.counters import last_met_at_statement
+from app.services.etags import CONVERSATIONS, PEOPLE, bump_statement
+
+BATCH_SIZE = 1000
+
+
+def backfill_timestamps():
+    """Parse occurred_at for every undated conversation and recompute last_met_at."""
+    db = SessionLocal()
+
+    try:
+        parsed = 0
+        unparsed = []
+        last_id = ""
+        while True:
+            batch = db.execute(
+                select(Conversation.id, Conversation.date, Conversation.created_at)
+                .where(Conversation.id > last_id, Conversation.occurred_at.is_(None))
+                .order_by(Conversation.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not batch:
+                break
+
+            rows = []
+            for conversation_id, date, created_at in batch:
+                occurred_at = parse_display_date(date, created_at)
+                if occurred_at is None:
+                    unparsed.append((conversation_id, date))
+                else:
+                    rows.append({"id": conversation_id, "occurred_at": occurred_at})
+            if rows:
+                db.execute(update(Conversation), rows)
+            db.commit()
+
+            parsed += len(rows)
+            last_id = batch[-1].id
+            print(f"  - Dated {parsed} conversations")
+
+        people = db.execute(last_met_at_statement()).rowcount
+        if parsed or people:
+            db.execute(bump_statement(CONVERSATIONS, PEOPLE))
+        db.commit()
+
+        for conversation_id, date in unparsed[:20]:
+            print(f"  - Could not parse date of {conversation_id}: {date!r}")
+        print(f"✓ Timestamp backfill complete ({parsed} conversations dated, "
+              f"{len(unparsed)} unparseable, {people} people updated)")
+
+    except Exception as e:
+        db.rollback()
+        print(f"✗ Error backfilling timestamps: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_timestamps()
@@ -0,0 +1,255 @@
+"""
+Throughput and tail latency of the real API against a synthetic dataset.
+
+Drives ``app.main.app`` over an in-process ASGI client, so requests run the
+full stack (routing, validation, the async database session, serialization)
+without network noise. Each scenario runs on its own after a short warm-up:
+
+- list_people:          GET  /people?limit=50
+- list_conversations:   GET  /conversations?person_id=…
+- person_detail:        GET  /people/{id}
+- conversation_detail:  GET  /conversations/{id}
+- create_conversation:  POST /conversations (with two action items)
+- toggle_action_item:   PATCH /conversations/{id}/action-items/{item_id}
+- match_face:           POST /people/match-face (a stored face plus noise)
+
+Ids are sampled from rows written by ``benchmarks.datagen``, which must run
+first. Created conversations belong to benchmark people, so the next
+``datagen --reset`` removes them. The JSON report includes the git commit and
+dataset size; pass an earlier report as ``--baseline`` to get the change per
+scenario, so runs on two commits can be compared directly.
+
+Requires a reachable DATABASE_URL and ``pip install httpx``.
+
+Usage:
+    python -m benchmarks.datagen --people 2000 --reset
+    python -m benchmarks.api --requests 2000 --concurrency 32 --output before.json
+    python -m benchmarks.api --baseline before.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+
+import httpx
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.database import async_engine, engine
+from app.main import app
+from app.models import ActionItem, Conversation, Person
+from app.services import ensure_face_index
+from app.services.embeddings import unpack_embedding
+
+from .datagen import PERSON_PREFIX
+
+SAMPLE_SIZE = 500
+MATCH_NOISE = 0.1
+
+
+def load_samples(sample_size: int, seed: int) -> dict:
+    """Pick benchmark ids and stored faces to build requests from."""
+    bench_people = Person.id.startswith(PERSON_PREFIX)
+    with engine.connect() as conn:
+        counts = {
+            "people": conn.scalar(select(func.count()).select_from(Person).where(bench_people)),
+            "conversations": conn.scalar(
+                select(func.count()).select_from(Conversation).join(Person).where(bench_people)
+            ),
+        }
+        person_ids = conn.scalars(
+            select(Person.id).where(bench_people).order_by(func.random()).limit(sample_size)
+        ).all()
+        conversation_ids = conn.scalars(
+            select(Conversation.id).where(Conversation.person_id.in_(person_ids)).limit(sample_size)
+        ).all()
+        items = conn.execute(
+            select(ActionItem.conversation_id, ActionItem.id)
+            .where(ActionItem.conversation_id.in_(conversation_ids)).limit(sample_size)
+        ).all()
+        faces = conn.scalars(
+            select(Person.face_embedding_packed)
+            .where(Person.id.in_(person_ids), Person.face_embedding_packed.is_not(None))
+        ).all()
+
+    if not person_ids:
+        raise SystemExit("No benchmark rows found; run python -m benchmarks.datagen first")
+
+    rng = np.random.default_rng(seed)
+    queries = []
+    for packed in faces:
+        face = unpack_embedding(packed)
+        face = face + MATCH_NOISE * float(np.linalg.norm(face)) / np.sqrt(face.shape[0]) * rng.normal(size=face.shape)
+        queries.append([f"{value:.6f}" for value in face])
+
+    return {
+        "counts": counts,
+        "person_ids": person_ids,
+        "conversation_ids": conversation_ids,
+        "items": [tuple(item) for item in items],
+        "faces": queries,
+    }
+
+
+def scenarios(samples: dict) -> dict:
+    """Map each scenario name to a function building (method, path, json body) from an rng."""
+    prefix = settings.API_V1_PREFIX
+    built = {
+        "list_people": lambda rng: ("GET", f"{prefix}/people/?limit=50", None),
+        "list_conversations": lambda rng: (
+            "GET", f"{prefix}/conversations/?person_id={rng.choice(samples['person_ids'])}", None
+        ),
+        "person_detail": lambda rng: ("GET", f"{prefix}/people/{rng.choice(samples['person_ids'])}", None),
+        "conversation_detail": lambda rng: (
+            "GET", f"{prefix}/conversations/{rng.choice(samples['conversation_ids'])}", None
+        ),
+        "create_conversation": lambda rng: ("POST", f"{prefix}/conversations/", new_conversation(rng, samples)),
+    }
+    if samples["items"]:
+        built["toggle_action_item"] = lambda rng: (
+            "PATCH", "{}/conversations/{}/action-items/{}".format(prefix, *rng.choice(samples["items"])),
+            {"completed": rng.random() < 0.5}
+        )
+    if samples["faces"]:
+        built["match_face"] = lambda rng: (
+            "POST", f"{prefix}/people/match-face", {"face_embedding": rng.choice(samples["faces"]), "threshold": 0.6}
+        )
+    return built
+
+
+def new_conversation(rng: random.Random, samples: dict) -> dict:
+    person_id = rng.choice(samples["person_ids"])
+    return {
+        "person_id": person_id,
+        "participants": [person_id],
+        "title": "Benchmark check-in",
+        "date": "Jan 16 • 2:30 PM",
+        "location": "Zoom",
+        "summary": "Synthetic conversation written by the API benchmark.",
+        "key_points": ["Throughput", "Latency"],
+        "action_items": [
+            {"text": "Send the follow-up notes", "completed": False},
+            {"text": "Book the next meeting", "completed": True},
+        ],
+    }
+
+
+async def drive(client: httpx.AsyncClient, build, requests: int, concurrency: int, warmup: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    timings = []
+    errors = 0
+
+    async def send():
+        method, path, body = build(rng)
+        start = time.perf_counter()
+        response = await client.request(method, path, json=body)
+        return time.perf_counter() - start, response.status_code < 400
+
+    async def worker(count: int):
+        nonlocal errors
+        for _ in range(count):
+            elapsed, ok = await send()
+            timings.append(elapsed)
+            errors += not ok
+
+    # Warm up connections and caches before timing
+    await asyncio.gather(*(send() for _ in range(warmup)))
+
+    shares = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(share) for share in shares if share))
+    elapsed = time.perf_counter() - start
+
+    ms = np.array(timings) * 1000
+    return {
+        "requests": requests,
+        "errors": errors,
+        "requests_per_s": round(requests / elapsed, 1),
+        "p50_ms": round(float(np.percentile(ms, 50)), 2),
+        "p95_ms": round(float(np.percentile(ms, 95)), 2),
+        "p99_ms": round(float(np.percentile(ms, 99)), 2),
+    }
+
+
+def compare(report: dict, baseline: dict) -> dict:
+    """Percent change per scenario against an earlier report; negative latency change is better."""
+    changes = {}
+    for name, result in report["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        changes[name] = {
+            key: round((result[key] - before[key]) / before[key] * 100, 1)
+            for key in ("requests_per_s", "p50_ms", "p95_ms", "p99_ms")
+            if before.get(key)
+        }
+    return {"commit": baseline.get("commit"), "change_pct": changes}
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], check=True, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args, samples: dict) -> dict:
+    built = scenarios(samples)
+    selected = args.scenarios or list(built)
+    unknown = set(selected) - set(built)
+    if unknown:
+        raise SystemExit(f"Unknown or unavailable scenarios: {', '.join(sorted(unknown))}")
+
+    await run_in_threadpool(ensure_face_index)
+    results = {}
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            for name in selected:
+                results[name] = await drive(
+                    client, built[name], args.requests, args.concurrency, args.warmup, args.seed
+                )
+    finally:
+        await async_engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Timed requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=50, help="Untimed requests per scenario")
+    parser.add_argument("--scenarios", nargs="+", help="Run only these scenarios")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Also write the report to this file")
+    parser.add_argument("--baseline", help="Earlier report to compare against")
+    args = parser.parse_args()
+
+    samples = load_samples(SAMPLE_SIZE, args.seed)
+    report = {
+        "commit": git_commit(),
+        "dataset": samples["counts"],
+        "concurrency": args.concurrency,
+        "pool_size": settings.DB_POOL_SIZE,
+        "scenarios": asyncio.run(run(args, samples)),
+    }
+    engine.dispose()
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            report["baseline"] = compare(report, json.load(f))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
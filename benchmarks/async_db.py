@@ -0,0 +1,113 @@
+"""
+Throughput and tail latency of sync vs async database handlers.
+
+Mounts the same people-list query behind a sync ``def`` handler (blocking
+Session, run in the threadpool) and an ``async def`` handler (AsyncSession),
+then drives each over an in-process ASGI client at the given concurrency.
+``--db-latency-ms`` adds a server-side pg_sleep per request to model a busier
+database, which is where threadpool exhaustion shows up.
+
+Requires a reachable DATABASE_URL and ``pip install httpx``.
+
+Usage:
+    python -m benchmarks.async_db --concurrency 200 --requests 4000 --db-latency-ms 5
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+import numpy as np
+from fastapi import FastAPI
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.database import _database_url
+from app.models import Person
+
+
+def build_app(mode: str, pool_size: int, db_latency: float):
+    """Return (app, engine) serving the people query through a sync or async handler."""
+    url = _database_url(settings.DATABASE_URL)
+    query = select(Person.id, Person.name).order_by(Person.created_at, Person.id).limit(20)
+    app = FastAPI()
+
+    if mode == "sync":
+        engine = create_engine(url, pool_size=pool_size, max_overflow=0)
+        Session = sessionmaker(bind=engine)
+
+        @app.get("/people")
+        def sync_people():
+            with Session() as db:
+                if db_latency:
+                    db.execute(text("SELECT pg_sleep(:s)"), {"s": db_latency})
+                return [dict(row._mapping) for row in db.execute(query)]
+    else:
+        engine = create_async_engine(url, pool_size=pool_size, max_overflow=0)
+        Session = async_sessionmaker(engine)
+
+        @app.get("/people")
+        async def async_people():
+            async with Session() as db:
+                if db_latency:
+                    await db.execute(text("SELECT pg_sleep(:s)"), {"s": db_latency})
+                return [dict(row._mapping) for row in await db.execute(query)]
+
+    return app, engine
+
+
+async def drive(app, requests: int, concurrency: int):
+    timings = []
+    queue = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker():
+            for _ in queue:
+                start = time.perf_counter()
+                response = await client.get("/people")
+                response.raise_for_status()
+                timings.append(time.perf_counter() - start)
+
+        # Warm up connections before timing
+        await asyncio.gather(*(client.get("/people") for _ in range(concurrency)))
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    ms = np.array(timings) * 1000
+    return {
+        "requests_per_s": round(requests / elapsed, 1),
+        "p50_ms": round(float(np.percentile(ms, 50)), 2),
+        "p95_ms": round(float(np.percentile(ms, 95)), 2),
+        "p99_ms": round(float(np.percentile(ms, 99)), 2),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--pool-size", type=int, default=50)
+    parser.add_argument("--db-latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    report = {"concurrency": args.concurrency, "pool_size": args.pool_size, "db_latency_ms": args.db_latency_ms}
+    for mode in ("sync", "async"):
+        app, engine = build_app(mode, args.pool_size, args.db_latency_ms / 1000)
+        try:
+            report[mode] = await drive(app, args.requests, args.concurrency)
+        finally:
+            if mode == "sync":
+                engine.dispose()
+            else:
+                await engine.dispose()
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""
+Throughput of concurrent conversation creates for one person.
+
+Sends ``--creates`` POST /conversations requests for the same person, at most
+``--concurrency`` in flight, through the real app over an in-process ASGI
+client. Each conversation carries ``--items`` action items, half of them
+completed.
+
+Reports creates per second and latency percentiles. That the person's counters
+stay exact under concurrent creates is asserted by
+``tests/test_conversation_create.py``.
+
+Requires a reachable DATABASE_URL with the schema applied.
+
+Usage:
+    python -m benchmarks.conversation_writes --creates 1000 --concurrency 32 --items 3
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+import numpy as np
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import async_engine, engine
+from app.main import app
+
+PERSON_ID = "bconc0"
+
+
+async def create(client: httpx.AsyncClient, number: int, items: int, limit: asyncio.Semaphore, timings: list):
+    body = {
+        "person_id": PERSON_ID,
+        "title": f"Concurrent create {number}",
+        "date": "Jan 16 • 2:30 PM",
+        "location": "Zoom",
+        "summary": "Synthetic conversation written by the concurrency benchmark.",
+        "action_items": [{"text": f"Item {i}", "completed": i % 2 == 1} for i in range(items)],
+    }
+    async with limit:
+        start = time.perf_counter()
+        response = await client.post(f"{settings.API_V1_PREFIX}/conversations/?include_transcript=false", json=body)
+        response.raise_for_status()
+        timings.append(time.perf_counter() - start)
+
+
+async def run(creates: int, concurrency: int, items: int) -> dict:
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM people WHERE id = :id"), {"id": PERSON_ID})
+        conn.execute(text(
+            "INSERT INTO people (id, name, role, avatar_color, context, met_count) "
+            "VALUES (:id, 'Concurrency Benchmark', 'Benchmark', 'bg-indigo-200', 'Concurrency benchmark', 0)"
+        ), {"id": PERSON_ID})
+
+    timings = []
+    limit = asyncio.Semaphore(concurrency)
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            start = time.perf_counter()
+            await asyncio.gather(*(create(client, n, items, limit, timings) for n in range(creates)))
+            elapsed = time.perf_counter() - start
+    finally:
+        await async_engine.dispose()
+        # Conversations and their action items go by cascade
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM people WHERE id = :id"), {"id": PERSON_ID})
+
+    ms = np.array(timings) * 1000
+    return {
+        "creates_per_s": round(creates / elapsed, 1),
+        "p50_ms": round(float(np.percentile(ms, 50)), 2),
+        "p95_ms": round(float(np.percentile(ms, 95)), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--creates", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--items", type=int, default=3, help="Action items per conversation")
+    args = parser.parse_args()
+
+    report = {
+        "creates": args.creates,
+        "concurrency": args.concurrency,
+        "items": args.items,
+        **asyncio.run(run(args.creates, args.concurrency, args.items)),
+    }
+    engine.dispose()
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
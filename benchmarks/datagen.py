@@ -0,0 +1,175 @@
+"""
+Synthetic dataset generator for benchmarks and load tests.
+
+Writes N people (with face embeddings), M conversations per person, action
+items and transcripts straight into the database with batched multi-row
+INSERTs. The columns the API maintains (met_count, last_met, last_met_at,
+conversation_count, pending_action_count, occurred_at) are filled in exactly
+as the write paths would. Content is deterministic for a given seed; dates
+are relative to the time of the run.
+
+Generated ids start with "b" (bp…, bc…, ba…), which the app never produces,
+so ``--reset`` removes only benchmark rows.
+
+Requires a reachable DATABASE_URL with the schema applied (python -m app.migrations).
+
+Usage:
+    python -m benchmarks.datagen --people 2000 --conversations 10 --turns 100 --reset
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import delete, insert
+
+from app.core.config import settings
+from app.core.database import engine
+from app.models import ActionItem, Conversation, Person
+from app.services.embeddings import pack_embedding
+from app.services.etags import CONVERSATIONS, PEOPLE, bump_statement
+
+from .face_ann import synthetic_faces
+from .transcripts import WORDS, make_transcript
+
+PERSON_PREFIX = "bp"
+CONVERSATION_PREFIX = "bc"
+ACTION_ITEM_PREFIX = "ba"
+
+BATCH_SIZE = 1000
+
+ROLES = ["Product Lead", "Designer", "Engineer", "Founder", "Investor", "Recruiter", "Researcher", "Architect"]
+COMPANIES = ["Orio", "Lumen", "Northwind", "Acme", "Globex", "Initech", "Hooli", "Vandelay"]
+FIRST_NAMES = ["Sarah", "David", "Elena", "Marcus", "Priya", "Tom", "Aiko", "Lucas", "Maya", "Omar", "Nina", "Ravi"]
+LAST_NAMES = ["Chen", "Miller", "Rodriguez", "Okafor", "Patel", "Novak", "Tanaka", "Silva", "Berg", "Haddad"]
+PLACES = ["Blue Bottle Coffee", "Zoom", "Office", "WeWork", "Ferry Building", "Tartine", "Google Meet"]
+COLORS = ["bg-indigo-200", "bg-rose-200", "bg-amber-200", "bg-emerald-200", "bg-sky-200"]
+
+
+def person_id(i: int) -> str:
+    return f"{PERSON_PREFIX}{i:07d}"
+
+
+def display_date(moment: datetime) -> str:
+    """Format like the app does, in DISPLAY_TIMEZONE: "Jan 16 • 2:30 PM"."""
+    local = moment.astimezone(ZoneInfo(settings.DISPLAY_TIMEZONE))
+    return f"{local:%b} {local.day} • {int(local.strftime('%I'))}:{local:%M %p}"
+
+
+def sentence(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(low, high))).capitalize() + "."
+
+
+def generate(conn, people: int, conversations: int, action_items: int, turns: int, dim: int, seed: int) -> dict:
+    """Insert the dataset and return row counts."""
+    rng = random.Random(seed)
+    faces, _ = synthetic_faces(people, dim, seed) if dim else (None, None)
+    now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+
+    totals = {"people": 0, "conversations": 0, "action_items": 0}
+    conversation_no = 0
+    item_no = 0
+
+    for start in range(0, people, BATCH_SIZE):
+        person_rows, conversation_rows, item_rows = [], [], []
+        for i in range(start, min(start + BATCH_SIZE, people)):
+            pid = person_id(i)
+            person = {
+                "id": pid,
+                "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "role": f"{rng.choice(ROLES)} at {rng.choice(COMPANIES)}",
+                "avatar_color": rng.choice(COLORS),
+                "context": sentence(rng, 8, 20),
+                "interests": rng.sample(WORDS, 3),
+                "open_follow_ups": [sentence(rng, 4, 8)],
+                "met_count": 0,
+                "conversation_count": 0,
+                "pending_action_count": 0,
+                "last_met": None,
+                "last_met_at": None,
+                "face_embedding_packed": None,
+                "face_embedding_dim": None,
+            }
+            if faces is not None:
+                person["face_embedding_packed"], person["face_embedding_dim"] = pack_embedding(faces[i])
+
+            # Conversations spread over the past year (short of it, so year-less dates stay unambiguous)
+            moments = sorted(now - timedelta(minutes=rng.randint(0, 360 * 24 * 60)) for _ in range(conversations))
+            for moment in moments:
+                cid = f"{CONVERSATION_PREFIX}{conversation_no:08d}"
+                conversation_no += 1
+                date = display_date(moment)
+                conversation_rows.append({
+                    "id": cid,
+                    "person_id": pid,
+                    "participants": [pid],
+                    "title": sentence(rng, 2, 6)[:-1],
+                    "date": date,
+                    "occurred_at": moment,
+                    "location": rng.choice(PLACES),
+                    "summary": sentence(rng, 15, 40),
+                    "key_points": [sentence(rng, 5, 12) for _ in range(3)],
+                    "full_transcript": make_transcript(rng, turns) if turns else None,
+                })
+                for _ in range(action_items):
+                    completed = rng.random() < 0.5
+                    item_rows.append({
+                        "id": f"{ACTION_ITEM_PREFIX}{item_no:09d}",
+                        "conversation_id": cid,
+                        "text": sentence(rng, 3, 8),
+                        "completed": completed,
+                    })
+                    item_no += 1
+                    person["pending_action_count"] += not completed
+
+                person["met_count"] += 1
+                person["conversation_count"] += 1
+                person["last_met"] = date.split("•")[0].strip()
+                person["last_met_at"] = moment
+            person_rows.append(person)
+
+        conn.execute(insert(Person), person_rows)
+        if conversation_rows:
+            conn.execute(insert(Conversation), conversation_rows)
+        if item_rows:
+            conn.execute(insert(ActionItem), item_rows)
+        totals["people"] += len(person_rows)
+        totals["conversations"] += len(conversation_rows)
+        totals["action_items"] += len(item_rows)
+
+    conn.execute(bump_statement(CONVERSATIONS, PEOPLE))
+    return totals
+
+
+def reset(conn):
+    """Delete every benchmark row; conversations and action items go by cascade."""
+    conn.execute(delete(Person).where(Person.id.startswith(PERSON_PREFIX)))
+    conn.execute(bump_statement(CONVERSATIONS, PEOPLE))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--people", type=int, default=2000)
+    parser.add_argument("--conversations", type=int, default=10, help="Conversations per person")
+    parser.add_argument("--action-items", type=int, default=3, help="Action items per conversation")
+    parser.add_argument("--turns", type=int, default=100, help="Speaker turns per transcript (0 for none)")
+    parser.add_argument("--dim", type=int, default=128, help="Face embedding dimension (0 for no faces)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--reset", action="store_true", help="Delete earlier benchmark rows first")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        if args.reset:
+            reset(conn)
+        totals = generate(conn, args.people, args.conversations, args.action_items, args.turns, args.dim, args.seed)
+    engine.dispose()
+
+    print(json.dumps({**totals, "seconds": round(time.perf_counter() - start, 2)}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
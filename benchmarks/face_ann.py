@@ -0,0 +1,110 @@
+"""
+Recall vs latency of the IVF face index against exact search.
+
+Generates synthetic clustered face embeddings, queries them with noisy copies
+of stored faces and reports, for each nprobe setting, recall@1 relative to the
+exact index and single-query latency percentiles. Also times a full build
+against loading a saved snapshot.
+
+Usage:
+    python -m benchmarks.face_ann --people 200000 --dim 128 --queries 500
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from app.services import FaceIndex, IVFFaceIndex
+
+
+def synthetic_faces(people: int, dim: int, seed: int):
+    """Embeddings grouped around shared centres, roughly like real face models produce."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(max(1, people // 500), dim)).astype(np.float32)
+    owners = rng.integers(0, centres.shape[0], size=people)
+    faces = centres[owners] + 0.8 * rng.normal(size=(people, dim)).astype(np.float32)
+    return faces, rng
+
+
+def percentile_ms(samples, pct):
+    return round(float(np.percentile(samples, pct)) * 1000, 3)
+
+
+def time_queries(index, queries):
+    timings = []
+    answers = []
+    for query in queries:
+        start = time.perf_counter()
+        person_id, _, _ = index.match(query)
+        timings.append(time.perf_counter() - start)
+        answers.append(person_id)
+    return answers, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--people", type=int, default=200000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--nlist", type=int, default=0)
+    parser.add_argument("--probes", default="1,4,8,16,32,64")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    faces, rng = synthetic_faces(args.people, args.dim, args.seed)
+    ids = [f"p{i}" for i in range(args.people)]
+    picks = rng.integers(0, args.people, size=args.queries)
+    queries = faces[picks] + 0.3 * rng.normal(size=(args.queries, args.dim)).astype(np.float32)
+
+    exact = FaceIndex()
+    start = time.perf_counter()
+    exact.build(zip(ids, ids, faces))
+    exact_build = time.perf_counter() - start
+    truth, exact_timings = time_queries(exact, queries)
+
+    ivf = IVFFaceIndex(nlist=args.nlist, min_train_size=0, seed=args.seed)
+    start = time.perf_counter()
+    ivf.build(zip(ids, ids, faces))
+    ivf_build = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "faces.npz")
+        ivf.save(path)
+        start = time.perf_counter()
+        IVFFaceIndex(nlist=args.nlist, min_train_size=0).load(path)
+        ivf_load = time.perf_counter() - start
+
+    report = {
+        "people": args.people,
+        "dim": args.dim,
+        "queries": args.queries,
+        "nlist": len(ivf._members),
+        "exact": {
+            "build_s": round(exact_build, 3),
+            "p50_ms": percentile_ms(exact_timings, 50),
+            "p99_ms": percentile_ms(exact_timings, 99),
+        },
+        "ivf_build_s": round(ivf_build, 3),
+        "ivf_snapshot_load_s": round(ivf_load, 3),
+        "ivf": [],
+    }
+
+    for nprobe in (int(p) for p in args.probes.split(",")):
+        ivf.nprobe = nprobe
+        answers, timings = time_queries(ivf, queries)
+        report["ivf"].append({
+            "nprobe": nprobe,
+            "recall_at_1": round(sum(a == t for a, t in zip(answers, truth)) / len(truth), 4),
+            "p50_ms": percentile_ms(timings, 50),
+            "p99_ms": percentile_ms(timings, 99),
+        })
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
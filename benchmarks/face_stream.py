@@ -0,0 +1,130 @@
+"""
+Per-frame cost of live face recognition: HTTP POST per frame vs the WebSocket stream.
+
+Replays a synthetic camera feed (``--faces`` tracked faces per frame, each a
+stored face plus noise) through the real app in-process, both as one POST to
+/people/match-face (or /match-faces for several faces) per frame and as
+messages on /people/match-face/stream. The app's face index is replaced by
+``--people`` synthetic faces first.
+
+For each transport it reports latency per frame, the frame rate one client
+can sustain back to back, and process CPU time per frame (client and server
+share the process, so compare the two rather than reading absolute numbers).
+For the stream it also reports the share of faces answered from their track
+without a full index search.
+
+Requires a reachable DATABASE_URL (to load the face index) and ``pip install httpx``.
+
+Usage:
+    python -m benchmarks.face_stream --people 20000 --frames 900 --faces 2
+"""
+
+import argparse
+import base64
+import json
+import time
+
+import numpy as np
+from starlette.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.services import ensure_face_index, face_index
+
+from .face_ann import synthetic_faces
+
+
+def make_feed(faces: np.ndarray, frames: int, per_frame: int, noise: float, rng) -> list:
+    """Base64 embeddings per frame; each track follows one person for the whole feed."""
+    people = rng.choice(faces.shape[0], size=per_frame, replace=False)
+    units = faces[people] / np.linalg.norm(faces[people], axis=1, keepdims=True)
+    feed = []
+    for _ in range(frames):
+        noisy = units + noise * rng.normal(size=units.shape) / np.sqrt(units.shape[1])
+        feed.append([base64.b64encode(vec.astype("<f4").tobytes()).decode("ascii") for vec in noisy])
+    return feed
+
+
+def summarize(timings, cpu_seconds: float) -> dict:
+    ms = np.array(timings) * 1000
+    return {
+        "frames": len(ms),
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(ms, 95)), 3),
+        "fps": round(len(ms) / (ms.sum() / 1000), 1),
+        "cpu_ms_per_frame": round(cpu_seconds * 1000 / len(ms), 3),
+    }
+
+
+def run_http(client: TestClient, feed, threshold: float) -> dict:
+    prefix = settings.API_V1_PREFIX
+    timings = []
+    cpu = time.process_time()
+    for frame in feed:
+        start = time.perf_counter()
+        if len(frame) == 1:
+            response = client.post(f"{prefix}/people/match-face", json={"face_embedding_b64": frame[0], "threshold": threshold})
+        else:
+            response = client.post(f"{prefix}/people/match-faces", json={
+                "faces": [{"face_embedding_b64": face} for face in frame], "threshold": threshold, "top_k": 1
+            })
+        response.raise_for_status()
+        timings.append(time.perf_counter() - start)
+    return summarize(timings, time.process_time() - cpu)
+
+
+def run_stream(client: TestClient, feed, threshold: float) -> dict:
+    prefix = settings.API_V1_PREFIX
+    timings = []
+    tracked = searched = 0
+    with client.websocket_connect(f"{prefix}/people/match-face/stream?threshold={threshold}") as ws:
+        cpu = time.process_time()
+        for number, frame in enumerate(feed):
+            start = time.perf_counter()
+            ws.send_text(json.dumps({
+                "frame": number,
+                "faces": [{"track_id": str(i), "face_embedding_b64": face} for i, face in enumerate(frame)],
+            }))
+            results = ws.receive_json()["results"]
+            timings.append(time.perf_counter() - start)
+            for result in results:
+                if result["rescored"]:
+                    searched += 1
+                else:
+                    tracked += 1
+        cpu = time.process_time() - cpu
+    return {**summarize(timings, cpu), "tracked_share": round(tracked / max(1, tracked + searched), 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--people", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--frames", type=int, default=900, help="Frames per transport (900 = 30 s at 30 fps)")
+    parser.add_argument("--faces", type=int, default=1, help="Tracked faces per frame")
+    parser.add_argument("--noise", type=float, default=0.3, help="Per-frame embedding noise relative to a unit face")
+    parser.add_argument("--threshold", type=float, default=0.6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    faces, rng = synthetic_faces(args.people, args.dim, args.seed)
+    feed = make_feed(faces, args.frames, args.faces, args.noise, rng)
+
+    with TestClient(app) as client:
+        ensure_face_index()
+        face_index.build((f"bench{i}", f"Bench {i}", face) for i, face in enumerate(faces))
+        report = {
+            "people": args.people,
+            "dim": args.dim,
+            "faces_per_frame": args.faces,
+            "http": run_http(client, feed, args.threshold),
+            "stream": run_stream(client, feed, args.threshold),
+        }
+        # Leave no synthetic faces behind in a snapshot written on shutdown
+        face_index.build([])
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Cost of recording a live transcript: re-sending it whole vs appending segments.
+
+Simulates a meeting of ``--turns`` speaker turns, sending an update every
+``--batch`` turns through the real app over an in-process ASGI client:
+
+- put:    PUT /conversations/{id} with the whole transcript so far (the old client)
+- append: POST /conversations/{id}/transcript/segments with only the new turns,
+          then POST .../transcript/finalize once at the end
+
+For each mode it reports write latency early and late in the meeting (first
+and last 10% of updates), total time and the WAL bytes Postgres generated.
+Put latency and WAL volume grow with the meeting; append stays flat.
+
+Requires a reachable DATABASE_URL with the schema applied; pg_current_wal_lsn
+needs superuser or pg_monitor, otherwise WAL is reported as null.
+
+Usage:
+    python -m benchmarks.live_transcript --turns 1200 --batch 3
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import httpx
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import settings
+from app.core.database import async_engine, engine
+from app.main import app
+
+from .transcripts import SPEAKERS, WORDS
+
+PERSON_ID = "blive0"
+
+
+def make_turns(turns: int, seed: int):
+    rng = random.Random(seed)
+    return [
+        (rng.choice(SPEAKERS), " ".join(rng.choices(WORDS, k=rng.randint(8, 40))).capitalize() + ".")
+        for _ in range(turns)
+    ]
+
+
+def wal_lsn():
+    try:
+        with engine.connect() as conn:
+            return conn.execute(text("SELECT pg_current_wal_lsn()")).scalar()
+    except DBAPIError:
+        return None
+
+
+def wal_bytes(start, end):
+    if start is None or end is None:
+        return None
+    with engine.connect() as conn:
+        return int(conn.execute(text("SELECT pg_wal_lsn_diff(:end, :start)"), {"start": start, "end": end}).scalar())
+
+
+def summarize(timings, elapsed: float, wal) -> dict:
+    ms = np.array(timings) * 1000
+    tenth = max(1, len(ms) // 10)
+    return {
+        "updates": len(ms),
+        "early_p50_ms": round(float(np.percentile(ms[:tenth], 50)), 2),
+        "late_p50_ms": round(float(np.percentile(ms[-tenth:], 50)), 2),
+        "total_s": round(elapsed, 2),
+        "wal_bytes": wal,
+    }
+
+
+async def record(client: httpx.AsyncClient, mode: str, turns, batch: int) -> dict:
+    prefix = settings.API_V1_PREFIX
+    response = await client.post(f"{prefix}/conversations/", json={
+        "person_id": PERSON_ID,
+        "title": f"Live transcript ({mode})",
+        "date": "Jan 16 • 2:30 PM",
+        "location": "Zoom",
+        "summary": "Synthetic live meeting written by the transcript benchmark.",
+    })
+    response.raise_for_status()
+    conversation_id = response.json()["id"]
+
+    timings = []
+    lsn = wal_lsn()
+    start = time.perf_counter()
+    for end in range(batch, len(turns) + batch, batch):
+        sent = time.perf_counter()
+        if mode == "put":
+            transcript = "\n\n".join(f"{speaker}: {words}" for speaker, words in turns[:end])
+            response = await client.put(
+                f"{prefix}/conversations/{conversation_id}?include_transcript=false",
+                json={"full_transcript": transcript}
+            )
+        else:
+            segments = [
+                {"seq": seq, "speaker": speaker, "text": words}
+                for seq, (speaker, words) in enumerate(turns[end - batch:end], start=end - batch)
+            ]
+            response = await client.post(
+                f"{prefix}/conversations/{conversation_id}/transcript/segments", json={"segments": segments}
+            )
+        response.raise_for_status()
+        timings.append(time.perf_counter() - sent)
+
+    if mode == "append":
+        response = await client.post(f"{prefix}/conversations/{conversation_id}/transcript/finalize")
+        response.raise_for_status()
+    elapsed = time.perf_counter() - start
+    return summarize(timings, elapsed, wal_bytes(lsn, wal_lsn()))
+
+
+async def run(turns, batch: int) -> dict:
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO people (id, name, role, avatar_color, context, met_count) "
+            "VALUES (:id, 'Live Benchmark', 'Benchmark', 'bg-indigo-200', 'Transcript benchmark', 0) "
+            "ON CONFLICT (id) DO NOTHING"
+        ), {"id": PERSON_ID})
+
+    report = {}
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            for mode in ("put", "append"):
+                report[mode] = await record(client, mode, turns, batch)
+    finally:
+        await async_engine.dispose()
+        # Conversations and their segments go by cascade
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM people WHERE id = :id"), {"id": PERSON_ID})
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=1200, help="Speaker turns in the meeting")
+    parser.add_argument("--batch", type=int, default=3, help="Turns sent per update")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    turns = make_turns(args.turns, args.seed)
+    report = {"turns": args.turns, "batch": args.batch, **asyncio.run(run(turns, args.batch))}
+    engine.dispose()
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
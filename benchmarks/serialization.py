@@ -0,0 +1,170 @@
+"""
+Serialization cost of list responses: response_model validation vs row mappers + orjson.
+
+Builds ``--rows`` in-memory rows of the kind the list endpoints load and turns
+them into JSON bytes two ways:
+
+- response_model: the previous path; dicts built by hand from Person objects
+  (people) or ConversationListResponse objects (conversations), then validated
+  against List[model] and dumped by Pydantic, as FastAPI does for a
+  response_model
+- fast:           column rows (as the list queries now select) mapped by
+  ``row_mapper`` and rendered by ``FastJSONResponse`` (orjson)
+
+Reports microseconds per 1,000 rows (best of ``--repeat``) and checks that
+both paths produce identical bytes. No database is needed.
+
+Usage:
+    python -m benchmarks.serialization --rows 1000 --repeat 50
+"""
+
+import argparse
+import json
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.core.serialization import FastJSONResponse, row_mapper
+from app.models import Person
+from app.schemas import ConversationListResponse, PersonListResponse
+
+PersonRow = namedtuple("PersonRow", [*PersonListResponse.model_fields, "created_at"])
+ConversationRow = namedtuple("ConversationRow", [
+    "id", "person_id", "participants", "title", "date", "occurred_at", "location", "summary", "created_at",
+    "active_action_items_count",
+])
+
+
+def make_people(count: int) -> list:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        Person(
+            id=f"bp{i:07d}",
+            name=f"Person {i}",
+            role="Product Lead at Orio",
+            avatar_color="bg-indigo-200",
+            context="Met at the Design Systems conference last year.",
+            last_met="Jan 16",
+            last_met_at=start + timedelta(hours=i),
+            met_count=i % 12,
+            conversation_count=i % 12,
+            pending_action_count=i % 5,
+            face_embedding_dim=128 if i % 2 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def person_rows(people) -> list:
+    return [PersonRow(*(getattr(person, name) for name in PersonRow._fields)) for person in people]
+
+
+def make_conversations(count: int) -> list:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        ConversationRow(
+            f"bc{i:08d}", f"bp{i % 100:07d}", [f"bp{i % 100:07d}"], f"Q3 Beta Roadmap Review {i}",
+            "Jan 16 • 2:30 PM", start + timedelta(minutes=i), "Blue Bottle Coffee",
+            "Discussed the roadmap for the Q3 beta launch and the sign-up flow.", start, i % 4,
+        )
+        for i in range(count)
+    ]
+
+
+def people_response_model(people, adapter) -> bytes:
+    rows = [
+        {
+            "id": p.id,
+            "name": p.name,
+            "role": p.role,
+            "avatar_color": p.avatar_color,
+            "last_met": p.last_met,
+            "last_met_at": p.last_met_at,
+            "met_count": p.met_count,
+            "conversation_count": p.conversation_count,
+            "pending_action_count": p.pending_action_count,
+            "context": p.context,
+            "has_face_data": p.has_face_data
+        }
+        for p in people
+    ]
+    return adapter.dump_json(adapter.validate_python(rows))
+
+
+def conversations_response_model(rows, adapter) -> bytes:
+    items = [
+        ConversationListResponse(
+            id=row.id,
+            person_id=row.person_id,
+            participants=row.participants or [],
+            title=row.title,
+            date=row.date,
+            occurred_at=row.occurred_at,
+            location=row.location,
+            summary=row.summary,
+            active_action_items_count=row.active_action_items_count
+        )
+        for row in rows
+    ]
+    return adapter.dump_json(adapter.validate_python(items))
+
+
+def fast(rows, mapper) -> bytes:
+    return FastJSONResponse([mapper(row) for row in rows]).body
+
+
+def best_us_per_1000(func, rows: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1_000_000 * 1000 / rows, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    # FastAPI builds its response adapters once per route, so they are built outside the timing too
+    people_adapter = TypeAdapter(List[PersonListResponse])
+    conversations_adapter = TypeAdapter(List[ConversationListResponse])
+    people = make_people(args.rows)
+    conversations = make_conversations(args.rows)
+    # name: (previous path's input, fast path's input, previous path, row mapper)
+    cases = {
+        "people": (
+            people,
+            person_rows(people),
+            lambda rows: people_response_model(rows, people_adapter),
+            row_mapper(PersonListResponse),
+        ),
+        "conversations": (
+            conversations,
+            conversations,
+            lambda rows: conversations_response_model(rows, conversations_adapter),
+            row_mapper(ConversationListResponse, participants=[]),
+        ),
+    }
+
+    report = {"rows": args.rows}
+    for name, (objects, rows, response_model, mapper) in cases.items():
+        old = best_us_per_1000(lambda: response_model(objects), args.rows, args.repeat)
+        new = best_us_per_1000(lambda: fast(rows, mapper), args.rows, args.repeat)
+        report[name] = {
+            "response_model_us_per_1000": old,
+            "fast_us_per_1000": new,
+            "speedup": round(old / new, 2),
+            "identical": response_model(objects) == fast(rows, mapper),
+        }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
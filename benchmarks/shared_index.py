@@ -0,0 +1,150 @@
+"""
+Memory and latency of per-worker face indexes vs one shared memory-mapped index.
+
+Starts ``--workers`` processes the way uvicorn does (spawned, not forked) and
+gives each ``--people`` synthetic faces in one of two ways:
+
+- local:  every worker builds its own ``FaceIndex`` (the exact backend)
+- shared: the parent builds one ``SharedFaceIndex`` file and workers map it
+
+For each mode it reports the memory each worker added for its index (private
+bytes, and proportional set size, which splits shared pages between the
+processes mapping them) and single-query search latency. For the shared mode it
+also reports how long a write by the parent takes to become visible to every
+worker.
+
+Linux only (reads /proc/self/smaps_rollup).
+
+Usage:
+    python -m benchmarks.shared_index --people 200000 --workers 4
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from app.services import FaceIndex, SharedFaceIndex
+
+from .face_ann import synthetic_faces
+
+
+def memory_kb() -> dict:
+    fields = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {"private": fields["Private_Clean"] + fields["Private_Dirty"], "pss": fields["Pss"]}
+
+
+def worker(mode: str, path: str, args, ready, results):
+    # Every query scans every face, so random queries time the same work as real ones
+    queries = np.random.default_rng(args.seed).normal(size=(args.queries, args.dim))
+    before = memory_kb()
+
+    if mode == "local":
+        faces, _ = synthetic_faces(args.people, args.dim, args.seed)
+        index = FaceIndex()
+        index.build((f"bench{i}", f"Bench {i}", face) for i, face in enumerate(faces))
+        del faces
+    else:
+        index = SharedFaceIndex(path)
+
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        index.match(query)
+        timings.append(time.perf_counter() - start)
+    after = memory_kb()
+
+    report = {
+        "private_mb": round((after["private"] - before["private"]) / 1024, 1),
+        "pss_mb": round((after["pss"] - before["pss"]) / 1024, 1),
+        "p50_ms": round(float(np.percentile(timings, 50)) * 1000, 3),
+        "p95_ms": round(float(np.percentile(timings, 95)) * 1000, 3),
+    }
+    ready.put(report)
+
+    if mode == "shared":
+        # Report when each new person written by the parent first becomes visible here
+        version = index.version
+        for round_number in range(args.writes):
+            person_id = f"bench-new{round_number}"
+            while True:
+                # The version is one header read; only look the person up once it moves
+                if index.version != version:
+                    version = index.version
+                    if index.vector(person_id) is not None:
+                        break
+                time.sleep(0)
+            results.put(time.monotonic())
+
+
+def run_mode(mode: str, path: str, args) -> dict:
+    context = multiprocessing.get_context("spawn")
+    ready, results = context.Queue(), context.Queue()
+
+    if mode == "shared":
+        faces, _ = synthetic_faces(args.people, args.dim, args.seed)
+        index = SharedFaceIndex(path)
+        index.build((f"bench{i}", f"Bench {i}", face) for i, face in enumerate(faces))
+        del faces
+
+    processes = [
+        context.Process(target=worker, args=(mode, path, args, ready, results))
+        for _ in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    workers = [ready.get() for _ in processes]
+
+    report = {
+        "private_mb_per_worker": round(float(np.mean([w["private_mb"] for w in workers])), 1),
+        "pss_mb_per_worker": round(float(np.mean([w["pss_mb"] for w in workers])), 1),
+        "p50_ms": round(float(np.median([w["p50_ms"] for w in workers])), 3),
+        "p95_ms": round(float(np.median([w["p95_ms"] for w in workers])), 3),
+    }
+
+    if mode == "shared":
+        rng = np.random.default_rng(args.seed + 1)
+        delays = []
+        for round_number in range(args.writes):
+            written = time.monotonic()
+            index.upsert(f"bench-new{round_number}", "New", rng.normal(size=args.dim))
+            delays.extend(results.get() - written for _ in processes)
+        ms = np.array(delays) * 1000
+        report["visible_p50_ms"] = round(float(np.percentile(ms, 50)), 3)
+        report["visible_max_ms"] = round(float(ms.max()), 3)
+
+    for process in processes:
+        process.join()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--people", type=int, default=200000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queries", type=int, default=200, help="Searches per worker")
+    parser.add_argument("--writes", type=int, default=50, help="Writes timed until visible in every worker")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    report = {"people": args.people, "dim": args.dim, "workers": args.workers}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "face-index")
+        for mode in ("local", "shared"):
+            report[mode] = run_mode(mode, path, args)
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+How quickly a new API worker comes up.
+
+Each run starts a fresh interpreter, so nothing is cached in-process:
+
+- cold import of ``app.main`` (what every worker pays before serving)
+- time from spawning uvicorn to the first successful ``GET /health``
+- the same with DATABASE_URL pointing at a closed port, to show startup does
+  not depend on the database being reachable
+- ``Base.metadata.create_all`` against the configured database, the cost the
+  import path used to pay before schema changes moved to ``python -m app.migrations``
+
+Requires a reachable DATABASE_URL for the create_all measurement.
+
+Usage:
+    python -m benchmarks.startup --runs 5
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import app.main; "
+    "print(time.perf_counter() - start)"
+)
+CREATE_ALL_SNIPPET = (
+    "import time; from app.core.database import Base, engine; import app.models; "
+    "start = time.perf_counter(); Base.metadata.create_all(bind=engine); "
+    "print(time.perf_counter() - start)"
+)
+UNREACHABLE_DATABASE_URL = "postgresql+psycopg://postgres@127.0.0.1:1/conversa"
+
+
+def summarize(seconds) -> dict:
+    ms = np.array(seconds) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(ms, 50)), 1),
+        "max_ms": round(float(ms.max()), 1),
+    }
+
+
+def run_snippet(snippet: str, env: dict) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", snippet], env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_response(env: dict, timeout: float) -> float:
+    port = free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f"Server did not answer /health within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds to wait for each server to answer")
+    parser.add_argument("--skip-create-all", action="store_true", help="Skip the step that needs a reachable database")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    offline_env = dict(env, DATABASE_URL=UNREACHABLE_DATABASE_URL)
+
+    report = {
+        "runs": args.runs,
+        "import_app_main": summarize([run_snippet(IMPORT_SNIPPET, env) for _ in range(args.runs)]),
+        "first_health_response": summarize([time_to_first_response(env, args.timeout) for _ in range(args.runs)]),
+        "first_health_response_db_unreachable": summarize(
+            [time_to_first_response(offline_env, args.timeout) for _ in range(args.runs)]
+        ),
+    }
+    if not args.skip_create_all:
+        report["create_all_for_comparison"] = summarize(
+            [run_snippet(CREATE_ALL_SNIPPET, env) for _ in range(args.runs)]
+        )
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Stored size and read latency of transcripts under each TOAST compression setting.
+
+Loads the same synthetic hour-long transcripts into scratch tables stored
+uncompressed (STORAGE EXTERNAL), with pglz (the Postgres default) and with lz4,
+then reports table size and timings for:
+
+- fetching one transcript by id (GET /conversations/{id}/transcript)
+- a 50-row page that loads transcripts (the old eager behaviour)
+- the same page without them (deferred)
+
+The synthetic text draws on a small vocabulary, so it compresses somewhat
+better than real speech; compare the modes with each other rather than reading
+the ratios as absolute.
+
+Requires a reachable DATABASE_URL. lz4 needs a server built with it (PostgreSQL 14+).
+
+Usage:
+    python -m benchmarks.transcripts --rows 2000 --turns 400
+"""
+
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.core.database import engine
+
+SPEAKERS = ["Me", "Sarah", "David", "Elena", "Marcus"]
+WORDS = (
+    "the we I you it that to and of a in is for on this have be with so what think just about "
+    "really know like would can yeah right do not but if there they going need should maybe "
+    "design launch roadmap onboarding users feedback customers team quarter budget hiring "
+    "prototype metrics churn pricing review deadline sprint release investors deck meeting "
+    "coffee weekend trip Kyoto project loft renovation architecture materials timeline "
+    "concern priority scope friction signup dashboard personalization tokens colors migration"
+).split()
+MODES = {
+    "uncompressed": "ALTER COLUMN full_transcript SET STORAGE EXTERNAL",
+    "pglz": "ALTER COLUMN full_transcript SET COMPRESSION pglz",
+    "lz4": "ALTER COLUMN full_transcript SET COMPRESSION lz4",
+}
+
+
+def make_transcript(rng: random.Random, turns: int) -> str:
+    return "\n\n".join(
+        f"{rng.choice(SPEAKERS)}: " + " ".join(rng.choices(WORDS, k=rng.randint(8, 40))).capitalize() + "."
+        for _ in range(turns)
+    )
+
+
+def timed(conn, sql: str, params_list, repeat: int) -> dict:
+    timings = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        conn.execute(text(sql), params_list[i % len(params_list)]).all()
+        timings.append(time.perf_counter() - start)
+    ms = np.array(timings) * 1000
+    return {"p50_ms": round(float(np.percentile(ms, 50)), 3), "p95_ms": round(float(np.percentile(ms, 95)), 3)}
+
+
+def run_mode(mode: str, transcripts, samples: int) -> dict:
+    table = f"bench_transcripts_{mode}"
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        conn.execute(text(f"CREATE TABLE {table} (id TEXT PRIMARY KEY, title TEXT, summary TEXT, full_transcript TEXT)"))
+        try:
+            with conn.begin_nested():
+                conn.execute(text(f"ALTER TABLE {table} {MODES[mode]}"))
+        except DBAPIError as exc:
+            conn.execute(text(f"DROP TABLE {table}"))
+            return {"error": str(exc.orig).splitlines()[0]}
+
+        start = time.perf_counter()
+        conn.execute(
+            text(f"INSERT INTO {table} VALUES (:id, :title, :summary, :full_transcript)"),
+            [
+                {"id": f"c{i:06d}", "title": f"Meeting {i}", "summary": "Discussed the roadmap.", "full_transcript": t}
+                for i, t in enumerate(transcripts)
+            ]
+        )
+        load_s = time.perf_counter() - start
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text(f"ANALYZE {table}"))
+            size = conn.execute(text(
+                f"SELECT pg_total_relation_size('{table}'), avg(pg_column_size(full_transcript)), "
+                f"avg(octet_length(full_transcript)) FROM {table}"
+            )).one()
+
+            ids = [{"id": f"c{i:06d}"} for i in random.Random(1).sample(range(len(transcripts)), min(samples, len(transcripts)))]
+            offsets = [{"offset": i} for i in random.Random(2).sample(range(max(len(transcripts) - 50, 1)), min(samples, max(len(transcripts) - 50, 1)))]
+            return {
+                "table_mb": round(size[0] / 1e6, 2),
+                "avg_raw_kb": round(float(size[2]) / 1e3, 1),
+                "avg_stored_kb": round(float(size[1]) / 1e3, 1),
+                "load_s": round(load_s, 2),
+                "transcript_by_id": timed(conn, f"SELECT full_transcript FROM {table} WHERE id = :id", ids, samples),
+                "page_with_transcripts": timed(
+                    conn, f"SELECT id, title, summary, full_transcript FROM {table} ORDER BY id LIMIT 50 OFFSET :offset", offsets, samples
+                ),
+                "page_deferred": timed(
+                    conn, f"SELECT id, title, summary FROM {table} ORDER BY id LIMIT 50 OFFSET :offset", offsets, samples
+                ),
+            }
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE {table}"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--turns", type=int, default=400, help="Speaker turns per transcript (~400 is an hour)")
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    transcripts = [make_transcript(rng, args.turns) for _ in range(args.rows)]
+
+    report = {"rows": args.rows, "turns": args.turns}
+    for mode in MODES:
+        report[mode] = run_mode(mode, transcripts, args.samples)
+    engine.dispose()
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
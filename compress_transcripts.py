@@ -0,0 +1,72 @@
+"""
+Switch stored transcripts to the TOAST compression method in TRANSCRIPT_COMPRESSION.
+
+Postgres applies a column's compression method only to values written after
+it is set, so this sets it and then, with --rewrite, rewrites existing
+transcripts in batches to recompress them. Rewriting updates each row, so
+their updated_at (and ETags) change once. Requires PostgreSQL 14+; lz4 also
+needs a server built with lz4 support.
+
+Usage:
+    TRANSCRIPT_COMPRESSION=lz4 python compress_transcripts.py --rewrite
+"""
+
+import argparse
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+
+BATCH_SIZE = 200
+
+
+def compress_transcripts(rewrite: bool):
+    """Set the transcript compression method and optionally recompress existing rows."""
+    if not settings.TRANSCRIPT_COMPRESSION:
+        print("✗ Set TRANSCRIPT_COMPRESSION to 'lz4' or 'pglz' first")
+        return
+
+    db = SessionLocal()
+
+    try:
+        db.execute(text(
+            f"ALTER TABLE conversations ALTER COLUMN full_transcript SET COMPRESSION {settings.TRANSCRIPT_COMPRESSION}"
+        ))
+        db.commit()
+        print(f"✓ New transcripts will be stored with {settings.TRANSCRIPT_COMPRESSION}")
+        if not rewrite:
+            return
+
+        rewritten = 0
+        last_id = ""
+        while True:
+            # Concatenating forces a fresh value, which is compressed with the new method
+            ids = db.execute(text(
+                "UPDATE conversations SET full_transcript = full_transcript || '' "
+                "WHERE id IN (SELECT id FROM conversations WHERE id > :last_id AND full_transcript IS NOT NULL "
+                "ORDER BY id LIMIT :limit) RETURNING id"
+            ), {"last_id": last_id, "limit": BATCH_SIZE}).scalars().all()
+            if not ids:
+                break
+
+            db.commit()
+            rewritten += len(ids)
+            last_id = max(ids)
+            print(f"  - Rewrote {rewritten} transcripts")
+
+        print(f"✓ Transcript compression complete ({rewritten} rows rewritten)")
+
+    except Exception as e:
+        db.rollback()
+        print(f"✗ Error compressing transcripts: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rewrite", action="store_true", help="Recompress transcripts that are already stored")
+    args = parser.parse_args()
+    compress_transcripts(args.rewrite)
@@ -0,0 +1,57 @@
+"""
+Bulk-import people or conversations from an NDJSON file.
+
+Each line is one JSON object in the same shape as the POST /api/v1/people or
+POST /api/v1/conversations request body, optionally with an "id" to keep
+existing identifiers. Import people before the conversations that refer to them.
+
+Usage:
+    python import_data.py people people.ndjson
+    python import_data.py conversations conversations.ndjson
+    cat people.ndjson | python import_data.py people -
+"""
+
+import argparse
+import asyncio
+import sys
+
+from app.core.database import AsyncSessionLocal, async_engine
+from app.services.bulk_import import import_conversations, import_people, iter_ndjson
+
+CHUNK_SIZE = 1 << 20
+IMPORTERS = {"people": import_people, "conversations": import_conversations}
+
+
+async def read_chunks(path: str):
+    stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        while chunk := stream.read(CHUNK_SIZE):
+            yield chunk
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+
+
+async def import_data(kind: str, path: str):
+    """Import one NDJSON file and print a summary with per-row errors."""
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await IMPORTERS[kind](db, iter_ndjson(read_chunks(path)))
+    finally:
+        await async_engine.dispose()
+
+    for error in result.errors:
+        print(f"  ✗ line {error.line}{f' ({error.id})' if error.id else ''}: {error.error}")
+    if result.failed > len(result.errors):
+        print(f"  ... {result.failed - len(result.errors)} more errors not shown")
+    print(f"✓ Imported {result.inserted} of {result.total} {kind} ({result.failed} failed)")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("kind", choices=sorted(IMPORTERS))
+    parser.add_argument("path", help="NDJSON file, or - for stdin")
+    args = parser.parse_args()
+    result = asyncio.run(import_data(args.kind, args.path))
+    sys.exit(1 if result.failed else 0)
@@ -1,7 +1,13 @@
 -- Conversa Database Schema
 -- PostgreSQL 15+
+--
+-- Full reset of a development database. Deployments should use the versioned
+-- migrations instead (python -m app.migrations), which produce the same schema
+-- and record what they applied in schema_migrations. Keep the two in sync.
 
 -- Drop existing tables if they exist (for clean setup)
+DROP TABLE IF EXISTS collection_versions CASCADE;
+DROP TABLE IF EXISTS transcript_segments CASCADE;
 DROP TABLE IF EXISTS action_items CASCADE;
 DROP TABLE IF EXISTS conversations CASCADE;
 DROP TABLE IF EXISTS people CASCADE;
@@ -30,20 +36,37 @@ CREATE TABLE people (
     interests TEXT[] DEFAULT '{}',
     open_follow_ups TEXT[] DEFAULT '{}',
     last_met VARCHAR(50),
+    last_met_at TIMESTAMP WITH TIME ZONE,
     met_count INTEGER DEFAULT 0,
+    conversation_count INTEGER NOT NULL DEFAULT 0,
+    pending_action_count INTEGER NOT NULL DEFAULT 0,
+    face_embedding TEXT[],
+    face_embedding_packed BYTEA,
+    face_embedding_dim INTEGER,
+    face_thumbnail BYTEA,
+    physical_description TEXT,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
 
     -- Constraints
     CONSTRAINT people_name_check CHECK (length(name) > 0),
     CONSTRAINT people_role_check CHECK (length(role) > 0),
-    CONSTRAINT people_met_count_check CHECK (met_count >= 0)
+    CONSTRAINT people_met_count_check CHECK (met_count >= 0),
+    CONSTRAINT people_conversation_count_check CHECK (conversation_count >= 0),
+    CONSTRAINT people_pending_action_count_check CHECK (pending_action_count >= 0),
+    CONSTRAINT people_face_embedding_packed_check CHECK (
+        face_embedding_packed IS NULL OR octet_length(face_embedding_packed) = 4 * face_embedding_dim
+    )
 );
 
 -- Create indexes for people table
 CREATE INDEX idx_people_name ON people(name);
 CREATE INDEX idx_people_last_met ON people(last_met);
 CREATE INDEX idx_people_met_count ON people(met_count DESC);
+CREATE INDEX idx_people_created_at_id ON people(created_at, id);
+CREATE INDEX idx_people_conversation_count_id ON people(conversation_count, id);
+CREATE INDEX idx_people_pending_action_count_id ON people(pending_action_count, id);
+CREATE INDEX idx_people_last_met_at_id ON people(last_met_at, id);
 
 -- Create trigger for people updated_at
 CREATE TRIGGER update_people_updated_at
@@ -60,10 +83,16 @@ CREATE TABLE conversations (
     participants TEXT[] DEFAULT '{}',
     title VARCHAR(500) NOT NULL,
     date VARCHAR(50) NOT NULL,
+    occurred_at TIMESTAMP WITH TIME ZONE,
     location VARCHAR(255) NOT NULL,
     summary TEXT NOT NULL,
     key_points TEXT[] DEFAULT '{}',
     full_transcript TEXT,
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(full_transcript, '')), 'C')
+    ) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
 
@@ -77,10 +106,13 @@ CREATE INDEX idx_conversations_person_id ON conversations(person_id);
 CREATE INDEX idx_conversations_date ON conversations(date);
 CREATE INDEX idx_conversations_title ON conversations(title);
 CREATE INDEX idx_conversations_created_at ON conversations(created_at DESC);
+CREATE INDEX idx_conversations_created_at_id ON conversations(created_at, id);
+CREATE INDEX idx_conversations_person_created_at_id ON conversations(person_id, created_at, id);
+CREATE INDEX idx_conversations_occurred_at_id ON conversations(occurred_at, id);
+CREATE INDEX idx_conversations_person_occurred_at_id ON conversations(person_id, occurred_at, id);
 
 -- Create full-text search index for searching conversations
-CREATE INDEX idx_conversations_search ON conversations
-USING gin(to_tsvector('english', title || ' ' || summary || ' ' || COALESCE(full_transcript, '')));
+CREATE INDEX idx_conversations_search ON conversations USING gin(search_vector);
 
 -- Create trigger for conversations updated_at
 CREATE TRIGGER update_conversations_updated_at
@@ -113,20 +145,45 @@ CREATE TRIGGER update_action_items_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- =====================================================
+-- Table: transcript_segments
+-- =====================================================
+-- Speaker turns of transcripts still being recorded; finalizing joins them into
+-- conversations.full_transcript and deletes them
+CREATE TABLE transcript_segments (
+    conversation_id VARCHAR(20) NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    speaker VARCHAR(255),
+    text TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (conversation_id, seq),
+    CONSTRAINT transcript_segments_seq_check CHECK (seq >= 0)
+);
+
+-- =====================================================
+-- Table: collection_versions
+-- =====================================================
+-- Advanced by every API write; list endpoints derive their ETags from it
+CREATE TABLE collection_versions (
+    name VARCHAR(50) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO collection_versions (name) VALUES ('people'), ('conversations');
+
 -- =====================================================
 -- Helpful Views (Optional)
 -- =====================================================
 
--- View: People with their conversation count
+-- View: People with their conversation count (maintained counters, no aggregation)
 CREATE OR REPLACE VIEW people_summary AS
 SELECT
     p.*,
-    COUNT(c.id) as total_conversations,
-    COUNT(CASE WHEN ai.completed = false THEN 1 END) as pending_actions
-FROM people p
-LEFT JOIN conversations c ON p.id = c.person_id
-LEFT JOIN action_items ai ON c.id = ai.conversation_id
-GROUP BY p.id;
+    p.conversation_count as total_conversations,
+    p.pending_action_count as pending_actions
+FROM people p;
 
 -- View: Recent conversations
 CREATE OR REPLACE VIEW recent_conversations AS
@@ -153,7 +210,7 @@ ORDER BY c.created_at DESC;
 DO $$
 BEGIN
     RAISE NOTICE 'Database schema created successfully!';
-    RAISE NOTICE 'Tables created: people, conversations, action_items';
+    RAISE NOTICE 'Tables created: people, conversations, action_items, transcript_segments, collection_versions';
     RAISE NOTICE 'Indexes created for optimal performance';
     RAISE NOTICE 'Triggers added for automatic timestamp updates';
     RAISE NOTICE 'Views created: people_summary, recent_conversations';
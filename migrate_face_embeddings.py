@@ -0,0 +1,82 @@
+"""
+Migrate face embeddings from float-string arrays to packed float32 storage.
+
+Converts every row that still only has the legacy face_embedding TEXT[]
+value, in batches, clearing the legacy value once it has been packed. Rows
+holding a value that is not a number are left as they are and listed, as the
+API now rejects such values. The packed columns come from migration 0002, so
+run `python -m app.migrations` first; safe to run repeatedly.
+"""
+
+import sys
+
+from app.core.database import SessionLocal
+from app.migrations import status
+from app.models import Person
+from app.services.embeddings import pack_embedding
+
+BATCH_SIZE = 500
+PACKED_EMBEDDINGS_MIGRATION = 2
+
+
+def packed_columns_migrated() -> bool:
+    """Whether the migration adding the packed columns has been applied."""
+    return any(
+        migration.version == PACKED_EMBEDDINGS_MIGRATION and applied_at is not None
+        for migration, applied_at in status()
+    )
+
+
+def migrate_face_embeddings():
+    """Pack every legacy face embedding into the float32 columns."""
+    db = SessionLocal()
+
+    try:
+        converted = 0
+        invalid = []
+        last_id = ""
+        while True:
+            batch = (
+                db.query(Person)
+                .filter(
+                    Person.id > last_id,
+                    Person.face_embedding.isnot(None),
+                    Person.face_embedding_packed.is_(None)
+                )
+                .order_by(Person.id)
+                .limit(BATCH_SIZE)
+                .all()
+            )
+            if not batch:
+                break
+
+            for person in batch:
+                if person.face_embedding:
+                    try:
+                        person.face_embedding_packed, person.face_embedding_dim = pack_embedding(person.face_embedding)
+                    except ValueError:
+                        invalid.append(person.id)
+                        continue
+                person.face_embedding = None
+                converted += 1
+
+            db.commit()
+            last_id = batch[-1].id
+            print(f"  - Converted {converted} embeddings")
+
+        for person_id in invalid[:20]:
+            print(f"  - Skipped {person_id}: face_embedding holds a value that is not a number")
+        print(f"✓ Face embedding migration complete ({converted} rows converted, {len(invalid)} skipped)")
+
+    except Exception as e:
+        db.rollback()
+        print(f"✗ Error migrating face embeddings: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    if not packed_columns_migrated():
+        sys.exit("✗ The packed embedding columns are missing; run `python -m app.migrations` first")
+    migrate_face_embeddings()
@@ -0,0 +1,40 @@
+"""
+Recompute every person's conversation_count and pending_action_count.
+
+The API keeps these counters exact, but writes made outside it (manual SQL,
+restored backups) can leave them off. This recounts from the conversations and
+action_items tables in one statement, updating only the people whose counters
+are wrong. Safe to run repeatedly and while the API is serving.
+"""
+
+from app.core.database import SessionLocal
+from app.services.counters import recount_statement
+from app.services.etags import PEOPLE, bump_statement
+
+
+def repair_counters():
+    """Recount and fix every person's counters."""
+    db = SessionLocal()
+
+    try:
+        fixed = db.execute(recount_statement()).scalars().all()
+        if fixed:
+            db.execute(bump_statement(PEOPLE))
+        db.commit()
+
+        for person_id in fixed[:20]:
+            print(f"  - Fixed counters for {person_id}")
+        if len(fixed) > 20:
+            print(f"  - ... and {len(fixed) - 20} more")
+        print(f"✓ Counter repair complete ({len(fixed)} people corrected)")
+
+    except Exception as e:
+        db.rollback()
+        print(f"✗ Error repairing counters: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    repair_counters()
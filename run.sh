@@ -10,4 +10,13 @@ echo "Swagger UI: http://localhost:8000/docs"
 echo "ReDoc: http://localhost:8000/redoc"
 echo ""
 
-uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+# The app no longer creates tables on import; bring the schema up to date first
+python -m app.migrations || exit 1
+
+if [ -n "$WEB_CONCURRENCY" ] && [ "$WEB_CONCURRENCY" -gt 1 ]; then
+    # Several workers share one memory-mapped face index instead of each loading a copy
+    export FACE_INDEX_BACKEND="${FACE_INDEX_BACKEND:-shared}"
+    uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers "$WEB_CONCURRENCY"
+else
+    uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+fi
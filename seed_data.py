@@ -3,14 +3,17 @@ Seed script to populate the database with sample data matching the frontend mock
 Run this after setting up the database to get started with demo data.
 """
 
-from app.core.database import SessionLocal, engine, Base
+from app.core.database import SessionLocal
+from app.core.dates import parse_display_date
+from app.migrations import upgrade
 from app.models import Person, Conversation, ActionItem
+from app.services.counters import last_met_at_statement, recount_statement
 
 
 def seed_database():
     """Seed the database with sample data."""
-    # Create tables
-    Base.metadata.create_all(bind=engine)
+    # Bring the schema up to date
+    upgrade()
 
     db = SessionLocal()
 
@@ -141,6 +144,7 @@ def seed_database():
         ]
 
         for conversation in conversations:
+            conversation.occurred_at = parse_display_date(conversation.date)
             db.add(conversation)
 
         db.flush()
@@ -157,6 +161,11 @@ def seed_database():
         for action_item in action_items:
             db.add(action_item)
 
+        # Fill in the per-person columns the API maintains on its write paths
+        db.flush()
+        db.execute(recount_statement())
+        db.execute(last_met_at_statement())
+
         db.commit()
         print("✓ Database seeded successfully with sample data!")
         print(f"  - Created {len(people)} people")
@@ -0,0 +1,47 @@
+"""
+Fixtures for tests that run against the database in DATABASE_URL.
+
+The schema must already be applied (``python -m app.migrations``). Tests that
+need the database are skipped when it cannot be reached. Rows they create use
+ids starting with ``t`` and are deleted afterwards.
+"""
+
+import httpx
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.database import AsyncSessionLocal, async_engine, engine
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def database():
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except OperationalError as exc:
+        pytest.skip(f"database unreachable: {exc.orig}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db(database):
+    async with AsyncSessionLocal() as session:
+        yield session
+    # Each test runs in its own event loop, so its connections cannot be reused by the next
+    await async_engine.dispose()
+
+
+@pytest.fixture
+async def client(database):
+    """The app over an in-process ASGI client (no lifespan: the face index is not loaded)."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    await async_engine.dispose()
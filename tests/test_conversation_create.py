@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+
+PERSON_ID = "tcreate0"
+CREATES = 40
+ITEMS = 3
+
+
+@pytest.fixture
+def person(database):
+    with database.begin() as conn:
+        conn.execute(text("DELETE FROM people WHERE id = :id"), {"id": PERSON_ID})
+        conn.execute(text(
+            "INSERT INTO people (id, name, role, avatar_color, context, met_count) "
+            "VALUES (:id, 'Create Test', 'Test', 'bg-indigo-200', 'Conversation create test', 0)"
+        ), {"id": PERSON_ID})
+    yield PERSON_ID
+    # Conversations and their action items go by cascade
+    with database.begin() as conn:
+        conn.execute(text("DELETE FROM people WHERE id = :id"), {"id": PERSON_ID})
+
+
+async def create(client, person_id: str, number: int):
+    response = await client.post(f"{settings.API_V1_PREFIX}/conversations/?include_transcript=false", json={
+        "person_id": person_id,
+        "title": f"Concurrent create {number}",
+        "date": "Jan 16 • 2:30 PM",
+        "location": "Zoom",
+        "summary": "Written by the concurrent create test.",
+        "action_items": [{"text": f"Item {i}", "completed": i == 0} for i in range(ITEMS)],
+    })
+    assert response.status_code == 201, response.text
+
+
+@pytest.mark.anyio
+async def test_concurrent_creates_keep_counters_exact(client, database, person):
+    await asyncio.gather(*(create(client, person, n) for n in range(CREATES)))
+
+    with database.connect() as conn:
+        counters = conn.execute(text(
+            "SELECT met_count, conversation_count, pending_action_count FROM people WHERE id = :id"
+        ), {"id": person}).one()
+        written = conn.execute(text(
+            "SELECT count(DISTINCT c.id) AS conversations, "
+            "count(a.id) FILTER (WHERE a.completed IS NOT TRUE) AS pending "
+            "FROM conversations c LEFT JOIN action_items a ON a.conversation_id = c.id "
+            "WHERE c.person_id = :id"
+        ), {"id": person}).one()
+
+    assert written.conversations == CREATES
+    assert written.pending == CREATES * (ITEMS - 1)
+    assert counters.met_count == written.conversations
+    assert counters.conversation_count == written.conversations
+    assert counters.pending_action_count == written.pending
+
+
+@pytest.mark.anyio
+async def test_create_for_unknown_person_is_404_and_writes_nothing(client, database):
+    response = await client.post(f"{settings.API_V1_PREFIX}/conversations/", json={
+        "person_id": "tmissing0",
+        "title": "Nobody",
+        "date": "Jan 16 • 2:30 PM",
+        "location": "Zoom",
+        "summary": "No such person.",
+    })
+
+    assert response.status_code == 404
+    with database.connect() as conn:
+        assert not conn.scalar(text("SELECT count(*) FROM conversations WHERE person_id = 'tmissing0'"))
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+from sqlalchemy import text
+from starlette.requests import Request
+
+from app.core import track_queries
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.routers.conversations import get_conversations
+
+PERSON_ID = "tlist0"
+CONVERSATIONS = 25
+
+
+@pytest.fixture
+def person(database):
+    with database.begin() as conn:
+        conn.execute(text("DELETE FROM people WHERE id = :id"), {"id": PERSON_ID})
+        conn.execute(text(
+            "INSERT INTO people (id, name, role, avatar_color, context, met_count) "
+            "VALUES (:id, 'List Test', 'Test', 'bg-indigo-200', 'Conversation list test', 0)"
+        ), {"id": PERSON_ID})
+        for n in range(CONVERSATIONS):
+            conn.execute(text(
+                "INSERT INTO conversations (id, person_id, participants, title, date, location, summary, created_at) "
+                "VALUES (:id, :person_id, ARRAY[:participant], 'List test', 'Jan 16 • 2:30 PM', 'Zoom', 'Summary', "
+                "now() - make_interval(mins => :n))"
+            ), {"id": f"tlc{n}", "person_id": PERSON_ID, "participant": PERSON_ID, "n": n})
+            for i in range(3):
+                conn.execute(text(
+                    "INSERT INTO action_items (id, conversation_id, text, completed) VALUES (:id, :conversation_id, 'Item', :completed)"
+                ), {"id": f"tla{n}-{i}", "conversation_id": f"tlc{n}", "completed": i == 0})
+    yield PERSON_ID
+    # Conversations and their action items go by cascade
+    with database.begin() as conn:
+        conn.execute(text("DELETE FROM people WHERE id = :id"), {"id": PERSON_ID})
+
+
+def list_request(**params) -> Request:
+    query = "&".join(f"{key}={value}" for key, value in params.items())
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": query.encode()})
+
+
+async def list_page(db, person_id, limit, cursor=None):
+    with track_queries() as stats:
+        response = await get_conversations(
+            list_request(person_id=person_id, limit=limit),
+            skip=0, limit=limit, person_id=person_id, cursor=cursor, db=db
+        )
+    return response, stats.count
+
+
+@pytest.mark.anyio
+async def test_statement_count_does_not_grow_with_page_size(db, person):
+    counts = {}
+    for limit in (1, 5, 20):
+        response, counts[limit] = await list_page(db, person, limit)
+        assert len(response.body) > 0
+        assert response.body.count(b'"active_action_items_count":2') == limit
+
+    assert len(set(counts.values())) == 1, counts
+
+
+@pytest.mark.anyio
+async def test_cursor_pages_cover_every_conversation_once(db, person):
+    seen = []
+    cursor = None
+    while True:
+        response, _ = await list_page(db, person, 10, cursor)
+        seen.extend(item["id"] for item in json.loads(response.body))
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+
+    assert seen == [f"tlc{n}" for n in range(CONVERSATIONS)]
@@ -0,0 +1,61 @@
+import logging
+
+import pytest
+from sqlalchemy import text
+
+from app.core import QueryBudgetExceeded, track_queries
+from app.core.config import settings
+
+PEOPLE_URL = f"{settings.API_V1_PREFIX}/people/?limit=5"
+
+
+@pytest.fixture
+def budget(monkeypatch):
+    """Set QUERY_BUDGET and QUERY_BUDGET_STRICT for the requests of one test."""
+    def set_budget(queries: int, strict: bool):
+        monkeypatch.setattr(settings, "QUERY_BUDGET", queries)
+        monkeypatch.setattr(settings, "QUERY_BUDGET_STRICT", strict)
+    return set_budget
+
+
+def test_strict_block_raises_on_the_statement_over_budget(database):
+    with pytest.raises(QueryBudgetExceeded, match="budget of 2"):
+        with track_queries(budget=2, strict=True) as stats:
+            with database.connect() as conn:
+                for _ in range(3):
+                    conn.execute(text("SELECT 1"))
+    # The statement over budget is refused before it runs
+    assert stats.count == 2
+
+
+@pytest.mark.anyio
+async def test_strict_request_over_budget_fails(client, budget):
+    # A people page is an ETag version read plus the list query
+    budget(1, strict=True)
+
+    with pytest.raises(QueryBudgetExceeded):
+        await client.get(PEOPLE_URL)
+
+
+@pytest.mark.anyio
+async def test_request_over_budget_is_logged_when_not_strict(client, budget, monkeypatch, caplog):
+    budget(1, strict=False)
+    monkeypatch.setattr(settings, "DEBUG", True)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+        response = await client.get(PEOPLE_URL)
+
+    assert response.status_code == 200
+    assert 'desc="2 queries"' in response.headers["server-timing"]
+    assert any("issued 2 queries (budget 1" in record.getMessage() for record in caplog.records)
+
+
+@pytest.mark.anyio
+async def test_request_within_budget_is_not_logged(client, budget, caplog):
+    budget(2, strict=True)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+        response = await client.get(PEOPLE_URL)
+
+    assert response.status_code == 200
+    assert not [record for record in caplog.records if "issued" in record.getMessage()]